@@ -0,0 +1 @@
+"""shared utilities for the AOC 2022 solutions"""
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+anytime execution of the branch and bound solvers
+a search expands its nodes through a Budget, which raises Expired once the deadline has passed, the best value found
+until then is reported together with whether it is proven optimal and the search statistics
+"""
+
+
+from __future__ import annotations
+
+import time
+from collections import namedtuple
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# fraction of the deadline a worker gets on top before it is killed, see hard_timeout
+GRACE = 0.5
+
+
+class Expired(Exception):
+    """raised inside a search once its budget is used up"""
+
+
+Result = namedtuple("Result", ("value", "proven", "expanded", "pruned", "elapsed"))
+
+
+class Budget:
+    """deadline and statistics of a single search
+    :param seconds: time until the search is interrupted, None searches until it is done
+    :param check_every: number of expanded nodes between two clock reads
+    """
+
+    def __init__(self, seconds: float = None, check_every: int = 256) -> None:
+        self.start = time.perf_counter()
+        self.end = None if seconds is None else self.start + seconds
+        self.check_every = check_every
+        self.expanded = 0
+        self.pruned = 0
+        self.best = None
+        self.expired = False
+
+    def expand(self) -> None:
+        self.expanded += 1
+        if self.expanded % self.check_every == 0:
+            self.check()
+
+    def check(self) -> None:
+        """read the clock now, for loops between searches that expand no nodes themselves"""
+        if self.end is not None and time.perf_counter() > self.end:
+            self.expired = True
+            raise Expired
+
+    def prune(self) -> None:
+        self.pruned += 1
+
+    def improve(self, value: int) -> None:
+        if self.best is None or value > self.best:
+            self.best = value
+
+    def result(self, value: int = None) -> Result:
+        return Result(self.best if value is None else value, not self.expired, self.expanded, self.pruned,
+                      time.perf_counter() - self.start)
+
+
+def anytime(func: Callable, *args, seconds: float = None) -> Result:
+    """run a search that takes a budget keyword and fall back to its best value if the deadline passes"""
+    budget = Budget(seconds)
+    try:
+        value = func(*args, budget=budget)
+    except Expired:
+        value = budget.best
+    return budget.result(value)
+
+
+def hard_timeout(seconds: float | None) -> float | None:
+    """timeout after which a worker that did not stop at its deadline is killed"""
+    return None if seconds is None else seconds * (1 + GRACE) + 1
+
+
+def combine(results: list[Result], value: int) -> Result:
+    """result of several searches run in parallel, e.g. one per blueprint"""
+    return Result(value, all(r.proven for r in results), sum(r.expanded for r in results),
+                  sum(r.pruned for r in results), max((r.elapsed for r in results), default=0.0))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+solve one day over many inputs
+inputs are either the files of a directory or the lines of a jsonl archive, each line being {"id": ..., "input": ...}
+or a plain json string, they are streamed through a process pool in chunks and every part of every input is written
+as one json line with its timing or failure
+usage: python -m aoc.batch 12 inputs/ [--parts a b] [--args '{"reps": 20}'] [--out results.jsonl] [--chunksize 16]
+       [--unordered]
+"""
+
+
+import argparse
+import inspect
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from itertools import islice
+from typing import Iterable
+from typing import Iterator
+
+from aoc import days
+from aoc.lazy import preload
+from aoc.runner import run_task
+
+
+def read_inputs(source: str) -> Iterator[tuple[str, str | Exception]]:
+    """(id, data) pairs from a directory or a jsonl archive, read lazily
+    NOTE: entries that cannot be read come with the error instead of their data, so only they fail and not the batch
+    """
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            path = os.path.join(source, name)
+            if os.path.isfile(path):
+                with open(path) as f:
+                    try:
+                        yield name, f.read().rstrip("\n")
+                    except UnicodeDecodeError as e:
+                        yield name, e
+        return
+    with open(source) as f:
+        for i, line in enumerate(f):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield str(i), ValueError(f"invalid json: {e}")
+                continue
+            if isinstance(entry, str):
+                yield str(i), entry
+            elif isinstance(entry, dict) and isinstance(entry.get("input"), str):
+                yield str(entry.get("id", i)), entry["input"]
+            else:
+                name = str(entry.get("id", i)) if isinstance(entry, dict) else str(i)
+                yield name, ValueError('entry is neither a json string nor an object with an "input" string')
+
+
+def _warm_up(day: int) -> None:
+    preload(days.load(day))
+
+
+def rejected(task: days.Task, error: Exception) -> dict:
+    """report of an input that could not be read, in the format of run_task"""
+    return {"day": task.day, "part": task.part, "result": None, "wall": None, "cpu": None,
+            "error": f"{type(error).__name__}: {error}", "cached": False}
+
+
+def solve_chunk(tasks: list[days.Task], chunk: list[tuple[str, str | Exception]]) -> list[dict]:
+    reports = []
+    for name, data in chunk:
+        for task in tasks:
+            report = rejected(task, data) if isinstance(data, Exception) else run_task(task, data)
+            report["id"] = name
+            reports.append(report)
+    return reports
+
+
+def solve_batch(day: int, inputs: Iterable[tuple[str, str | Exception]], parts: tuple = None, args: dict = None,
+                workers: int = None, chunksize: int = 16, window: int = None, ordered: bool = True) -> Iterator[dict]:
+    """reports per input and part
+    :param args: extra solver arguments, each part only gets the ones its entry point accepts
+    :param window: number of chunks in flight, bounds the inputs held in memory, defaults to twice the workers
+    :param ordered: yield the reports in input order, otherwise as soon as a chunk is done
+    """
+    tasks = []
+    for task in days.tasks(day):
+        if parts is None or task.part in parts:
+            accepted = inspect.signature(getattr(days.load(day), task.func)).parameters
+            tasks.append(task._replace(kwargs=task.kwargs | {k: v for k, v in (args or {}).items() if k in accepted}))
+    workers = workers or os.cpu_count()
+    window = window or 2 * workers
+    inputs = iter(inputs)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_up, initargs=(day,)) as pool:
+        pending = deque()
+        while True:
+            while len(pending) < window and (chunk := list(islice(inputs, chunksize))):
+                pending.append(pool.submit(solve_chunk, tasks, chunk))
+            if not pending:
+                return
+            if ordered:
+                yield from pending.popleft().result()
+                continue
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                yield from future.result()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="solve one day over a directory or jsonl archive of inputs")
+    parser.add_argument("day", type=int)
+    parser.add_argument("source", help="directory with one input per file or jsonl archive")
+    parser.add_argument("--parts", nargs="+", default=None, help="parts to solve, defaults to all")
+    parser.add_argument("--args", type=json.loads, default=None, help="json object of extra solver arguments")
+    parser.add_argument("--out", default=None, help="jsonl file for the results, defaults to stdout")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=16, help="inputs per task sent to a worker")
+    parser.add_argument("--window", type=int, default=None, help="chunks in flight")
+    parser.add_argument("--unordered", action="store_true", help="write results as they finish")
+    args = parser.parse_args()
+    wall, count, failures = time.perf_counter(), 0, 0
+    out = sys.stdout if args.out is None else open(args.out, "w")
+    try:
+        reports = solve_batch(args.day, read_inputs(args.source), args.parts, args.args, args.workers,
+                              args.chunksize, args.window, not args.unordered)
+        for report in reports:
+            count += 1
+            failures += report["error"] is not None
+            out.write(json.dumps(report, default=str) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    wall = time.perf_counter() - wall
+    print(f"{count} results, {failures} failures in {wall:.3f} s ({count / wall:.1f} per s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
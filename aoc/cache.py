@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+persistent answer cache
+answers are stored in sqlite keyed by day, part, input hash, solver source hash and extra arguments, so a change of
+either the input or the code invalidates an entry, the least recently used entries are evicted beyond max_entries and
+answers larger than max_result_bytes are not stored, so the cache holds at most their product
+usage: python -m aoc.cache [--clear]
+"""
+
+
+import argparse
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sqlite3
+import time
+from types import ModuleType
+
+from aoc import days
+from aoc.inputs import ROOT
+from aoc.lazy import dependencies
+
+DEFAULT_PATH = os.path.join(ROOT, ".cache", "answers.sqlite")
+MISSING = object()
+
+
+def source_hash(module: ModuleType) -> str:
+    """hash of a day module's source and of the shared aoc modules it uses, directly or via other aoc modules"""
+    files = {inspect.getsourcefile(m) for m in dependencies(module)}
+    digest = hashlib.sha256()
+    for f in sorted(files):
+        with open(f, "rb") as src:
+            digest.update(src.read())
+    return digest.hexdigest()
+
+
+@functools.cache
+def day_source_hash(day: int) -> str:
+    """source hash of a day, computed once per process
+    NOTE: edits made while a process runs only invalidate the answers of processes started afterwards
+    """
+    return source_hash(days.load(day))
+
+
+class AnswerCache:
+    """
+    :param max_entries: number of answers kept, the least recently used are evicted beyond it
+    :param max_result_bytes: size of the largest pickled answer that is stored, larger answers are recomputed every run
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, max_entries: int = 10000, max_result_bytes: int = 2 ** 20) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.max_entries = max_entries
+        self.max_result_bytes = max_result_bytes
+        self.db = sqlite3.connect(path, timeout=30)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS answers "
+            "(key TEXT PRIMARY KEY, day INTEGER, part TEXT, result BLOB, last_used REAL)"
+        )
+
+    @staticmethod
+    def key(task: days.Task, data: str | bytes) -> str:
+        raw = data.encode() if isinstance(data, str) else data
+        parts = [task.day, task.part, task.func, hashlib.sha256(raw).hexdigest(), day_source_hash(task.day),
+                 sorted(task.kwargs.items())]
+        return hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()
+
+    def get(self, key: str):
+        """cached answer or MISSING"""
+        row = self.db.execute("SELECT result FROM answers WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return MISSING
+        with self.db:
+            self.db.execute("UPDATE answers SET last_used = ? WHERE key = ?", (time.time(), key))
+        return pickle.loads(row[0])
+
+    def put(self, key: str, task: days.Task, result) -> None:
+        if len(blob := pickle.dumps(result)) > self.max_result_bytes:
+            return
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?)",
+                            (key, task.day, task.part, blob, time.time()))
+            self.db.execute("DELETE FROM answers WHERE key NOT IN "
+                            "(SELECT key FROM answers ORDER BY last_used DESC LIMIT ?)", (self.max_entries,))
+
+    def clear(self) -> None:
+        with self.db:
+            self.db.execute("DELETE FROM answers")
+
+    def __len__(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="inspect or clear the answer cache")
+    parser.add_argument("--clear", action="store_true")
+    args = parser.parse_args()
+    cache = AnswerCache()
+    if args.clear:
+        cache.clear()
+    print(f"{len(cache)} cached answers in {DEFAULT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+sets of integer points packed into single int64 keys
+each coordinate is offset into an unsigned bit field, 31 bits per coordinate for 2-d points and 21 bits for 3-d
+points, so a point costs one int instead of a tuple of ints and shifting a point by a fixed vector is a single addition
+to its key, which also works on whole arrays of keys
+"""
+
+
+from __future__ import annotations
+
+from aoc.lazy import lazy_import
+
+# annotations only, typing and collections.abc would add to the import time of every day, cp aoc.startup
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+
+np = lazy_import("numpy")
+
+# bits per coordinate by number of dimensions
+BITS = {2: 31, 3: 21}
+
+
+def pack(*coords: int) -> int:
+    """key of a 2-d or 3-d point, coordinates range from -2**(bits-1) to 2**(bits-1) - 1"""
+    bits = BITS[len(coords)]
+    bias = 1 << bits - 1
+    key = 0
+    for c in coords:
+        key = key << bits | c + bias
+    return key
+
+
+def unpack(key: int, dims: int = 2) -> tuple[int, ...]:
+    bits = BITS[dims]
+    bias, mask = 1 << bits - 1, (1 << bits) - 1
+    return tuple((key >> bits * (dims - 1 - d) & mask) - bias for d in range(dims))
+
+
+def delta(*shift: int) -> int:
+    """difference between the keys of a point and the point shifted by the given vector"""
+    bits = BITS[len(shift)]
+    return sum(s << bits * (len(shift) - 1 - d) for d, s in enumerate(shift))
+
+
+def pack_array(points: np.ndarray) -> np.ndarray:
+    """keys of an (n, 2) or (n, 3) array of points"""
+    points = np.asarray(points, dtype=np.int64)
+    dims = points.shape[1]
+    bits = BITS[dims]
+    keys = np.zeros(len(points), dtype=np.int64)
+    for d in range(dims):
+        keys = keys << bits | points[:, d] + (1 << bits - 1)
+    return keys
+
+
+def unpack_array(keys: np.ndarray, dims: int = 2) -> np.ndarray:
+    bits = BITS[dims]
+    shifts = np.array([bits * (dims - 1 - d) for d in range(dims)], dtype=np.int64)
+    return (np.asarray(keys, dtype=np.int64)[:, None] >> shifts & (1 << bits) - 1) - (1 << bits - 1)
+
+
+def contains(keys: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    """membership of many keys at once
+    :param keys: sorted array of keys
+    :param queries: array of keys to look up
+    """
+    found = np.searchsorted(keys, queries)
+    found[found == len(keys)] = 0
+    return keys[found] == queries if len(keys) else np.zeros(len(queries), dtype=bool)
+
+
+class CoordSet:
+    """points as packed keys in a hash set, for simulations that add and remove single points
+    :param points: initial points
+    :param dims: number of coordinates per point
+    """
+
+    def __init__(self, points: Iterable[Sequence[int]] = (), dims: int = 2) -> None:
+        self.dims = dims
+        self.keys: set[int] = {pack(*p) for p in points}
+
+    def __contains__(self, point: Sequence[int]) -> bool:
+        return pack(*point) in self.keys
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[tuple[int, ...]]:
+        return (unpack(k, self.dims) for k in self.keys)
+
+    def add(self, point: Sequence[int]) -> None:
+        self.keys.add(pack(*point))
+
+    def discard(self, point: Sequence[int]) -> None:
+        self.keys.discard(pack(*point))
+
+    def update(self, points: np.ndarray) -> None:
+        self.keys.update(pack_array(points).tolist())
+
+    def array(self) -> np.ndarray:
+        """sorted keys for bulk queries"""
+        return np.sort(np.fromiter(self.keys, dtype=np.int64, count=len(self.keys)))
+
+    def contains(self, points: np.ndarray) -> np.ndarray:
+        return contains(self.array(), pack_array(points))
+
+    def shifted(self, *shift: int) -> CoordSet:
+        moved = CoordSet(dims=self.dims)
+        offset = delta(*shift)
+        moved.keys = {k + offset for k in self.keys}
+        return moved
+
+
+class DenseSet:
+    """
+    points of a strip of fixed width that grows in y, one byte per cell, e.g. the tower of day 17
+    :param width: number of x coordinates, starting at 0
+    """
+
+    def __init__(self, width: int, points: Iterable[Sequence[int]] = ()) -> None:
+        self.width = width
+        self.cells = bytearray()
+        self.count = 0
+        for p in points:
+            self.add(p)
+
+    def __contains__(self, point: Sequence[int]) -> bool:
+        x, y = point
+        i = y * self.width + x
+        return 0 <= x < self.width and 0 <= i < len(self.cells) and self.cells[i] == 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return (divmod(i, self.width)[::-1] for i, c in enumerate(self.cells) if c)
+
+    def add(self, point: Sequence[int]) -> None:
+        x, y = point
+        i = y * self.width + x
+        if i >= len(self.cells):
+            # whole rows are added in bulk to keep the number of reallocations logarithmic in the height
+            size = -(-max(i + 1, 2 * len(self.cells)) // self.width) * self.width
+            self.cells.extend(bytes(size - len(self.cells)))
+        if not self.cells[i]:
+            self.cells[i] = 1
+            self.count += 1
+
+    def array(self) -> np.ndarray:
+        """cells as a (height, width) array of 0 and 1, row y holds the points with that y"""
+        cells = np.frombuffer(self.cells, dtype=np.uint8)
+        return cells[:len(cells) // self.width * self.width].reshape(-1, self.width)
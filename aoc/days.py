@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""discovery of the daily solutions and their entry points"""
+
+
+import importlib
+from types import ModuleType
+from typing import NamedTuple
+
+DAYS = tuple(range(1, 26))
+HEAVY_DAYS = (15, 16, 17, 19, 20)
+
+# entry points that need arguments beyond the input data
+ENTRY_POINTS = {
+    6: (("a", "both", {"ln": 4}), ("b", "both", {"ln": 14})),
+    15: (("a", "part_a", {"row_of_interest": 2000000}), ("b", "part_b", {"square": 4000000})),
+    22: (("a", "part_a", {}), ("b", "part_b", {"testcase": False})),
+}
+
+
+class Task(NamedTuple):
+    day: int
+    part: str
+    func: str
+    kwargs: dict
+
+
+def module_name(day: int) -> str:
+    return f"day_{day:02d}.day_{day:02d}"
+
+
+def load(day: int) -> ModuleType:
+    return importlib.import_module(module_name(day))
+
+
+def tasks(day: int) -> list[Task]:
+    """find the entry points of a day, i.e. part_a/part_b or both"""
+    if day in ENTRY_POINTS:
+        return [Task(day, part, func, kwargs) for part, func, kwargs in ENTRY_POINTS[day]]
+    module = load(day)
+    found = [Task(day, part, func, {}) for part, func in (("a", "part_a"), ("b", "part_b")) if hasattr(module, func)]
+    if not found and hasattr(module, "both"):
+        found.append(Task(day, "ab", "both", {}))
+    return found
+
+
+def solve(day: int, data: str, **kwargs) -> tuple:
+    """both answers of a day from a single parse, kwargs are passed to the day's solve function"""
+    module = load(day)
+    return module.solve(module.prepare(data), **kwargs)
+
+
+def schedule(days: tuple = DAYS) -> list[Task]:
+    """all tasks for the given days with the heavy ones first"""
+    ordered = [d for d in days if d in HEAVY_DAYS] + [d for d in days if d not in HEAVY_DAYS]
+    return [t for d in ordered for t in tasks(d)]
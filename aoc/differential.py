@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+differential testing of candidate engines against the reference solutions
+the frozen first solutions in aoc.reference are the oracle, every candidate engine (the current part functions, the
+shared model and the engines below) solves the same generated inputs, answers have to match and the speedup over the
+reference is reported per input size
+usage: python -m aoc.differential [days ...] [--factors 1 2 4] [--seeds 3] [--json]
+"""
+
+
+import argparse
+import inspect
+import json
+import sys
+import tempfile
+import time
+from contextlib import chdir
+from contextlib import redirect_stdout
+from io import StringIO
+from types import ModuleType
+from typing import Callable
+
+from aoc import days
+from aoc import reference as frozen
+from aoc.generators import generate
+from aoc.generators import solver_args
+from aoc.lazy import preload
+from aoc.scaling import BASE_SIZES
+from aoc.scaling import SKIP
+
+# candidate engines per day besides solve(prepare(data)), mapping a name to a function of the day module that takes
+# the input data and returns the answers of all parts as a tuple
+ENGINES = {
+    1: {"numpy": "calories_numpy"},
+    5: {"trace": "top_crates_traced"},
+}
+# solve computes every part, so days with skipped parts solve the others from the shared model with these functions
+JOINT_PARTS = {
+    22: ("password", None),
+}
+
+
+def call(func: Callable, data: str, args: dict):
+    """call a solver with the arguments it accepts, parameters like reps_a also take the value of reps"""
+    accepted = inspect.signature(func).parameters
+    kwargs = {k: v for k, v in args.items() if k in accepted}
+    for name in accepted:
+        if name[-2:] in ("_a", "_b") and name[:-2] in args:
+            kwargs[name] = args[name[:-2]]
+    with redirect_stdout(StringIO()) as out:
+        result = func(data, **kwargs)
+    # solutions that print their answer are compared by their output
+    return out.getvalue().rstrip() if result is None else result
+
+
+def reference(day: int, data: str, size: int) -> tuple:
+    """answers of all parts from the frozen first solution, None for the skipped ones"""
+    return parts(frozen.load(day), day, data, solver_args(day, size))
+
+
+def parts(module: ModuleType, day: int, data: str, args: dict) -> tuple:
+    """answers of all parts from the part functions of a module, None for the skipped ones"""
+    answers = []
+    for task in days.tasks(day):
+        if (day, task.part) in SKIP:
+            answers.append(None)
+            continue
+        result = call(getattr(module, task.func), data, task.kwargs | args)
+        answers.extend(result if task.part == "ab" else [result])
+    return tuple(answers)
+
+
+def kept(day: int) -> list[int]:
+    """positions of the answers that generated inputs can check"""
+    parts = [p for t in days.tasks(day) for p in (("a", "b") if t.part == "ab" else (t.part,))]
+    return [i for i, p in enumerate(parts) if (day, p) not in SKIP]
+
+
+def engines(day: int) -> dict[str, Callable]:
+    module = days.load(day)
+
+    def _parts(data: str, **kwargs) -> tuple:
+        return parts(module, day, data, kwargs)
+
+    def _joint(data: str, **kwargs) -> tuple:
+        if day in JOINT_PARTS:
+            model = module.prepare(data)
+            return tuple(None if func is None else getattr(module, func)(model) for func in JOINT_PARTS[day])
+        return module.solve(module.prepare(data), **kwargs)
+
+    # the part functions take different arguments, _parts accepts all of them by keyword
+    accepted = {n: p for t in days.tasks(day) for n, p in inspect.signature(getattr(module, t.func)).parameters.items()}
+    accepted = [p.replace(kind=inspect.Parameter.KEYWORD_ONLY) for n, p in accepted.items() if n != "data"]
+    _parts.__signature__ = inspect.Signature([inspect.Parameter("data", inspect.Parameter.POSITIONAL_ONLY)] + accepted)
+    _joint.__signature__ = inspect.signature(module.solve)
+    return ({"parts": _parts, "joint": _joint}
+            | {name: getattr(module, func) for name, func in ENGINES.get(day, {}).items()})
+
+
+def timed(func: Callable, *args) -> tuple:
+    wall = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - wall
+
+
+def compare(day: int, factors: tuple = (1, 2, 4), seeds: int = 3) -> list[dict]:
+    """run reference and candidates on the same inputs, one row per engine and size"""
+    rows = []
+    for size in (BASE_SIZES[day] * f for f in factors):
+        args = solver_args(day, size)
+        expected, ref_wall = [], 0.0
+        try:
+            # generated inputs cannot exercise parts tailored to the real puzzle input, the other parts are compared
+            positions = kept(day)
+            candidates = engines(day)
+            # heavy dependencies would otherwise be charged to the first engine using them
+            preload(days.load(day))
+            inputs = [generate(day, size, seed) for seed in range(seeds)]
+            # first solutions like day 17 write debug files into the working directory
+            with tempfile.TemporaryDirectory() as scratch, chdir(scratch):
+                for data in inputs:
+                    answers, wall = timed(reference, day, data, size)
+                    expected.append([answers[i] for i in positions])
+                    ref_wall += wall
+        except Exception as e:
+            rows.append({"day": day, "engine": "reference", "size": size, "reference": None, "candidate": None,
+                         "speedup": None, "mismatches": [], "error": f"{type(e).__name__}: {e}"})
+            continue
+        for name, func in candidates.items():
+            row = {"day": day, "engine": name, "size": size, "reference": ref_wall, "candidate": None,
+                   "speedup": None, "mismatches": [], "error": None}
+            try:
+                wall = 0.0
+                for seed, (data, exp) in enumerate(zip(inputs, expected)):
+                    answers, t = timed(call, func, data, args)
+                    wall += t
+                    # answers are compared as text, e.g. day 10 renders an image that part b prints
+                    got = [answers[i] for i in positions]
+                    if [str(a) for a in got] != [str(e) for e in exp]:
+                        row["mismatches"].append({"seed": seed, "expected": exp, "got": got})
+                row["candidate"] = wall
+                row["speedup"] = ref_wall / wall if wall else None
+            except Exception as e:
+                row["error"] = f"{type(e).__name__}: {e}"
+            rows.append(row)
+    return rows
+
+
+HEADER = f"{'day':>3} {'engine':<10} {'size':>8} {'ref [s]':>9} {'cand [s]':>9} {'speedup':>8}  status"
+
+
+def format_row(r: dict) -> str:
+    if r["error"] is not None:
+        ref = "-" if r["reference"] is None else f"{r['reference']:.3f}"
+        return f"{r['day']:>3} {r['engine']:<10} {r['size']:>8} {ref:>9}  {r['error']}"
+    status = f"{len(r['mismatches'])} MISMATCHES" if r["mismatches"] else "ok"
+    return (f"{r['day']:>3} {r['engine']:<10} {r['size']:>8} {r['reference']:>9.3f} {r['candidate']:>9.3f}"
+            f" {r['speedup']:>7.2f}x  {status}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="check candidate engines against the reference solutions")
+    parser.add_argument("days", nargs="*", type=int, default=days.DAYS)
+    parser.add_argument("--factors", nargs="+", type=int, default=(1, 2, 4), help="multiples of the base size")
+    parser.add_argument("--seeds", type=int, default=3, help="random inputs per size")
+    parser.add_argument("--json", action="store_true", help="print one json row per line instead of a table")
+    args = parser.parse_args()
+    rows = []
+    if not args.json:
+        print(HEADER, flush=True)
+    # rows are printed as soon as their day is done, a slow day does not hold back the others
+    for d in args.days:
+        for r in compare(d, tuple(args.factors), args.seeds):
+            print(json.dumps(r, default=str) if args.json else format_row(r), flush=True)
+            rows.append(r)
+    sys.exit(1 if any(r["mismatches"] or r["error"] is not None for r in rows) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+synthetic puzzle inputs of a given size
+every generator creates a valid input for its day, the meaning of size is noted in the docstrings
+"""
+
+
+import json
+import operator
+import random
+import string
+
+
+def calories(size: int, rng: random.Random) -> str:
+    """size: number of elves"""
+    return "\n\n".join("\n".join(str(rng.randint(1000, 70000)) for _ in range(rng.randint(1, 15)))
+                       for _ in range(size))
+
+
+def strategy_guide(size: int, rng: random.Random) -> str:
+    """size: number of rounds"""
+    return "\n".join(f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(size))
+
+
+def rucksacks(size: int, rng: random.Random) -> str:
+    """size: number of groups of three rucksacks"""
+    lines = []
+    for _ in range(size):
+        letters = list(string.ascii_letters)
+        rng.shuffle(letters)
+        badge, pools = letters[0], [letters[1 + 17 * i:18 + 17 * i] for i in range(3)]
+        for pool in pools:
+            common, left, right = pool[0], pool[1:9], pool[9:]
+            n = rng.randint(4, 16)
+            first = [common] + [rng.choice(left) for _ in range(n - 1)]
+            second = [common] + [rng.choice(right) for _ in range(n - 1)]
+            (first if rng.random() < 0.5 else second)[-1] = badge
+            rng.shuffle(first)
+            rng.shuffle(second)
+            lines.append("".join(first + second))
+    return "\n".join(lines)
+
+
+def section_assignments(size: int, rng: random.Random) -> str:
+    """size: number of pairs"""
+    lines = []
+    for _ in range(size):
+        l1, l2 = rng.randint(1, 99), rng.randint(1, 99)
+        lines.append(f"{l1}-{rng.randint(l1, 99)},{l2}-{rng.randint(l2, 99)}")
+    return "\n".join(lines)
+
+
+def crates(size: int, rng: random.Random, stacks: int = 9) -> str:
+    """size: number of moves, the stacks hold size crates in total"""
+    piles = [[rng.choice(string.ascii_uppercase) for _ in range(max(1, size // stacks))] for _ in range(stacks)]
+    height = max(len(p) for p in piles)
+    rows = []
+    for level in range(height - 1, -1, -1):
+        rows.append(" ".join(f"[{p[level]}]" if level < len(p) else "   " for p in piles))
+    rows.append(" ".join(f" {k} " for k in range(1, stacks + 1)))
+    counts = [len(p) for p in piles]
+    moves = []
+    for _ in range(size):
+        source = rng.choice([k for k in range(stacks) if counts[k]])
+        sink = rng.choice([k for k in range(stacks) if k != source])
+        amount = rng.randint(1, min(counts[source], 30))
+        counts[source] -= amount
+        counts[sink] += amount
+        moves.append(f"move {amount} from {source + 1} to {sink + 1}")
+    return "\n".join(rows) + "\n\n" + "\n".join(moves)
+
+
+def datastream(size: int, rng: random.Random) -> str:
+    """size: length of the stream, both markers are at its very end"""
+    return "".join(rng.choice("abc") for _ in range(max(0, size - 15))) + string.ascii_lowercase[3:17] + "a"
+
+
+def terminal_output(size: int, rng: random.Random) -> str:
+    """size: number of directories"""
+    children = {0: []}
+    for d in range(1, size):
+        children[rng.randrange(d)].append(d)
+        children[d] = []
+    sizes = {d: [rng.randint(1, 300000) for _ in range(rng.randint(0, 5))] for d in children}
+    total = sum(sum(s) for s in sizes.values())
+    scale = 50000000 / total if total else 1
+    lines = ["$ cd /"]
+
+    def _walk(d: int) -> None:
+        lines.append("$ ls")
+        lines.extend(f"dir d{c}" for c in children[d])
+        lines.extend(f"{max(1, int(s * scale))} f{c}.txt" for c, s in enumerate(sizes[d]))
+        for c in children[d]:
+            lines.append(f"$ cd d{c}")
+            _walk(c)
+            lines.append("$ cd ..")
+
+    _walk(0)
+    return "\n".join(lines)
+
+
+def tree_heights(size: int, rng: random.Random) -> str:
+    """size: edge length of the square forest"""
+    return "\n".join("".join(rng.choice(string.digits) for _ in range(size)) for _ in range(size))
+
+
+def rope_moves(size: int, rng: random.Random) -> str:
+    """size: number of moves"""
+    return "\n".join(f"{rng.choice('LRUD')} {rng.randint(1, 20)}" for _ in range(size))
+
+
+def cpu_instructions(size: int, rng: random.Random) -> str:
+    """size: number of instructions, at least 240 cycles are covered"""
+    return "\n".join("noop" if rng.random() < 0.3 else f"addx {rng.randint(-20, 20)}" for _ in range(max(size, 240)))
+
+
+def monkeys(size: int, rng: random.Random) -> str:
+    """size: number of monkeys, each holds up to five items
+    NOTE: squaring is left out as it makes part a explode for randomly wired monkeys
+    """
+    primes = [p for p in range(2, 200) if all(p % q for q in range(2, p))]
+    blocks = []
+    for m in range(max(size, 2)):
+        operation = rng.choice([f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 9)}"])
+        targets = rng.sample([t for t in range(max(size, 2)) if t != m], 2)
+        blocks.append(
+            f"Monkey {m}:\n"
+            f"  Starting items: {', '.join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 5)))}\n"
+            f"  Operation: new = {operation}\n"
+            f"  Test: divisible by {rng.choice(primes)}\n"
+            f"    If true: throw to monkey {targets[0]}\n"
+            f"    If false: throw to monkey {targets[1]}"
+        )
+    return "\n\n".join(blocks)
+
+
+def heightmap(size: int, rng: random.Random) -> str:
+    """size: edge length of the square map, the ramp along the top row and right column is always climbable"""
+    size = max(size, 14)
+    rows = []
+    for x in range(size):
+        row = []
+        for y in range(size):
+            height = (x + y) * 25 // (2 * size - 2)
+            if x not in (0, size - 1) and y not in (0, size - 1) and rng.random() < 0.2:
+                height = max(0, height - 1)
+            row.append(string.ascii_lowercase[height])
+        rows.append(row)
+    rows[0][0], rows[-1][-1] = "S", "E"
+    return "\n".join("".join(r) for r in rows)
+
+
+def packets(size: int, rng: random.Random) -> str:
+    """size: number of packet pairs"""
+
+    def _packet(depth: int = 0) -> list:
+        return [rng.randint(0, 10) if depth > 3 or rng.random() < 0.6 else _packet(depth + 1)
+                for _ in range(rng.randint(0, 5))]
+
+    return "\n\n".join(f"{json.dumps(_packet(), separators=(',', ':'))}\n{json.dumps(_packet(), separators=(',', ':'))}"
+                       for _ in range(size))
+
+
+def rock_paths(size: int, rng: random.Random) -> str:
+    """size: number of rock paths"""
+    lines = []
+    for p in range(size):
+        x, y = 500 if p == 0 else rng.randint(500 - size, 500 + size), rng.randint(2, 2 + size)
+        path = [(x, y)]
+        for c in range(rng.randint(1, 4)):
+            if c % 2 == 0:
+                x = max(1, x + rng.randint(-5, 5))
+            else:
+                y = max(2, y + rng.randint(-5, 5))
+            path.append((x, y))
+        lines.append(" -> ".join(f"{px},{py}" for px, py in path))
+    return "\n".join(lines)
+
+
+def sensors(size: int, rng: random.Random) -> str:
+    """size: number of sensors, placed in [0, 1000 * size] with a single hidden spot they never cover
+    eight far away sensors around the hidden spot make sure every other position is covered
+    """
+    square = 1000 * size
+    hidden = rng.randint(0, square), rng.randint(0, square)
+    lines = []
+    for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)):
+        sx, sy = hidden[0] + 2 * square * dx, hidden[1] + 2 * square * dy
+        dist = abs(sx - hidden[0]) + abs(sy - hidden[1]) - 1
+        lines.append(f"Sensor at x={sx}, y={sy}: closest beacon is at x={sx + dist * (-dx or 1)}, y={sy}")
+    for _ in range(size):
+        while True:
+            sx, sy = rng.randint(0, square), rng.randint(0, square)
+            if dist := abs(sx - hidden[0]) + abs(sy - hidden[1]) - 1:
+                break
+        bdx = rng.randint(-dist, dist)
+        bdy = (dist - abs(bdx)) * rng.choice((-1, 1))
+        lines.append(f"Sensor at x={sx}, y={sy}: closest beacon is at x={sx + bdx}, y={sy + bdy}")
+    return "\n".join(lines)
+
+
+def valves(size: int, rng: random.Random) -> str:
+    """size: number of valves, at most 15 of which have a flow rate"""
+    size = min(max(size, 2), 26 * 26)
+    pairs = [a + b for a in string.ascii_uppercase for b in string.ascii_uppercase if a + b != "AA"]
+    names = ["AA"] + rng.sample(pairs, size - 1)
+    tunnels = {n: set() for n in names}
+    for c in range(1, size):
+        other = names[rng.randrange(c)]
+        tunnels[names[c]].add(other)
+        tunnels[other].add(names[c])
+    for _ in range(size // 4):
+        a, b = rng.sample(names, 2)
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+    relevant = set(rng.sample(names[1:], min(15, size // 4 + 1, size - 1)))
+    lines = []
+    for n in names:
+        rate = rng.randint(1, 25) if n in relevant else 0
+        if len(tunnels[n]) == 1:
+            lines.append(f"Valve {n} has flow rate={rate}; tunnel leads to valve {next(iter(tunnels[n]))}")
+        else:
+            lines.append(f"Valve {n} has flow rate={rate}; tunnels lead to valves {', '.join(sorted(tunnels[n]))}")
+    return "\n".join(lines)
+
+
+def jet_pattern(size: int, rng: random.Random) -> str:
+    """size: length of the jet pattern"""
+    return "".join(rng.choice("<>") for _ in range(size))
+
+
+def cubes(size: int, rng: random.Random) -> str:
+    """size: number of cubes, kept off the origin so that the outside is reachable from there"""
+    edge = max(3, round(size ** (1 / 3) * 1.5))
+    points = set()
+    while len(points) < min(size, edge ** 3):
+        points.add((rng.randint(1, edge), rng.randint(1, edge), rng.randint(1, edge)))
+    return "\n".join(",".join(map(str, p)) for p in points)
+
+
+def blueprints(size: int, rng: random.Random) -> str:
+    """size: number of blueprints"""
+    return "\n".join(
+        f"Blueprint {b}: Each ore robot costs {rng.randint(2, 4)} ore. Each clay robot costs {rng.randint(2, 4)} ore. "
+        f"Each obsidian robot costs {rng.randint(2, 4)} ore and {rng.randint(4, 10)} clay. "
+        f"Each geode robot costs {rng.randint(2, 4)} ore and {rng.randint(4, 10)} obsidian."
+        for b in range(1, size + 1)
+    )
+
+
+def encrypted_file(size: int, rng: random.Random) -> str:
+    """size: length of the list, which contains exactly one zero"""
+    values = [rng.choice((-1, 1)) * rng.randint(1, 10000) for _ in range(max(size, 4) - 1)]
+    values.insert(rng.randrange(len(values)), 0)
+    return "\n".join(map(str, values))
+
+
+def math_monkeys(size: int, rng: random.Random) -> str:
+    """size: number of number monkeys, operations on the path to humn are restricted to + and -"""
+    used = {"root", "humn"}
+
+    def _name() -> str:
+        while (n := "".join(rng.choice(string.ascii_lowercase) for _ in range(4))) in used:
+            pass
+        used.add(n)
+        return n
+
+    pool = [("humn", rng.randint(1, 20), True)]
+    pool += [(_name(), rng.randint(1, 20), False) for _ in range(max(size, 2) - 1)]
+    lines = [f"{n}: {v}" for n, v, _ in pool]
+    while len(pool) > 1:
+        (first, a, fh), (second, b, sh) = pool.pop(rng.randrange(len(pool))), pool.pop(rng.randrange(len(pool)))
+        if fh or sh:
+            symbol = rng.choice("+-")
+        elif b != 0 and a % b == 0:
+            symbol = "/"
+        elif abs(a * b) < 10 ** 12:
+            symbol = rng.choice("+-*")
+        else:
+            symbol = rng.choice("+-")
+        value = {"+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.floordiv}[symbol](a, b)
+        name = "root" if len(pool) == 0 else _name()
+        lines.append(f"{name}: {first} {symbol} {second}")
+        pool.append((name, value, fh or sh))
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+def monkey_map(size: int, rng: random.Random) -> str:
+    """size: edge length of the rectangular board, only suitable for part a"""
+    rows = ["".join("#" if rng.random() < 0.1 else "." for _ in range(size)) for _ in range(size)]
+    rows[0] = "." + rows[0][1:]
+    path = "".join(f"{rng.randint(1, 50)}{rng.choice('LR')}" for _ in range(size)) + str(rng.randint(1, 50))
+    return "\n".join(rows) + "\n\n" + path
+
+
+def elf_grove(size: int, rng: random.Random) -> str:
+    """size: edge length of the square scan"""
+    return "\n".join("".join("#" if rng.random() < 0.3 else "." for _ in range(size)) for _ in range(size))
+
+
+def blizzard_basin(size: int, rng: random.Random) -> str:
+    """size: inner width of the valley, which is a third as high"""
+    width, height = max(size, 4), max(size // 3, 3)
+    rows = ["#." + "#" * width]
+    for _ in range(height):
+        rows.append("#" + "".join(rng.choice("<>^v") if rng.random() < 0.4 else "." for _ in range(width)) + "#")
+    rows.append("#" * width + ".#")
+    return "\n".join(rows)
+
+
+def snafu_numbers(size: int, rng: random.Random) -> str:
+    """size: number of snafu numbers"""
+
+    def _to_snafu(value: int) -> str:
+        digits = ""
+        while value:
+            value, rest = divmod(value + 2, 5)
+            digits = "=-012"[rest] + digits
+        return digits or "0"
+
+    return "\n".join(_to_snafu(rng.randint(1, 10 ** rng.randint(1, 15))) for _ in range(size))
+
+
+GENERATORS = {
+    1: calories,
+    2: strategy_guide,
+    3: rucksacks,
+    4: section_assignments,
+    5: crates,
+    6: datastream,
+    7: terminal_output,
+    8: tree_heights,
+    9: rope_moves,
+    10: cpu_instructions,
+    11: monkeys,
+    12: heightmap,
+    13: packets,
+    14: rock_paths,
+    15: sensors,
+    16: valves,
+    17: jet_pattern,
+    18: cubes,
+    19: blueprints,
+    20: encrypted_file,
+    21: math_monkeys,
+    22: monkey_map,
+    23: elf_grove,
+    24: blizzard_basin,
+    25: snafu_numbers,
+}
+
+
+def solver_args(day: int, size: int) -> dict:
+    """arguments the solvers need to match a generated input"""
+    if day == 15:
+        return {"row_of_interest": 500 * size, "square": 1000 * size}
+    if day == 19:
+        # shorter horizon, the full 24 and 32 minutes take minutes per blueprint
+        return {"reps": 20}
+    return {}
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    return GENERATORS[day](size, random.Random(seed))
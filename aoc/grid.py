@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+character grids as 2-d uint8 arrays
+rectangular inputs are viewed in place on the input bytes, the newlines are skipped via the row stride, ragged inputs
+are filled up to the longest line, in both cases without creating a python object per character
+"""
+
+
+from __future__ import annotations
+
+from aoc.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+NEWLINE = ord("\n")
+
+
+def load_grid(data: str | bytes, pad: int = 0, fill: bytes = b" ") -> np.ndarray:
+    """
+    :param data: lines of equal or different length, leading and trailing newlines are ignored
+    :param pad: number of cells of fill added around the grid
+    :param fill: character for the padding and for the missing cells of short lines
+    """
+    raw = data.encode() if isinstance(data, str) else bytes(data)
+    raw = raw.strip(b"\n")
+    buf = np.frombuffer(raw, dtype=np.uint8)
+    width = raw.find(b"\n")
+    if width == -1:
+        # a single line, or no line at all for an empty input
+        grid = buf.reshape(min(len(buf), 1), len(buf))
+    elif (len(raw) + 1) % (width + 1) == 0 and (buf[width::width + 1] == NEWLINE).all():
+        # read-only view, the row stride steps over the newline at the end of each line
+        rows = (len(raw) + 1) // (width + 1)
+        grid = np.lib.stride_tricks.as_strided(buf, shape=(rows, width), strides=(width + 1, 1), writeable=False)
+    else:
+        grid = ragged(buf, fill)
+    if pad:
+        grid = np.pad(grid, pad, mode="constant", constant_values=fill[0])
+    return grid
+
+
+def ragged(buf: np.ndarray, fill: bytes = b" ") -> np.ndarray:
+    newlines = np.flatnonzero(buf == NEWLINE)
+    starts = np.concatenate(([0], newlines + 1))
+    lengths = np.concatenate((newlines, [len(buf)])) - starts
+    grid = np.full((len(lengths), lengths.max()), fill[0], dtype=np.uint8)
+    # cells of a row left of its length are filled in row-major order, which is the order of the characters
+    grid[np.arange(grid.shape[1]) < lengths[:, None]] = buf[buf != NEWLINE]
+    return grid
+
+
+def find(grid: np.ndarray, char: str) -> list[tuple[int, int]]:
+    """coordinates of all cells holding a character"""
+    return [tuple(p) for p in np.argwhere(grid == ord(char)).tolist()]
+
+
+def rows(grid: np.ndarray, mutable: bool = False) -> list[bytes] | list[bytearray]:
+    """rows as bytes for cell by cell loops, indexing them yields ints and is faster than indexing the array"""
+    if mutable:
+        return [bytearray(r.tobytes()) for r in grid]
+    return [r.tobytes() for r in grid]
+
+
+def to_text(grid: np.ndarray) -> str:
+    return "\n".join(r.decode() for r in rows(grid))
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+benchmark history and regression comparison
+record appends repeated timings per day and part to benchmarks/history.jsonl together with machine and commit
+metadata, compare runs the benchmark again and flags every part that got slower than a stored baseline
+usage: python -m aoc.history record [days ...] [--repeats 5] [--label name]
+       python -m aoc.history compare [days ...] [--baseline commit|label] [--threshold 10] [--record]
+"""
+
+
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+
+from aoc import days
+from aoc.inputs import ROOT
+from aoc.runner import run_task
+
+HISTORY = os.path.join(ROOT, "benchmarks", "history.jsonl")
+
+
+def metadata(label: str = None) -> dict:
+    def _git(*args: str) -> str:
+        try:
+            return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "label": label,
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "host": socket.gethostname(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def bench(selected: tuple, repeats: int = 5, warmup: int = 1) -> dict:
+    """repeated wall times per day and part, keyed as e.g. 12a, a part that fails in any run only records its error"""
+    results = {}
+    for task in days.schedule(selected):
+        runs = [run_task(task) for _ in range(warmup + repeats)][warmup:]
+        if (error := next((r["error"] for r in runs if r["error"] is not None), None)) is not None:
+            results[f"{task.day}{task.part}"] = {"error": error}
+            continue
+        walls = [r["wall"] for r in runs]
+        results[f"{task.day}{task.part}"] = {
+            "median": statistics.median(walls),
+            "min": min(walls),
+            "stdev": statistics.stdev(walls) if len(walls) > 1 else 0.0,
+            "repeats": len(walls),
+        }
+    return results
+
+
+def load(history: str = HISTORY) -> list[dict]:
+    if not os.path.isfile(history):
+        return []
+    with open(history) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def record(entry: dict, history: str = HISTORY) -> None:
+    os.makedirs(os.path.dirname(history), exist_ok=True)
+    with open(history, "a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def find_baseline(entries: list[dict], ref: str = None) -> dict:
+    """latest entry matching a label or commit prefix, the latest entry overall without a reference"""
+    for e in reversed(entries):
+        if ref is None or e["meta"]["label"] == ref or e["meta"]["commit"].startswith(ref):
+            return e
+    raise LookupError(f"no baseline {ref} in the benchmark history" if ref else "empty benchmark history")
+
+
+def compare(baseline: dict, current: dict, threshold: float = 10.0, noise: float = 3.0) -> list[dict]:
+    """flag parts that are slower than the baseline by more than threshold percent
+    a slowdown also has to exceed noise times the combined standard deviation of both runs to count, parts that fail
+    now or are missing from the current run count as regressions as well
+    NOTE: baseline parts of days the current run did not select have to be left out of baseline by the caller
+    """
+    rows = []
+    for key, base in baseline.items():
+        if "error" in base:
+            # nothing to compare against, a part that got fixed is no regression
+            continue
+        if (cur := current.get(key)) is None or "error" in cur:
+            rows.append({"part": key, "baseline": base["median"], "current": None, "change": None,
+                         "regression": True, "status": "no longer measured" if cur is None else "now failing",
+                         "error": None if cur is None else cur["error"]})
+            continue
+        delta = cur["median"] - base["median"]
+        margin = max(threshold / 100 * base["median"], noise * math.hypot(base["stdev"], cur["stdev"]))
+        rows.append({
+            "part": key,
+            "baseline": base["median"],
+            "current": cur["median"],
+            "change": 100 * delta / base["median"] if base["median"] else 0.0,
+            "regression": delta > margin,
+            "status": "slower" if delta > margin else "ok",
+            "error": None,
+        })
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="record benchmarks and compare them against a baseline")
+    parser.add_argument("command", choices=("record", "compare"))
+    parser.add_argument("days", nargs="*", type=int, default=days.DAYS)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--label", default=None, help="name of the recorded entry")
+    parser.add_argument("--baseline", default=None, help="label or commit of the baseline, defaults to the latest")
+    parser.add_argument("--threshold", type=float, default=10.0, help="tolerated slowdown in percent")
+    parser.add_argument("--noise", type=float, default=3.0, help="tolerated slowdown in standard deviations")
+    parser.add_argument("--record", action="store_true", help="also store the run made for the comparison")
+    parser.add_argument("--history", default=HISTORY)
+    args = parser.parse_args()
+
+    baseline = None
+    if args.command == "compare":
+        try:
+            baseline = find_baseline(load(args.history), args.baseline)
+        except LookupError as e:
+            parser.error(f"{e}, run `python -m aoc.history record` first")
+    entry = {"meta": metadata(args.label), "results": bench(tuple(args.days), args.repeats)}
+    if args.command == "record" or args.record:
+        record(entry, args.history)
+    if args.command == "record":
+        failed = sum("error" in r for r in entry["results"].values())
+        print(f"recorded {len(entry['results'])} parts to {args.history}, {failed} of them failed")
+        return
+
+    if baseline["meta"]["host"] != entry["meta"]["host"]:
+        print(f"WARNING: baseline was recorded on {baseline['meta']['host']}, timings may not be comparable")
+    print(f"baseline {baseline['meta']['commit'][:10]} ({baseline['meta']['timestamp']})")
+    selected = {k: v for k, v in baseline["results"].items() if int(k[:-1]) in args.days}
+    rows = compare(selected, entry["results"], args.threshold, args.noise)
+    for r in rows:
+        flag = "REGRESSION" if r["regression"] else ""
+        if r["current"] is None:
+            print(f"{r['part']:>4} {r['baseline']:9.4f} s -> {r['status']} {flag} {r['error'] or ''}")
+            continue
+        print(f"{r['part']:>4} {r['baseline']:9.4f} s -> {r['current']:9.4f} s {r['change']:+7.1f} % {flag}")
+    sys.exit(1 if any(r["regression"] for r in rows) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+local input store
+puzzle inputs live next to the solutions as day_XX/input.txt and are read via mmap, aocd is only imported when an
+input is missing and has to be fetched explicitly
+"""
+
+
+import mmap
+import os
+
+# os.path instead of pathlib and no contextlib keep the import cost of the solutions low, cp aoc.startup
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def day_dir(day: int) -> str:
+    return os.path.join(ROOT, f"day_{day:02d}")
+
+
+def input_path(day: int, name: str = "input.txt") -> str:
+    path = os.path.join(day_dir(day), name)
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"no {name} for day {day}, run `python -m aoc.inputs {day}` to fetch it")
+    return path
+
+
+def mapped(day: int, name: str = "input.txt") -> mmap.mmap | memoryview:
+    """map an input file into memory read-only, use the result as context manager to release the mapping
+    NOTE: empty files cannot be mapped, an empty memoryview is returned instead
+    """
+    with open(input_path(day, name), "rb") as f:
+        if not f.seek(0, 2):
+            return memoryview(b"")
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def read_bytes(day: int, name: str = "input.txt") -> bytes:
+    with mapped(day, name) as mm:
+        return bytes(mm)
+
+
+def read_text(day: int, name: str = "input.txt") -> str:
+    return read_bytes(day, name).decode()
+
+
+def puzzle_input(day: int) -> str:
+    """puzzle input as served by aocd, i.e. without the trailing newline"""
+    return read_text(day).rstrip("\n")
+
+
+def digest(day: int, name: str = "input.txt") -> str:
+    """content address of an input file"""
+    import hashlib
+
+    with mapped(day, name) as mm:
+        return hashlib.sha256(mm).hexdigest()
+
+
+def fetch(day: int, year: int = 2022) -> str:
+    """download an input via aocd and add it to the store"""
+    from aocd.models import Puzzle
+
+    path = os.path.join(day_dir(day), "input.txt")
+    with open(path, "w") as f:
+        f.write(Puzzle(year=year, day=day).input_data)
+    return path
+
+
+if __name__ == "__main__":
+    import sys
+
+    for d in sys.argv[1:]:
+        print(fetch(int(d)))
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""deferred imports of heavy dependencies like numpy and pandas"""
+
+
+import importlib
+import sys
+from types import ModuleType
+
+
+class LazyModule(ModuleType):
+    """stand-in for a module that is imported on first attribute access"""
+
+    def __getattr__(self, attr: str):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """return the module if it is loaded already, a LazyModule otherwise"""
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
+
+
+def dependencies(module: ModuleType, package: str = "aoc") -> list[ModuleType]:
+    """the module and all modules of the package it uses, directly or via other modules of the package"""
+    found = {module.__name__: module}
+    todo = [module]
+    while todo:
+        for obj in list(vars(todo.pop()).values()):
+            # getattr on a LazyModule would import it, its name is set on construction though
+            name = obj.__name__ if isinstance(obj, ModuleType) else getattr(obj, "__module__", None)
+            if not isinstance(name, str) or not name.startswith(package + ".") or name in found:
+                continue
+            if (dep := sys.modules.get(name)) is not None and not isinstance(dep, LazyModule):
+                found[name] = dep
+                todo.append(dep)
+    return list(found.values())
+
+
+def preload(module: ModuleType) -> None:
+    """
+    import the real modules behind all lazy globals of a module and of the aoc modules it uses, e.g. to keep them out
+    of measurements
+    """
+    for dep in dependencies(module):
+        for obj in list(vars(dep).values()):
+            if isinstance(obj, LazyModule):
+                importlib.import_module(obj.__name__)
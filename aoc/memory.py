@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+peak and retained memory per parse and solve phase, based on tracemalloc
+usage: python -m aoc.memory 12 15 [--size N] [--sites 5] [--ceiling-mb 512] [--out report.json]
+"""
+
+
+import argparse
+import json
+import resource
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from contextlib import redirect_stdout
+from io import StringIO
+from typing import Iterator
+
+from aoc import days
+from aoc.generators import generate
+from aoc.inputs import puzzle_input
+from aoc.lazy import preload
+from aoc.profiling import instrumented
+from aoc.scaling import SKIP
+from aoc.scaling import scaled
+
+# peak memory per day in MiB, four times the measured peak and at least 8 MiB, days not listed get the default ceiling
+# NOTE: days 1 to 9 measured on their puzzle input, later days on synthetic input at four times the base size of
+# aoc.scaling, days 16 and 19 at the base size since their runtime grows exponentially
+CEILINGS_MB = {1: 8, 2: 8, 3: 8, 4: 8, 5: 8, 6: 8, 7: 8, 8: 24, 9: 8, 10: 8, 11: 8, 12: 8, 13: 8, 14: 8, 15: 8, 16: 8,
+               17: 8, 18: 8, 19: 8, 20: 8, 21: 8, 22: 8, 23: 8, 24: 8, 25: 8}
+DEFAULT_CEILING_MB = 1024
+
+
+class MemoryTracker:
+    """record peak and retained memory per phase and the allocation sites of the retained memory
+    peaks are measured relative to the memory in use when a phase starts, nested phases are folded into the peak of
+    the enclosing phase since tracemalloc only keeps a single peak
+    """
+
+    def __init__(self, sites: int = 5) -> None:
+        self.sites = sites
+        self.phases = {}
+        self._stack = []
+        self._filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__),
+                         tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")]
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        path = "/".join([f["name"] for f in self._stack] + [name])
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+        # the snapshot is taken before the phase starts, so the memory it holds is part of the start and counts neither
+        # for the peak nor as retained, the enclosing phases subtract it as overhead
+        snapshot = tracemalloc.take_snapshot().filter_traces(self._filters) if self.sites else None
+        start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        frame = {"name": name, "start": start, "peak": start, "overhead": start - current, "snapshot": snapshot}
+        del snapshot
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            end, peak = tracemalloc.get_traced_memory()
+            self._stack.pop()
+            frame["peak"] = max(frame["peak"], peak)
+            sites = self._top_sites(frame["snapshot"]) if self.sites else []
+            frame["snapshot"] = None
+            if self._stack:
+                self._stack[-1]["peak"] = max(self._stack[-1]["peak"], frame["peak"] - frame["overhead"])
+            tracemalloc.reset_peak()
+            entry = self.phases.setdefault(path, {"calls": 0, "peak": 0, "retained": 0, "sites": []})
+            entry["calls"] += 1
+            entry["peak"] = max(entry["peak"], frame["peak"] - frame["start"])
+            entry["retained"] = max(entry["retained"], end - frame["start"])
+            if self.sites:
+                entry["sites"] = sites
+
+    def _top_sites(self, before: tracemalloc.Snapshot) -> list[dict]:
+        after = tracemalloc.take_snapshot().filter_traces(self._filters)
+        diff = [d for d in after.compare_to(before, "lineno") if d.size_diff > 0][:self.sites]
+        return [{"site": str(d.traceback), "size": d.size_diff, "count": d.count_diff} for d in diff]
+
+    def peak(self) -> int:
+        """largest peak of any outermost phase"""
+        return max((p["peak"] for k, p in self.phases.items() if "/" not in k), default=0)
+
+
+def track_day(day: int, size: int = None, sites: int = 5) -> dict:
+    """run all parts of a day with memory tracking
+    :param size: use a synthetic input of this size instead of the puzzle input
+    """
+    tracker = MemoryTracker(sites)
+    data = puzzle_input(day) if size is None else generate(day, size)
+    module = days.load(day)
+    # heavy dependencies would otherwise be charged to the first phase using them
+    preload(module)
+    tracemalloc.start()
+    try:
+        with instrumented(module, tracker.phase), redirect_stdout(StringIO()):
+            for task in days.tasks(day):
+                if size is not None:
+                    # parts tailored to the real puzzle input cannot solve a synthetic one
+                    if (day, task.part) in SKIP:
+                        continue
+                    task = scaled(task, size)
+                getattr(module, task.func)(data, **task.kwargs)
+    finally:
+        tracemalloc.stop()
+    return {"day": day, "peak": tracker.peak(), "phases": tracker.phases}
+
+
+def limit_memory(mb: int) -> None:
+    """hard ceiling for the current process, allocations beyond it raise MemoryError
+    NOTE: this limits the address space, which includes shared libraries, so leave headroom
+    """
+    limit = mb * 2 ** 20
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="report peak and retained memory per parse and solve phase")
+    parser.add_argument("days", nargs="+", type=int)
+    parser.add_argument("--size", type=int, default=None, help="use a synthetic input of this size")
+    parser.add_argument("--sites", type=int, default=5, help="number of allocation sites per phase")
+    parser.add_argument("--ceiling-mb", type=float, default=None, help="override the ceiling for all days")
+    parser.add_argument("--out", default=None, help="write the json report to this file")
+    args = parser.parse_args()
+    reports, violations = [], 0
+    for d in args.days:
+        report = track_day(d, args.size, args.sites)
+        ceiling = args.ceiling_mb or CEILINGS_MB.get(d, DEFAULT_CEILING_MB)
+        report["ceiling"] = ceiling * 2 ** 20
+        violations += report["peak"] > report["ceiling"]
+        reports.append(report)
+        print(f"day {d:>2}: peak {report['peak'] / 2 ** 20:8.2f} MiB (ceiling {ceiling:.0f} MiB)"
+              f"{' OVER CEILING' if report['peak'] > report['ceiling'] else ''}")
+        for name, p in report["phases"].items():
+            print(f"    {name:<28} peak {p['peak'] / 2 ** 20:8.2f} MiB retained {p['retained'] / 2 ** 20:8.2f} MiB")
+            for s in p["sites"][:1]:
+                print(f"        top site {s['site']} {s['size'] / 2 ** 20:.2f} MiB")
+    if args.out is not None:
+        with open(args.out, "w") as f:
+            json.dump(reports, f, indent=2)
+    sys.exit(1 if violations else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+vectorized parsing of numeric records
+all integers of an input are extracted from its raw bytes in a single pass of array operations, i.e. without splitting
+the text and calling int() per token, the streaming variants read a file in chunks cut at line boundaries
+"""
+
+
+from __future__ import annotations
+
+from aoc.lazy import lazy_import
+
+# annotations only, typing and collections.abc would add to the import time of every day, cp aoc.startup
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import BinaryIO
+
+np = lazy_import("numpy")
+
+MINUS = ord("-")
+NEWLINE = ord("\n")
+CHUNK_SIZE = 1 << 24
+# longest digit run that fits into an int64
+MAX_DIGITS = 18
+
+
+def as_buffer(data: str | bytes) -> np.ndarray:
+    """uint8 view on the input, str is encoded first"""
+    raw = data.encode() if isinstance(data, str) else data
+    return np.frombuffer(raw, dtype=np.uint8)
+
+
+def spans(buf: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """start and length of every run of digits"""
+    # bytes below "0" wrap around and end up above 9 as well
+    is_digit = (buf - np.uint8(ord("0"))) < 10
+    edges = np.flatnonzero(is_digit[1:] != is_digit[:-1]) + 1
+    if len(buf) and is_digit[0]:
+        edges = np.concatenate(([0], edges))
+    if len(buf) and is_digit[-1]:
+        edges = np.concatenate((edges, [len(buf)]))
+    return edges[::2], edges[1::2] - edges[::2]
+
+
+def check(buf: np.ndarray, separators: bytes | None, signed: bool = True) -> None:
+    """
+    raise a ValueError for the first byte that is neither a digit nor one of the separators
+    :param separators: bytes allowed between the numbers, e.g. b",\n", the minus is allowed for signed numbers, None
+        accepts every byte
+    """
+    if separators is None:
+        return
+    allowed = np.zeros(256, dtype=bool)
+    allowed[ord("0"):ord("9") + 1] = True
+    allowed[np.frombuffer(separators + (b"-" if signed else b""), dtype=np.uint8)] = True
+    if len(bad := np.flatnonzero(~allowed[buf])):
+        raise ValueError(f"unexpected {bytes(buf[bad[:1]])!r} at offset {bad[0]}")
+
+
+def integers(data: str | bytes, signed: bool = True, separators: bytes = None) -> np.ndarray:
+    """
+    :param data: text holding the integers, everything but digits and signs is treated as a separator
+    :param signed: whether a minus right before a number negates it, day 4 uses it as a separator in e.g. 2-4
+    :param separators: bytes allowed besides digits and signs, any other byte raises a ValueError, see check
+    """
+    buf = as_buffer(data)
+    check(buf, separators, signed)
+    return values(buf, *spans(buf), signed)
+
+
+def values(buf: np.ndarray, starts: np.ndarray, lengths: np.ndarray, signed: bool = True) -> np.ndarray:
+    """integers of the digit runs found by spans"""
+    if not len(starts):
+        return np.zeros(0, dtype=np.int64)
+    if lengths.max() > MAX_DIGITS:
+        raise ValueError(f"integers with more than {MAX_DIGITS} digits do not fit into int64")
+    # horner scheme over the digits aligned right, one pass per digit of the longest number rather than per byte
+    width = lengths.max()
+    dtype = np.int32 if width <= 9 else np.int64
+    ends = starts + lengths
+    result = np.zeros(len(starts), dtype=dtype)
+    for k in range(width, 0, -1):
+        # shorter numbers read bytes left of their run here, negative indices stay within the buffer
+        digits = buf[ends - k] - np.uint8(ord("0"))
+        if k > lengths.min():
+            digits = np.where(lengths >= k, digits, 0)
+        result *= 10
+        result += digits.astype(dtype)
+    result = result.astype(np.int64)
+    if signed:
+        negative = np.zeros(len(starts), dtype=bool)
+        negative[starts > 0] = buf[starts[starts > 0] - 1] == MINUS
+        result[negative] *= -1
+    return result
+
+
+def records(data: str | bytes, fields: int, signed: bool = True, separators: bytes = None) -> np.ndarray:
+    """integers as rows of a fixed number of fields, e.g. the four coordinates per line of day 15"""
+    found = integers(data, signed, separators)
+    if len(found) % fields:
+        raise ValueError(f"{len(found)} integers do not split into records of {fields} fields")
+    return found.reshape(-1, fields)
+
+
+def blocks(data: str | bytes, signed: bool = True, separators: bytes = None) -> tuple[np.ndarray, np.ndarray]:
+    """integers and the index of the block each one belongs to, blocks are separated by blank lines"""
+    buf = as_buffer(data)
+    check(buf, separators, signed)
+    starts, lengths = spans(buf)
+    separators = np.flatnonzero((buf[:-1] == NEWLINE) & (buf[1:] == NEWLINE))
+    # the block of a number is the count of separators before it, found from the side of the fewer separators
+    counts = np.bincount(np.searchsorted(starts, separators), minlength=len(starts) + 1)
+    return values(buf, starts, lengths, signed), np.cumsum(counts[:len(starts)])
+
+
+def chunks(source: str | BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    read a file in pieces of about chunk_size bytes that end at a line boundary, so no record is cut
+    :param source: path or file opened in binary mode
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            yield from chunks(f, chunk_size)
+        return
+    # pieces of the current line, joined once it ends rather than per block read, which is quadratic for long lines
+    pieces = []
+    while block := source.read(chunk_size):
+        cut = block.rfind(b"\n") + 1
+        if not cut:
+            pieces.append(block)
+            continue
+        pieces.append(block[:cut])
+        yield b"".join(pieces)
+        pieces = [block[cut:]]
+    if rest := b"".join(pieces):
+        yield rest
+
+
+def stream_integers(source: str | BinaryIO, signed: bool = True, chunk_size: int = CHUNK_SIZE,
+                    separators: bytes = None) -> Iterator[np.ndarray]:
+    for chunk in chunks(source, chunk_size):
+        yield integers(chunk, signed, separators)
+
+
+def stream_records(source: str | BinaryIO, fields: int, signed: bool = True, chunk_size: int = CHUNK_SIZE,
+                   separators: bytes = None) -> Iterator[np.ndarray]:
+    """records of a file chunk by chunk, a record must not span several lines"""
+    for chunk in chunks(source, chunk_size):
+        yield records(chunk, fields, signed, separators)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+profiling hooks around the parse and solve phases of the daily solutions
+usage: python -m aoc.profiling 12 17 [--cprofile] [--count day_24.ValleySim.blocked day_17.Rock.move_sideways]
+                               [--size N] [--out report.json]
+"""
+
+
+import argparse
+import cProfile
+import functools
+import inspect
+import json
+import pstats
+import re
+import time
+from contextlib import ExitStack
+from contextlib import contextmanager
+from contextlib import redirect_stdout
+from io import StringIO
+from types import ModuleType
+from typing import Callable
+from typing import Iterator
+
+from aoc import days
+from aoc.generators import generate
+from aoc.inputs import puzzle_input
+from aoc.lazy import preload
+from aoc.scaling import scaled
+
+PARSE_FUNCTIONS = ("prepare", "parse", "load_data", "create_map", "extend_map", "monkey_init", "init_monkeys")
+PART_FUNCTIONS = ("part_a", "part_b", "both", "solve")
+
+
+class Profiler:
+    """collect wall and cpu time per phase, optionally with cprofile stats and call counts of hot functions
+    phases are named by their call path, e.g. part_a/parse, so nested phases are attributed to the calling part
+    """
+
+    def __init__(self, cprofile: bool = False, top: int = 15) -> None:
+        self.cprofile = cprofile
+        self.top = top
+        self.phases = {}
+        self.counts = {}
+        self.stats = {}
+        self._stack = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        path = "/".join(self._stack + [name])
+        self._stack.append(name)
+        # cprofile cannot be nested, so only outermost phases are profiled
+        profile = cProfile.Profile() if self.cprofile and len(self._stack) == 1 else None
+        children = self._children_wall(path)
+        wall, cpu = time.perf_counter(), time.process_time()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            self._stack.pop()
+            entry = self.phases.setdefault(path, {"calls": 0, "wall": 0.0, "cpu": 0.0, "self_wall": 0.0})
+            entry["calls"] += 1
+            entry["wall"] += wall
+            entry["cpu"] += cpu
+            nested = self._children_wall(path) - children
+            entry["self_wall"] += wall - nested
+            if profile is not None:
+                self.stats[path] = self._summarize(profile)
+
+    def _children_wall(self, path: str) -> float:
+        """wall time of the direct children of a phase, grandchildren are already part of their parent"""
+        depth = path.count("/") + 1
+        return sum(p["wall"] for k, p in self.phases.items() if k.startswith(path + "/") and k.count("/") == depth)
+
+    def _summarize(self, profile: cProfile.Profile) -> list[dict]:
+        stats = pstats.Stats(profile, stream=StringIO())
+        rows = []
+        for (file, line, func), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            rows.append({"function": f"{file}:{line}({func})", "ncalls": ncalls, "tottime": tottime,
+                         "cumtime": cumtime})
+        return sorted(rows, key=lambda r: r["cumtime"], reverse=True)[:self.top]
+
+    def count(self, name: str) -> None:
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def report(self) -> dict:
+        return {"phases": self.phases, "counts": self.counts, "cprofile": self.stats}
+
+
+def phased(hook: Callable, name: str = None) -> Callable:
+    """decorator running a function as a named phase, e.g. phased(profiler.phase)
+    :param hook: context manager factory taking the phase name
+    :param name: phase name, defaults to the name of the function
+    """
+
+    def _decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def _wrapper(*args, **kwargs):
+            with hook(name or func.__name__):
+                return func(*args, **kwargs)
+        return _wrapper
+
+    return _decorator
+
+
+def counted(profiler: Profiler, name: str) -> Callable:
+    """decorator counting the calls of a function"""
+
+    def _decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def _wrapper(*args, **kwargs):
+            profiler.count(name)
+            return func(*args, **kwargs)
+        return _wrapper
+
+    return _decorator
+
+
+def resolve(target: str) -> tuple[ModuleType | type, str]:
+    """find the owner and attribute name for targets like day_9.follow_trail or day_17.Rock.move_sideways"""
+    match = re.fullmatch(r"day_?(\d+)\.([\w.]+)", target)
+    if match is None:
+        raise ValueError(f"cannot resolve {target}, expected e.g. day_24.ValleySim.blocked")
+    owner = days.load(int(match.group(1)))
+    *path, attr = match.group(2).split(".")
+    for p in path:
+        owner = getattr(owner, p)
+    return owner, attr
+
+
+@contextmanager
+def patched(owner: ModuleType | type, attr: str, wrap: Callable) -> Iterator[None]:
+    original = inspect.getattr_static(owner, attr)
+    if isinstance(original, (staticmethod, classmethod)):
+        setattr(owner, attr, type(original)(wrap(original.__func__)))
+    else:
+        setattr(owner, attr, wrap(original))
+    try:
+        yield
+    finally:
+        setattr(owner, attr, original)
+
+
+@contextmanager
+def instrumented(module: ModuleType, hook: Callable, count: tuple = (), counter: Profiler = None) -> Iterator[None]:
+    """wrap the parse and part functions of a day module into phases of the given hook
+    :param module: day module to be instrumented
+    :param hook: context manager factory taking a phase name, e.g. Profiler.phase
+    :param count: hot functions whose calls are counted, e.g. day_17.Rock.move_sideways
+    :param counter: profiler receiving the call counts
+    """
+    with ExitStack() as stack:
+        for name in PARSE_FUNCTIONS + PART_FUNCTIONS:
+            if inspect.isfunction(getattr(module, name, None)):
+                stack.enter_context(patched(module, name, phased(hook, name)))
+        for target in count:
+            stack.enter_context(patched(*resolve(target), counted(counter, target)))
+        yield
+
+
+def profile_day(day: int, cprofile: bool = False, count: tuple = (), size: int = None) -> dict:
+    """run all parts of a day with instrumentation
+    :param size: use a synthetic input of this size instead of the puzzle input
+    """
+    profiler = Profiler(cprofile=cprofile)
+    data = puzzle_input(day) if size is None else generate(day, size)
+    module = days.load(day)
+    # heavy dependencies would otherwise be charged to the first phase using them
+    preload(module)
+    own = tuple(t for t in count if int(re.match(r"day_?(\d+)", t).group(1)) == day)
+    with instrumented(module, profiler.phase, own, profiler), redirect_stdout(StringIO()):
+        for task in days.tasks(day):
+            if size is not None:
+                task = scaled(task, size)
+            getattr(module, task.func)(data, **task.kwargs)
+    return {"day": day, **profiler.report()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="profile the parse and solve phases per day")
+    parser.add_argument("days", nargs="+", type=int)
+    parser.add_argument("--cprofile", action="store_true", help="record cprofile stats per part")
+    parser.add_argument("--count", nargs="*", default=(), help="hot functions to count, e.g. day_9.follow_trail")
+    parser.add_argument("--size", type=int, default=None, help="profile on a synthetic input of this size")
+    parser.add_argument("--out", default=None, help="write the json report to this file instead of stdout")
+    args = parser.parse_args()
+    report = [profile_day(d, args.cprofile, tuple(args.count), args.size) for d in args.days]
+    if args.out is None:
+        print(json.dumps(report, indent=2))
+    else:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+"""AOC 2022 day 1 as first solved, kept unchanged as the reference of aoc.differential"""
+
+
+def part_a(data) -> int:
+    inventory = [sum([int(m) for m in i.split("\n")]) for i in data.split("\n\n")]
+    return max(inventory)
+
+
+def part_b(data, num_elves: int = 3) -> int:
+    inventory = [sum([int(m) for m in i.split("\n")]) for i in data.split("\n\n")]
+    maxcal = inventory[:num_elves]
+    maxcal.sort(reverse=True)
+    for i in inventory[num_elves:]:
+        if i > maxcal[-1]:
+            maxcal.pop()
+            maxcal.append(i)
+            maxcal.sort(reverse=True)
+    return sum(maxcal)
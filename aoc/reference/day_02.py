@@ -0,0 +1,21 @@
+"""AOC 2022 day 2 as first solved, kept unchanged as the reference of aoc.differential"""
+
+
+def part_a(data) -> int:
+    points = 0
+    for r in [i.split() for i in data.split("\n")]:
+        opp = "ABC".index(r[0])
+        me = "XYZ".index(r[1])
+        res = (me - opp + 1) % 3
+        points += 3 * res + me + 1
+    return points
+
+
+def part_b(data) -> int:
+    points = 0
+    for r in [i.split() for i in data.split("\n")]:
+        opp = "ABC".index(r[0])
+        res = "XYZ".index(r[1])
+        me = (opp + res - 1) % 3
+        points += 3 * res + me + 1
+    return points
@@ -0,0 +1,15 @@
+"""AOC 2022 day 4 as first solved, kept unchanged as the reference of aoc.differential"""
+
+
+def both(data) -> tuple:
+    assignments = [i.split(",") for i in data.split("\n")]
+    subsumptions, overlaps = 0, 0
+    for a in assignments:
+        l1, u1 = a[0].split("-")
+        l2, u2 = a[1].split("-")
+        if int(l1) <= int(l2) and int(u1) >= int(u2) or int(l1) >= int(l2) and int(u1) <= int(u2):
+            subsumptions += 1
+        if int(l2) <= int(l1) <= int(u2) or int(l2) <= int(u1) <= int(u2) or \
+                int(l1) <= int(l2) <= int(u1) or int(l1) <= int(u2) <= int(u1):
+            overlaps += 1
+    return subsumptions, overlaps
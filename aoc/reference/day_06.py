@@ -0,0 +1,11 @@
+"""AOC 2022 day 6 as first solved, kept unchanged as the reference of aoc.differential"""
+
+
+def both(data, ln: int) -> int:
+    pos, mem = ln, list(data[:ln])
+    for char in data[ln:]:
+        if len(set(mem)) == ln:
+            return pos
+        mem.pop(0)
+        mem.append(char)
+        pos += 1
@@ -0,0 +1,56 @@
+"""AOC 2022 day 10 as first solved, kept unchanged as the reference of aoc.differential"""
+
+
+import pandas as pd
+
+
+def parse(data) -> list:
+    return [l.split() for l in data.split("\n") if l]
+
+
+def part_a(data):
+    register, cycle = 1, 0
+    signal_sum = 0
+
+    def _check_signal_strength(cycle: int, register: int) -> int:
+        if cycle == 20 or (cycle - 20) % 40 == 0:
+            return cycle * register
+        return 0
+
+    for instruction in parse(data):
+        if cycle > 220:
+            break
+        if instruction[0] == "noop":
+            cycle += 1
+            signal_sum += _check_signal_strength(cycle, register)
+        else:
+            for _ in range(2):
+                cycle += 1
+                signal_sum += _check_signal_strength(cycle, register)
+            register += int(instruction[1])
+
+    return signal_sum
+
+
+def part_b(data, rows: int = 6, columns: int = 40) -> None:
+    image = pd.DataFrame(".", index=range(rows), columns=range(columns))
+    register, cycle = 1, 0
+
+    def _draw(cycle: int, register: int) -> None:
+        c, r = (cycle-1) % 40, (cycle-1) // 40
+        if register-1 <= c <= register+1:
+            image[c][r] = "#"
+
+    for instruction in parse(data):
+        if cycle > rows * columns:
+            break
+        if instruction[0] == "noop":
+            cycle += 1
+            _draw(cycle, register)
+        else:
+            for _ in range(2):
+                cycle += 1
+                _draw(cycle, register)
+            register += int(instruction[1])
+
+    print(image)
@@ -0,0 +1,38 @@
+"""AOC 2022 day 13 as first solved, kept unchanged as the reference of aoc.differential"""
+
+
+import json
+from functools import cmp_to_key
+
+
+def parse(data) -> list:
+    return [[json.loads(e) for e in p.strip().split("\n")] for p in data.strip().split("\n\n")]
+
+
+def compare_lists(left: list, right: list):
+    if left and right:
+        cmp = compare(left[0], right[0])
+        if cmp != 0:
+            return cmp
+        else:
+            return compare(left[1:], right[1:])
+    return compare(len(left), len(right))
+
+
+def compare(left, right):
+    if isinstance(left, int) and isinstance(right, int):
+        return left - right
+    return compare_lists(left if isinstance(left, list) else [left], right if isinstance(right, list) else [right])
+
+
+def part_a(data: str) -> int:
+    return sum(c for c, v in enumerate(parse(data), 1) if compare(*v) < 0)
+
+
+def part_b(data: str) -> int:
+    packets = parse(data)
+    dividers = [[[2]], [[6]]]
+    packets.append(dividers)
+    flat = [elem for pair in packets for elem in pair]
+    srtd = sorted(flat, key=cmp_to_key(compare))
+    return (srtd.index(dividers[0]) + 1) * (srtd.index(dividers[1]) + 1)
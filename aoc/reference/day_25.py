@@ -0,0 +1,30 @@
+"""AOC 2022 day 25 as first solved, kept unchanged as the reference of aoc.differential"""
+
+
+def parse(data: str) -> list:
+    return [[i for i in l] for l in data.strip().split("\n")]
+
+
+def part_a(data: str) -> str:
+    snafu_to_vals = {
+        "2": 2,
+        "1": 1,
+        "0": 0,
+        "-": -1,
+        "=": -2,
+    }
+    vals_to_snafus = {v: k for k, v in snafu_to_vals.items()}
+    snafus = parse(data)
+    max_len = max(len(s) for s in snafus)
+    readable = [[snafu_to_vals[e] for e in s] for s in snafus]
+    snafu_sum = [0] * max_len
+    for r in readable:
+        for c, v in enumerate(r):
+            snafu_sum[c + max_len - len(r)] += v
+    res, over, over_mod = [], 0, 0
+    for i in range(max_len-1, -1, -1):
+        val = snafu_sum[i] + over
+        over = (val + 2) // 5
+        over_mod = (val + 2) % 5 - 2
+        res.insert(0, over_mod)
+    return "".join([vals_to_snafus[e] for e in res])
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+run the solutions of several days in parallel and report timings per part
+usage: python -m aoc.runner [days ...] [--workers N] [--cache] [--max-memory-mb N] [--json]
+"""
+
+
+import argparse
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from contextlib import redirect_stdout
+
+from aoc import days
+from aoc.cache import MISSING
+from aoc.cache import AnswerCache
+from aoc.inputs import puzzle_input
+from aoc.lazy import preload
+
+
+def run_task(task: days.Task, data: str = None, cache: bool = False) -> dict:
+    """solve a single part and measure wall and cpu time
+    NOTE: solutions that print their answer instead of returning it report the printed output as result
+    :param cache: look the answer up in the answer cache first and store it there after solving
+    """
+    report = {"day": task.day, "part": task.part, "result": None, "wall": None, "cpu": None, "error": None,
+              "cached": False}
+    try:
+        module = days.load(task.day)
+        func = getattr(module, task.func)
+        if data is None:
+            data = puzzle_input(task.day)
+        # heavy dependencies would otherwise be charged to the first part using them
+        preload(module)
+        # opening the database is no part of solving or looking up an answer
+        store = AnswerCache() if cache else None
+        wall, cpu = time.perf_counter(), time.process_time()
+        key = store.key(task, data) if cache else None
+        if cache and (result := store.get(key)) is not MISSING:
+            report["cached"] = True
+        else:
+            out = io.StringIO()
+            with redirect_stdout(out):
+                result = func(data, **task.kwargs)
+            if result is None:
+                result = out.getvalue().rstrip()
+            if cache:
+                store.put(key, task, result)
+        report["wall"] = time.perf_counter() - wall
+        report["cpu"] = time.process_time() - cpu
+        report["result"] = result
+    except Exception as e:
+        report["error"] = f"{type(e).__name__}: {e}"
+    return report
+
+
+def run(selected: tuple = days.DAYS, workers: int = None, cache: bool = False, max_memory_mb: int = None) -> list[dict]:
+    """
+    :param max_memory_mb: hard memory ceiling per worker, parts exceeding it report a MemoryError
+    """
+    from aoc.memory import limit_memory
+
+    tasks = days.schedule(selected)
+    limit = {"initializer": limit_memory, "initargs": (max_memory_mb,)} if max_memory_mb else {}
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), **limit) as pool:
+        futures = [pool.submit(run_task, t, None, cache) for t in tasks]
+        reports = [f.result() for f in as_completed(futures)]
+    return sorted(reports, key=lambda r: (r["day"], r["part"]))
+
+
+def format_table(reports: list[dict]) -> str:
+    lines = [f"{'day':>3} {'part':<4} {'wall [s]':>9} {'cpu [s]':>9}  result"]
+    for r in reports:
+        if r["error"] is not None:
+            wall, cpu, result = "-", "-", r["error"]
+        else:
+            wall, cpu, result = f"{r['wall']:.3f}", f"{r['cpu']:.3f}", str(r["result"]).replace("\n", "\n" + " " * 30)
+            if r["cached"]:
+                result += " (cached)"
+        lines.append(f"{r['day']:>3} {r['part']:<4} {wall:>9} {cpu:>9}  {result}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="run all days on a process pool")
+    parser.add_argument("days", nargs="*", type=int, default=days.DAYS)
+    parser.add_argument("--workers", type=int, default=None, help="pool size, defaults to the number of cores")
+    parser.add_argument("--cache", action="store_true", help="reuse answers from the answer cache")
+    parser.add_argument("--max-memory-mb", type=int, default=None, help="hard memory ceiling per worker")
+    parser.add_argument("--json", action="store_true", help="print the reports as json instead of a table")
+    args = parser.parse_args()
+    wall = time.perf_counter()
+    reports = run(tuple(args.days), args.workers, args.cache, args.max_memory_mb)
+    if args.json:
+        print(json.dumps(reports, indent=2, default=str))
+    else:
+        print(format_table(reports))
+        print(f"total wall time: {time.perf_counter() - wall:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
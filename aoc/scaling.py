@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+scaling benchmark on synthetic inputs
+every part is run across a ladder of input sizes, recording time, peak memory and the empirical growth exponent
+usage: python -m aoc.scaling [days ...] [--factors 1 2 4 8] [--no-memory] [--json]
+"""
+
+
+import argparse
+import inspect
+import json
+import math
+import tracemalloc
+
+from aoc import days
+from aoc.generators import generate
+from aoc.generators import solver_args
+from aoc.runner import run_task
+
+# input size for factor 1, see the generators for what size means per day
+# day 20 reads the offsets 1000, 2000 and 3000 from the zero, a list length dividing them always gives 0, hence a prime
+BASE_SIZES = {
+    1: 1000, 2: 10000, 3: 1000, 4: 5000, 5: 500, 6: 10000, 7: 200, 8: 50, 9: 500, 10: 240, 11: 4, 12: 30, 13: 100,
+    14: 10, 15: 5, 16: 12, 17: 40, 18: 300, 19: 1, 20: 503, 21: 200, 22: 100, 23: 15, 24: 12, 25: 100,
+}
+# parts whose solution is tailored to the real puzzle input
+SKIP = {(22, "b")}
+
+
+def scaled(task: days.Task, size: int) -> days.Task:
+    """adapt the arguments of a task to a synthetic input of the given size"""
+    accepted = inspect.signature(getattr(days.load(task.day), task.func)).parameters
+    overrides = {k: v for k, v in solver_args(task.day, size).items() if k in accepted}
+    return task._replace(kwargs=task.kwargs | overrides)
+
+
+def measure(task: days.Task, size: int, seed: int = 0, memory: bool = True) -> dict:
+    data = generate(task.day, size, seed)
+    task = scaled(task, size)
+    report = run_task(task, data)
+    report["size"] = size
+    report["peak"] = None
+    if memory and report["error"] is None:
+        tracemalloc.start()
+        run_task(task, data)
+        report["peak"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return report
+
+
+def growth(reports: list[dict]) -> float | None:
+    """exponent k of time ~ size**k between the smallest and the largest size"""
+    done = [r for r in reports if r["error"] is None and r["wall"] > 0]
+    if len(done) < 2 or done[-1]["size"] == done[0]["size"]:
+        return None
+    return math.log(done[-1]["wall"] / done[0]["wall"]) / math.log(done[-1]["size"] / done[0]["size"])
+
+
+def ladder(day: int, factors: tuple, memory: bool = True) -> list[dict]:
+    results = []
+    for task in days.tasks(day):
+        if (day, task.part) in SKIP:
+            continue
+        reports = [measure(task, BASE_SIZES[day] * f, memory=memory) for f in factors]
+        results.append({"day": day, "part": task.part, "growth": growth(reports), "runs": reports})
+    return results
+
+
+def format_table(results: list[dict]) -> str:
+    lines = [f"{'day':>3} {'part':<4} {'size':>8} {'wall [s]':>9} {'peak [MiB]':>11}"]
+    for res in results:
+        for r in res["runs"]:
+            if r["error"] is not None:
+                lines.append(f"{res['day']:>3} {res['part']:<4} {r['size']:>8}  {r['error']}")
+                continue
+            peak = "-" if r["peak"] is None else f"{r['peak'] / 2 ** 20:.2f}"
+            lines.append(f"{res['day']:>3} {res['part']:<4} {r['size']:>8} {r['wall']:>9.3f} {peak:>11}")
+        if res["growth"] is not None:
+            lines.append(f"{'':>9}growth exponent {res['growth']:.2f}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="run the solutions across a ladder of synthetic input sizes")
+    parser.add_argument("days", nargs="*", type=int, default=days.DAYS)
+    parser.add_argument("--factors", nargs="+", type=int, default=(1, 2, 4, 8), help="multiples of the base size")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run per size")
+    parser.add_argument("--json", action="store_true", help="print the results as json instead of a table")
+    args = parser.parse_args()
+    results = [res for d in args.days for res in ladder(d, tuple(args.factors), memory=not args.no_memory)]
+    if args.json:
+        print(json.dumps(results, indent=2, default=str))
+    else:
+        print(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+graph search on integer node ids
+nodes are numbered from 0 to size - 1 so that distances and visited marks live in flat lists rather than in dicts keyed
+by tuples, the graph itself is given by a neighbours function, every search reports how many nodes it expanded, the
+peak size of its frontier and its run time
+"""
+
+
+from __future__ import annotations
+
+import heapq
+import time
+from collections import deque
+from collections import namedtuple
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+# distance of nodes that have not been reached
+UNREACHED = -1
+
+Stats = namedtuple("Stats", ("expanded", "peak_frontier", "elapsed"))
+
+# found: first goal node taken from the frontier, None if there is no goal or it cannot be reached
+# distance: distance of the found node
+# distances: distance per node id, UNREACHED for nodes the search did not get to
+Search = namedtuple("Search", ("found", "distance", "distances", "stats"))
+
+
+def bfs(neighbours: Callable[[int], Iterable[int]], sources: Iterable[int], size: int,
+        is_goal: Callable[[int], bool] = None) -> Search:
+    """
+    breadth-first search on an unweighted graph, several sources give a multi-source bfs, i.e. the distance to the
+    nearest of them
+    :param neighbours: node ids reachable from a node in one step
+    :param sources: node ids at distance 0
+    :param size: number of node ids
+    :param is_goal: stops the search at the first node it holds for, without a goal the whole component is searched
+    """
+    start = time.perf_counter()
+    distances = [UNREACHED] * size
+    frontier = deque()
+    for s in sources:
+        if distances[s] == UNREACHED:
+            distances[s] = 0
+            frontier.append(s)
+    expanded, peak, found = 0, len(frontier), None
+    while frontier:
+        node = frontier.popleft()
+        expanded += 1
+        if is_goal is not None and is_goal(node):
+            found = node
+            break
+        distance = distances[node] + 1
+        for nxt in neighbours(node):
+            if distances[nxt] == UNREACHED:
+                distances[nxt] = distance
+                frontier.append(nxt)
+        if len(frontier) > peak:
+            peak = len(frontier)
+    return Search(found, None if found is None else distances[found], distances,
+                  Stats(expanded, peak, time.perf_counter() - start))
+
+
+def timed_bfs(advance: Callable[[set[int], int], set[int]], sources: Iterable[int], goals: Iterable[int],
+              depth: int = 0) -> Search:
+    """
+    breadth-first search on a graph that changes with every step, e.g. because obstacles move
+    a whole layer is expanded at once, so a node reached again at a later depth is simply part of that layer and the
+    graph is given by set operations per step, a callback per node costs more than the search itself on large layers
+    :param advance: nodes reachable from a layer in the step that leads to the given depth
+    :param goals: the search stops at the first layer holding any of them
+    :param depth: depth of the sources, e.g. the time a trip starts at
+    """
+    start = time.perf_counter()
+    frontier, goals = set(sources), set(goals)
+    expanded, peak, found = 0, len(frontier), None
+    while frontier:
+        if reached := frontier & goals:
+            found = min(reached)
+            break
+        expanded += len(frontier)
+        depth += 1
+        frontier = advance(frontier, depth)
+        peak = max(peak, len(frontier))
+    return Search(found, None if found is None else depth, None, Stats(expanded, peak, time.perf_counter() - start))
+
+
+def dijkstra(neighbours: Callable[[int], Iterable[tuple[int, int]]], sources: Iterable[int], size: int,
+             is_goal: Callable[[int], bool] = None, heuristic: Callable[[int], int] = None) -> Search:
+    """
+    shortest paths with non-negative edge costs
+    :param neighbours: pairs of node id and edge cost for the edges leaving a node
+    :param heuristic: lower bound of the distance from a node to the nearest goal, turns the search into a*
+    """
+    start = time.perf_counter()
+    distances = [UNREACHED] * size
+    frontier = []
+    for s in sources:
+        distances[s] = 0
+        frontier.append((heuristic(s) if heuristic else 0, 0, s))
+    heapq.heapify(frontier)
+    expanded, peak, found = 0, len(frontier), None
+    while frontier:
+        _, distance, node = heapq.heappop(frontier)
+        # entries superseded by a shorter path are skipped instead of being removed from the heap
+        if distance != distances[node]:
+            continue
+        expanded += 1
+        if is_goal is not None and is_goal(node):
+            found = node
+            break
+        for nxt, cost in neighbours(node):
+            alternative = distance + cost
+            if distances[nxt] == UNREACHED or alternative < distances[nxt]:
+                distances[nxt] = alternative
+                heapq.heappush(frontier, (alternative + heuristic(nxt) if heuristic else alternative, alternative, nxt))
+        if len(frontier) > peak:
+            peak = len(frontier)
+    return Search(found, None if found is None else distances[found], distances,
+                  Stats(expanded, peak, time.perf_counter() - start))
+
+
+def astar(neighbours: Callable[[int], Iterable[tuple[int, int]]], sources: Iterable[int], size: int,
+          is_goal: Callable[[int], bool], heuristic: Callable[[int], int]) -> Search:
+    """dijkstra guided by a consistent heuristic, the first goal taken from the frontier is the nearest one"""
+    return dijkstra(neighbours, sources, size, is_goal, heuristic)
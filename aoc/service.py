@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+warm solver service on a local unix socket
+a pool of worker processes imports all days and their heavy dependencies once, requests are json lines of the form
+{"day": 12, "part": "a", "input": "...", "args": {}} and are answered with the report of aoc.runner.run_task
+with a "deadline" in seconds, days with an anytime mode answer with the best value found in time and a proven flag
+usage: python -m aoc.service serve [--socket path] [--workers N] [--concurrency N] [--timeout S]
+       python -m aoc.service solve 12 a [--input file] [--deadline S] [--socket path]
+"""
+
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import tempfile
+from concurrent.futures import TimeoutError
+
+from pebble import ProcessPool
+
+from aoc import days
+from aoc.lazy import preload
+from aoc.runner import run_task
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), "aoc2022-solver.sock")
+# inputs are sent on a single line, so the stream limit has to exceed the largest input
+LINE_LIMIT = 2 ** 26
+
+
+def warm_up() -> None:
+    """import every day including its lazily loaded dependencies"""
+    for d in days.DAYS:
+        preload(days.load(d))
+
+
+def find_task(day: int, part: str, args: dict = None, deadline: float = None) -> days.Task:
+    """
+    :param deadline: use the anytime variant of the part if the day has one, e.g. part_a_anytime
+    """
+    if day not in days.DAYS:
+        raise LookupError(f"no day {day}")
+    if args is not None and not isinstance(args, dict):
+        raise TypeError(f"args must be an object, not {type(args).__name__}")
+    for task in days.tasks(day):
+        if task.part == part:
+            task = task._replace(kwargs=task.kwargs | (args or {}))
+            if deadline is not None and hasattr(days.load(day), anytime := f"{task.func}_anytime"):
+                task = task._replace(func=anytime, kwargs=task.kwargs | {"seconds": deadline})
+            return task
+    raise LookupError(f"day {day} has no part {part}")
+
+
+class SolverService:
+
+    def __init__(self, workers: int = None, concurrency: int = None, timeout: float = 60.0) -> None:
+        self.workers = workers or os.cpu_count()
+        # forked workers would inherit the sockets of open connections, replacements for workers killed after a
+        # timeout are forked while clients are connected and would keep those connections from closing
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["aoc.runner"])
+        self.pool = ProcessPool(max_workers=self.workers, initializer=warm_up, context=context)
+        self.limit = asyncio.Semaphore(concurrency or 2 * self.workers)
+        self.timeout = timeout
+
+    async def solve(self, request: dict) -> dict:
+        try:
+            if not isinstance(request, dict):
+                raise TypeError(f"request must be an object, not {type(request).__name__}")
+            task = find_task(int(request["day"]), request["part"], request.get("args"), request.get("deadline"))
+        except (KeyError, TypeError, ValueError, LookupError) as e:
+            return {"error": f"invalid request: {e}"}
+        timeout = request.get("timeout", self.timeout)
+        async with self.limit:
+            future = self.pool.schedule(run_task, args=(task, request.get("input")), timeout=timeout)
+            try:
+                report = await asyncio.wrap_future(future)
+                if hasattr(report["result"], "_asdict"):
+                    report["result"] = report["result"]._asdict()
+                return report
+            except TimeoutError:
+                return {"day": task.day, "part": task.part, "error": f"timed out after {timeout} s"}
+            except Exception as e:
+                return {"day": task.day, "part": task.part, "error": f"{type(e).__name__}: {e}"}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        pending = set()
+        lock = asyncio.Lock()
+
+        async def _answer(line: bytes) -> None:
+            try:
+                response = await self.solve(json.loads(line))
+            except json.JSONDecodeError as e:
+                response = {"error": f"invalid json: {e}"}
+            except Exception as e:
+                # every line gets a reply, an unhandled exception would leave the client without one
+                response = {"error": f"{type(e).__name__}: {e}"}
+            async with lock:
+                writer.write(json.dumps(response, default=str).encode() + b"\n")
+                await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                pending.add(t := asyncio.create_task(_answer(line)))
+                t.add_done_callback(pending.discard)
+            await asyncio.gather(*pending)
+        finally:
+            writer.close()
+
+    async def serve(self, path: str = DEFAULT_SOCKET) -> None:
+        if os.path.exists(path):
+            os.unlink(path)
+        server = await asyncio.start_unix_server(self.handle, path=path, limit=LINE_LIMIT)
+        print(f"serving on {path} with {self.workers} workers")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.pool.close()
+            self.pool.join()
+            if os.path.exists(path):
+                os.unlink(path)
+
+
+def request(day: int, part: str, data: str = None, args: dict = None, deadline: float = None,
+            path: str = DEFAULT_SOCKET) -> dict:
+    """send a single request to a running service
+    :param data: puzzle input, the service reads the day's input file if omitted
+    :param deadline: seconds after which days with an anytime mode answer with their best value so far
+    """
+    payload = {"day": day, "part": part, "input": data, "args": args or {}}
+    if deadline is not None:
+        payload["deadline"] = deadline
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(path)
+        s.sendall(json.dumps(payload).encode() + b"\n")
+        s.shutdown(socket.SHUT_WR)
+        with s.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="warm solver service on a unix socket")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve = sub.add_parser("serve")
+    serve.add_argument("--workers", type=int, default=None)
+    serve.add_argument("--concurrency", type=int, default=None, help="requests processed at the same time")
+    serve.add_argument("--timeout", type=float, default=60.0, help="default timeout per request in seconds")
+    solve = sub.add_parser("solve")
+    solve.add_argument("day", type=int)
+    solve.add_argument("part")
+    solve.add_argument("--input", default=None, help="input file, defaults to the day's puzzle input")
+    solve.add_argument("--deadline", type=float, default=None, help="answer with the best value found in time")
+    for p in serve, solve:
+        p.add_argument("--socket", default=DEFAULT_SOCKET)
+    args = parser.parse_args()
+    if args.command == "serve":
+        service = SolverService(args.workers, args.concurrency, args.timeout)
+        try:
+            asyncio.run(service.serve(args.socket))
+        except KeyboardInterrupt:
+            pass
+    else:
+        data = None
+        if args.input is not None:
+            with open(args.input) as f:
+                data = f.read()
+        response = request(args.day, args.part, data, deadline=args.deadline, path=args.socket)
+        print(json.dumps(response, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
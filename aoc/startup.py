@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+startup benchmark checking the import time of every day module against a budget
+each module is imported in a fresh interpreter with -X importtime, heavy dependencies have to be deferred via
+aoc.lazy to stay within budget
+usage: python -m aoc.startup [days ...] [--repeats 5] [--budget-ms 30]
+"""
+
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+
+from aoc import days
+from aoc.inputs import ROOT
+
+# cumulative import time of a day module in ms, days not listed get the default budget
+# most days need about 3 ms on a quiet machine, the stdlib modules some days really need stay well within the default,
+# i.e. json for day 13, re for day 22 and collections via aoc.search and aoc.anytime for days 12, 16, 19 and 24, each
+# about 10 ms, whereas numpy or pandas alone take 100+ ms, a day only gets a budget of its own for a dependency it
+# cannot defer
+BUDGETS_MS = {}
+DEFAULT_BUDGET_MS = 25
+
+
+def import_times(module: str) -> tuple[int, dict[str, int]]:
+    """cumulative import time in us of a module and of its direct dependencies as reported by -X importtime"""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+    block = []
+    for line in proc.stderr.splitlines():
+        if match := re.match(r"import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)", line):
+            cumulative, depth, name = int(match.group(1)), len(match.group(2)) // 2, match.group(3)
+            if depth > 0:
+                block.append((name, cumulative, depth))
+            elif name == module:
+                return cumulative, {n: c for n, c, d in block if d == 1}
+            else:
+                block = []
+    raise RuntimeError(f"{module} missing in the -X importtime output")
+
+
+def measure(day: int, repeats: int = 5) -> dict:
+    """median cumulative import time of a day module and its most expensive direct dependencies"""
+    runs = [import_times(days.module_name(day)) for _ in range(repeats)]
+    heaviest = sorted(runs[-1][1].items(), key=lambda kv: -kv[1])
+    return {
+        "day": day,
+        "ms": statistics.median(r[0] for r in runs) / 1000,
+        "heaviest": [(k, v / 1000) for k, v in heaviest[:3]],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="check the import time of the day modules against a budget")
+    parser.add_argument("days", nargs="*", type=int, default=days.DAYS)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None, help="override the budget for all days")
+    args = parser.parse_args()
+    violations = 0
+    for d in args.days:
+        res = measure(d, args.repeats)
+        budget = args.budget_ms or BUDGETS_MS.get(d, DEFAULT_BUDGET_MS)
+        status = "ok" if res["ms"] <= budget else "OVER BUDGET"
+        violations += status != "ok"
+        heaviest = ", ".join(f"{k} {v:.1f}" for k, v in res["heaviest"])
+        print(f"day {d:>2}: {res['ms']:6.1f} ms (budget {budget:.0f} ms) {status:<11} heaviest: {heaviest}")
+    sys.exit(1 if violations else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,29 +2,123 @@
 """AOC 2022 day 1"""
 
 
-from aocd.models import Puzzle
+from __future__ import annotations
+
+import heapq
+
+from aoc.inputs import puzzle_input
+from aoc.lazy import lazy_import
+from aoc.parsing import CHUNK_SIZE
+from aoc.parsing import blocks
+from aoc.parsing import chunks
+
+np = lazy_import("numpy")
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import BinaryIO
+
+
+def group_sums(calories: np.ndarray, elves: np.ndarray) -> np.ndarray:
+    """calories per elf as a segmented sum starting at the offsets where the elf changes"""
+    if not len(elves):
+        return calories
+    return np.add.reduceat(calories, np.flatnonzero(np.diff(elves, prepend=-1)))
+
+
+def elf_totals(data: str | bytes) -> np.ndarray:
+    return group_sums(*blocks(data, signed=False, separators=b"\n"))
+
+
+def prepare(data) -> list[int]:
+    return elf_totals(data).tolist()
+
+
+class TopCalories:
+    """largest totals seen so far in a min-heap bounded to num_elves entries"""
+
+    def __init__(self, num_elves: int) -> None:
+        if num_elves < 1:
+            raise ValueError(f"num_elves must be at least 1, not {num_elves}")
+        self.num_elves = num_elves
+        self.heap = []
+
+    def push(self, totals: Iterable[int]) -> None:
+        for total in totals:
+            if len(self.heap) < self.num_elves:
+                heapq.heappush(self.heap, total)
+            elif total > self.heap[0]:
+                heapq.heapreplace(self.heap, total)
+
+    def result(self) -> tuple[int, int]:
+        """most calories of a single elf and the sum of the top elves, 0 for both if there are no elves"""
+        return max(self.heap, default=0), sum(self.heap)
+
+
+def top_calories(inventory: list[int], num_elves: int) -> int:
+    top = TopCalories(num_elves)
+    top.push(inventory)
+    return top.result()[1]
+
+
+def stream_calories(source: str | BinaryIO, num_elves: int = 3, chunk_size: int = CHUNK_SIZE) -> tuple[int, int]:
+    """
+    both answers in one pass over a file of any size, only a chunk and the heap are held in memory
+    :param source: path or file opened in binary mode
+    """
+    top, carry = TopCalories(num_elves), None
+    for chunk in chunks(source, chunk_size):
+        calories, elves = blocks(chunk, signed=False, separators=b"\n")
+        # the elf carried over from the previous chunk is complete if a blank line comes first
+        if carry is not None and (chunk.startswith(b"\n") or not len(elves) or elves[0] > 0):
+            top.push([carry])
+            carry = None
+        if not len(elves):
+            continue
+        totals = group_sums(calories, elves).tolist()
+        if carry is not None:
+            totals[0] += carry
+        # totals below the smallest one kept cannot make it into the heap
+        if len(top.heap) == top.num_elves:
+            top.push(t for t in totals[:-1] if t > top.heap[0])
+        else:
+            top.push(totals[:-1])
+        carry = totals[-1]
+        if chunk.endswith(b"\n\n"):
+            top.push([carry])
+            carry = None
+    if carry is not None:
+        top.push([carry])
+    return top.result()
+
+
+def calories_numpy(data: str | bytes, num_elves: int = 3) -> tuple[int, int]:
+    """both answers for an inventory held in memory, the top elves are selected by a partial sort"""
+    if num_elves < 1:
+        raise ValueError(f"num_elves must be at least 1, not {num_elves}")
+    totals = elf_totals(data)
+    if not len(totals):
+        return 0, 0
+    cut = len(totals) - min(num_elves, len(totals))
+    return int(totals.max()), int(np.partition(totals, cut)[cut:].sum())
 
 
 def part_a(data) -> int:
-    inventory = [sum([int(m) for m in i.split("\n")]) for i in data.split("\n\n")]
-    return max(inventory)
+    return max(prepare(data), default=0)
 
 
 def part_b(data, num_elves: int = 3) -> int:
-    inventory = [sum([int(m) for m in i.split("\n")]) for i in data.split("\n\n")]
-    maxcal = inventory[:num_elves]
-    maxcal.sort(reverse=True)
-    for i in inventory[num_elves:]:
-        if i > maxcal[-1]:
-            maxcal.pop()
-            maxcal.append(i)
-            maxcal.sort(reverse=True)
-    return sum(maxcal)
+    return top_calories(prepare(data), num_elves)
+
+
+def solve(inventory: list[int], num_elves: int = 3) -> tuple:
+    return max(inventory, default=0), top_calories(inventory, num_elves)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=1)
+    data = puzzle_input(1)
     print("Part A")
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
     print("Part B")
-    print(part_b(puzzle.input_data, 3))
+    print(part_b(data, 3))
@@ -2,32 +2,69 @@
 """AOC 2022 day 2"""
 
 
-from aocd.models import Puzzle
+from __future__ import annotations
+
+from aoc.inputs import puzzle_input
+from aoc.lazy import lazy_import
+from aoc.parsing import as_buffer
+
+np = lazy_import("numpy")
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# score per pair code opp * 3 + second column, the second column is my shape in part a and the result in part b
+SCORES_A = [3 * ((me - opp + 1) % 3) + me + 1 for opp in range(3) for me in range(3)]
+SCORES_B = [3 * res + (opp + res - 1) % 3 + 1 for opp in range(3) for res in range(3)]
+
+
+def pair_codes(data: str | bytes) -> np.ndarray:
+    """code opp * 3 + second column per round, read from the letters in the raw bytes"""
+    buf = as_buffer(data)
+    opp = buf[(buf >= ord("A")) & (buf <= ord("C"))]
+    second = buf[(buf >= ord("X")) & (buf <= ord("Z"))]
+    return (opp - ord("A")) * 3 + (second - ord("X"))
+
+
+def prepare(data) -> np.ndarray:
+    """number of rounds per pair code"""
+    return np.bincount(pair_codes(data), minlength=9)
+
+
+def score_a(counts: np.ndarray) -> int:
+    return int(counts @ SCORES_A)
+
+
+def score_b(counts: np.ndarray) -> int:
+    return int(counts @ SCORES_B)
+
+
+def score_guides(guides: Iterable[str | bytes]) -> np.ndarray:
+    """scores of many strategy guides at once, one row of part a and part b per guide"""
+    guides = [g.encode() if isinstance(g, str) else bytes(g) for g in guides]
+    rounds = [g.count(b"A") + g.count(b"B") + g.count(b"C") for g in guides]
+    # one histogram over all guides, the guide index selects the block of nine codes
+    codes = np.repeat(np.arange(len(guides)), rounds) * 9 + pair_codes(b"\n".join(guides))
+    counts = np.bincount(codes, minlength=9 * len(guides)).reshape(-1, 9)
+    return counts @ np.array([SCORES_A, SCORES_B]).T
 
 
 def part_a(data) -> int:
-    points = 0
-    for r in [i.split() for i in data.split("\n")]:
-        opp = "ABC".index(r[0])
-        me = "XYZ".index(r[1])
-        res = (me - opp + 1) % 3
-        points += 3 * res + me + 1
-    return points
+    return score_a(prepare(data))
 
 
 def part_b(data) -> int:
-    points = 0
-    for r in [i.split() for i in data.split("\n")]:
-        opp = "ABC".index(r[0])
-        res = "XYZ".index(r[1])
-        me = (opp + res - 1) % 3
-        points += 3 * res + me + 1
-    return points
+    return score_b(prepare(data))
+
+
+def solve(counts: np.ndarray) -> tuple:
+    return score_a(counts), score_b(counts)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=2)
+    data = puzzle_input(2)
     print("Part A")
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
     print("Part B")
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
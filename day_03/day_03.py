@@ -2,40 +2,72 @@
 """AOC 2022 day 3"""
 
 
-import string
+from __future__ import annotations
 
-from aocd.models import Puzzle
+from aoc.inputs import puzzle_input
+from aoc.lazy import lazy_import
+from aoc.parsing import NEWLINE
+from aoc.parsing import as_buffer
 
+np = lazy_import("numpy")
 
-def first_common_elem(stra: str, strb: str) -> str:
-    for a in set(stra):
-        for b in set(strb):
-            if a == b:
-                return a
+# string.ascii_letters, spelled out since importing string takes longer than the whole day
+ITEMS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+PRIORITIES = {v: c + 1 for c, v in enumerate(ITEMS)}
+# 2 is a primitive root modulo 67, so the powers of two below 2**63 leave distinct remainders and the bit of a mask with
+# a single item is found by a table lookup
+BIT_MODULUS = 67
+
+
+def item_masks(data: str | bytes) -> tuple[np.ndarray, np.ndarray]:
+    """masks of both compartments of all rucksacks, an item is the bit below its priority"""
+    buf = as_buffer(data.strip())
+    if not len(buf):
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    table = np.zeros(256, dtype=np.int64)
+    table[list(ITEMS.encode())] = [1 << p - 1 for p in PRIORITIES.values()]
+    starts = np.concatenate(([0], np.flatnonzero(buf == NEWLINE) + 1))
+    lengths = np.append(starts[1:] - 1, len(buf)) - starts
+    # the newline maps to no item, so it may end up in the second compartment
+    halves = np.bitwise_or.reduceat(table[buf], np.column_stack((starts, starts + lengths // 2)).ravel())
+    return halves[::2], halves[1::2]
+
+
+def priorities(masks: np.ndarray) -> np.ndarray:
+    """priority of the lowest item of each mask, i.e. of the single common item, 0 for empty masks"""
+    lookup = np.zeros(BIT_MODULUS, dtype=np.int64)
+    lookup[[(1 << k) % BIT_MODULUS for k in range(63)]] = np.arange(1, 64)
+    return lookup[(masks & -masks) % BIT_MODULUS]
+
+
+def compartment_priorities(first: np.ndarray, second: np.ndarray) -> int:
+    return int(priorities(first & second).sum())
+
+
+def badge_priorities(first: np.ndarray, second: np.ndarray) -> int:
+    groups = np.bitwise_and.reduce((first | second)[:len(first) // 3 * 3].reshape(-1, 3), axis=1)
+    return int(priorities(groups).sum())
+
+
+def prepare(data) -> tuple[np.ndarray, np.ndarray]:
+    return item_masks(data)
 
 
 def part_a(data):
-    priorities = {v: c+1 for c, v in enumerate(string.ascii_letters)}
-    rucksacks = [(i[:len(i)//2], i[len(i)//2:]) for i in data.split("\n")]
-    prio_sum = 0
-    for r in rucksacks:
-        prio_sum += priorities[first_common_elem(r[0], r[1])]
-    return prio_sum
+    return compartment_priorities(*prepare(data))
 
 
 def part_b(data):
-    priorities = {v: c + 1 for c, v in enumerate(string.ascii_letters)}
-    rucksacks = [i for i in data.split("\n")]
-    prio_sum = 0
-    for i in range(len(rucksacks) // 3):
-        e1, e2, e3 = rucksacks[i*3:i*3+3]
-        prio_sum += priorities[first_common_elem("".join(set(e1) & set(e2)), e3)]
-    return prio_sum
+    return badge_priorities(*prepare(data))
+
+
+def solve(masks: tuple[np.ndarray, np.ndarray]) -> tuple:
+    return compartment_priorities(*masks), badge_priorities(*masks)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=3)
+    data = puzzle_input(3)
     print("Part A")
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
     print("Part B")
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
@@ -2,26 +2,70 @@
 """AOC 2022 day 4"""
 
 
-from aocd.models import Puzzle
+from __future__ import annotations
 
+from aoc.inputs import puzzle_input
+from aoc.lazy import lazy_import
+from aoc.parsing import CHUNK_SIZE
+from aoc.parsing import records
+from aoc.parsing import stream_records
 
-def both(data) -> tuple:
-    assignments = [i.split(",") for i in data.split("\n")]
+np = lazy_import("numpy")
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import BinaryIO
+
+
+def prepare(data) -> np.ndarray:
+    """assignments as rows l1, u1, l2, u2"""
+    # the dash separates the section ids, it is no sign
+    return records(data, 4, signed=False, separators=b"-,\n")
+
+
+def subsumed(assignments: np.ndarray) -> np.ndarray:
+    """whether one range of a pair contains the other"""
+    l1, u1, l2, u2 = assignments.T
+    return (l1 <= l2) & (u1 >= u2) | (l1 >= l2) & (u1 <= u2)
+
+
+def overlapping(assignments: np.ndarray) -> np.ndarray:
+    l1, u1, l2, u2 = assignments.T
+    return (l1 <= u2) & (l2 <= u1)
+
+
+def overlap_indices(assignments: np.ndarray, contained: bool = False) -> np.ndarray:
+    """
+    indices of the pairs that overlap
+    :param contained: only pairs where one range contains the other
+    """
+    return np.flatnonzero(subsumed(assignments) if contained else overlapping(assignments))
+
+
+def solve(assignments: np.ndarray) -> tuple:
+    return int(subsumed(assignments).sum()), int(overlapping(assignments).sum())
+
+
+def stream_counts(source: str | BinaryIO, chunk_size: int = CHUNK_SIZE) -> tuple[int, int]:
+    """
+    both answers for a file of any size, read chunk by chunk
+    :param source: path or file opened in binary mode
+    """
     subsumptions, overlaps = 0, 0
-    for a in assignments:
-        l1, u1 = a[0].split("-")
-        l2, u2 = a[1].split("-")
-        if int(l1) <= int(l2) and int(u1) >= int(u2) or int(l1) >= int(l2) and int(u1) <= int(u2):
-            subsumptions += 1
-        if int(l2) <= int(l1) <= int(u2) or int(l2) <= int(u1) <= int(u2) or \
-                int(l1) <= int(l2) <= int(u1) or int(l1) <= int(u2) <= int(u1):
-            overlaps += 1
+    for assignments in stream_records(source, 4, signed=False, chunk_size=chunk_size, separators=b"-,\n"):
+        sub, ovl = solve(assignments)
+        subsumptions += sub
+        overlaps += ovl
     return subsumptions, overlaps
 
 
+def both(data) -> tuple:
+    return solve(prepare(data))
+
+
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=4)
-    solution_a, solution_b = both(puzzle.input_data)
+    data = puzzle_input(4)
+    solution_a, solution_b = both(data)
     print("Part A")
     print(solution_a)
     print("Part B")
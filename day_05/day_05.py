@@ -2,55 +2,87 @@
 """AOC 2022 day 5"""
 
 
-from aocd.models import Puzzle
+from aoc.grid import load_grid
+from aoc.inputs import puzzle_input
+from aoc.parsing import records
 
 
 def load_data(data) -> tuple:
+    """stacks as bytearrays from bottom to top and moves as amount, source, sink"""
     stack_data, moves_data = data.split("\n\n")
     # init stacks
-    stack_data = stack_data.split("\n")
-    stacks = {k: [] for k in range(1, len(stack_data[-1].split())+1)}
-    for row in stack_data[-2::-1]:
-        for k in stacks.keys():
-            crate = row[1 + 4 * (k-1)]
-            if crate != " ":
-                stacks[k].append(crate)
+    num_stacks = len(stack_data.rstrip().split("\n")[-1].split())
+    columns = load_grid(stack_data, fill=b" ")[-2::-1, 1::4]
+    stacks = {k: bytearray(columns[:, k-1].tobytes().rstrip(b" ")) for k in range(1, num_stacks+1)}
     # split moves
-    moves_data = moves_data.split("\n")
-    moves = [[int(v) for c, v in enumerate(m.split()) if c % 2 == 1] for m in moves_data]
+    moves = records(moves_data, 3, signed=False, separators=b"move from to\n").tolist()
     return stacks, moves
 
 
-def part_a(data):
+def crate_mover_9000(stacks: dict, moves: list) -> str:
+    """each move is one reversed slice, as the crates are lifted one at a time"""
+    stacks = {k: v.copy() for k, v in stacks.items()}
+    for amount, source, sink in moves:
+        cut = len(stacks[source]) - amount
+        stacks[sink] += stacks[source][:cut-1 if cut else None:-1]
+        del stacks[source][cut:]
+    return "".join([chr(stacks[k][-1]) for k in stacks.keys() if stacks[k]])
+
+
+def crate_mover_9001(stacks: dict, moves: list) -> str:
+    stacks = {k: v.copy() for k, v in stacks.items()}
+    for amount, source, sink in moves:
+        cut = len(stacks[source]) - amount
+        stacks[sink] += stacks[source][cut:]
+        del stacks[source][cut:]
+    return "".join([chr(stacks[k][-1]) for k in stacks.keys() if stacks[k]])
+
+
+def top_crates(stacks: dict, moves: list, reverse: bool) -> str:
+    """
+    top crates without moving any crate, each final top is traced back through the moves to its initial position
+    :param reverse: whether a move reverses the order of the crates, i.e. the CrateMover 9000
+    """
+    heights = {k: len(v) for k, v in stacks.items()}
+    for amount, source, sink in moves:
+        heights[source] -= amount
+        heights[sink] += amount
+    # positions as stack and height of the crates that end up on top
+    positions = {k: (k, heights[k] - 1) for k in stacks.keys() if heights[k]}
+    for amount, source, sink in reversed(moves):
+        heights[source] += amount
+        heights[sink] -= amount
+        for k, (stack, height) in positions.items():
+            if stack == sink and height >= heights[sink]:
+                offset = height - heights[sink]
+                positions[k] = source, heights[source] - 1 - offset if reverse else heights[source] - amount + offset
+    return "".join([chr(stacks[stack][height]) for stack, height in positions.values()])
+
+
+def top_crates_traced(data) -> tuple:
     stacks, moves = load_data(data)
+    return top_crates(stacks, moves, reverse=True), top_crates(stacks, moves, reverse=False)
 
-    def _move(source: int, sink: int) -> None:
-        stacks[sink].append(stacks[source].pop())
 
-    for m in moves:
-        for _ in range(m[0]):
-            _move(m[1], m[2])
+def prepare(data) -> tuple:
+    return load_data(data)
 
-    return "".join([stacks[k][-1] for k in stacks.keys() if stacks[k]])
 
+def part_a(data):
+    return crate_mover_9000(*prepare(data))
 
-def part_b(data):
-    stacks, moves = load_data(data)
 
-    def _move(source: int, sink: int, amount: int) -> None:
-        stacks[sink].extend(stacks[source][-amount:])
-        for _ in range(amount):
-            stacks[source].pop()
+def part_b(data):
+    return crate_mover_9001(*prepare(data))
 
-    for m in moves:
-        _move(m[1], m[2], m[0])
 
-    return "".join([stacks[k][-1] for k in stacks.keys() if stacks[k]])
+def solve(model: tuple) -> tuple:
+    return crate_mover_9000(*model), crate_mover_9001(*model)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=5)
+    data = puzzle_input(5)
     print("Part A")
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
     print("Part B")
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
@@ -2,22 +2,96 @@
 """AOC 2022 day 6"""
 
 
-from aocd.models import Puzzle
+from __future__ import annotations
+
+import os
+
+from aoc.inputs import puzzle_input
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import BinaryIO
+
+CHUNK_SIZE = 1 << 16
+
+
+class MarkerScanner:
+    """
+    finds the first window of distinct characters for several window lengths in one pass over a stream
+    the last position of every byte value gives the start of the run of distinct bytes ending at the current byte, a
+    marker of any length ends where that run first reaches the length, so all lengths share one table and one step
+    per byte
+    :param lengths: window lengths, e.g. 4 for the start-of-packet and 14 for the start-of-message marker
+    """
+
+    def __init__(self, lengths: tuple = (4, 14)) -> None:
+        self.found = {ln: None for ln in lengths}
+        # lengths still searched for, shortest first, as the run reaches them in this order
+        self.pending = sorted(set(lengths))
+        self.last = [-1] * 256
+        self.start = 0
+        self.pos = 0
+
+    @property
+    def done(self) -> bool:
+        return not self.pending
+
+    def feed(self, chunk: bytes) -> bool:
+        """scan the next chunk of the stream, returns whether all markers have been found"""
+        if not self.pending:
+            return True
+        last, start, pending = self.last, self.start, self.pending
+        need = pending[0] - 1
+        for i, c in enumerate(chunk, self.pos):
+            if last[c] >= start:
+                start = last[c] + 1
+            last[c] = i
+            if i - start >= need:
+                while pending and i - start >= pending[0] - 1:
+                    self.found[pending.pop(0)] = i + 1
+                if not pending:
+                    break
+                need = pending[0] - 1
+        self.start = start
+        self.pos += len(chunk)
+        return self.done
+
+
+def scan(source: int | BinaryIO, lengths: tuple = (4, 14), chunk_size: int = CHUNK_SIZE) -> dict[int, int | None]:
+    """
+    marker positions per window length in a stream read chunk by chunk, reading stops once all are found
+    :param source: file descriptor or file opened in binary mode
+    """
+    scanner = MarkerScanner(lengths)
+    read = (lambda: os.read(source, chunk_size)) if isinstance(source, int) else (lambda: source.read(chunk_size))
+    while chunk := read():
+        if scanner.feed(chunk):
+            break
+    return scanner.found
+
+
+def markers(datastream: str | bytes, lengths: tuple = (4, 14)) -> dict[int, int | None]:
+    scanner = MarkerScanner(lengths)
+    scanner.feed(datastream.encode() if isinstance(datastream, str) else datastream)
+    return scanner.found
 
 
 def both(data, ln: int) -> int:
-    pos, mem = ln, list(data[:ln])
-    for char in data[ln:]:
-        if len(set(mem)) == ln:
-            return pos
-        mem.pop(0)
-        mem.append(char)
-        pos += 1
+    return markers(data, (ln,))[ln]
+
+
+def prepare(data) -> str:
+    return data
+
+
+def solve(datastream: str) -> tuple:
+    found = markers(datastream, (4, 14))
+    return found[4], found[14]
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=6)
+    data = puzzle_input(6)
     print("Part A")
-    print(both(puzzle.input_data, ln=4))
+    print(both(data, ln=4))
     print("Part B")
-    print(both(puzzle.input_data, ln=14))
+    print(both(data, ln=14))
@@ -4,7 +4,8 @@
 
 from __future__ import annotations
 
-from aocd.models import Puzzle
+from aoc.inputs import puzzle_input
+from aoc.inputs import read_text
 
 
 class File:
@@ -60,9 +61,13 @@ def parse(data) -> Folder:
     return root
 
 
-def part_a(data) -> int:
+def prepare(data) -> Folder:
     root = parse(data)
     root.update_size()
+    return root
+
+
+def sum_of_small_folders(root: Folder) -> int:
 
     def _dive_in(folder: Folder) -> int:
         sum_of_sizes = 0
@@ -75,10 +80,7 @@ def part_a(data) -> int:
     return _dive_in(root)
 
 
-def part_b(data) -> int:
-    root = parse(data)
-    root.update_size()
-
+def size_to_delete(root: Folder) -> int:
     required_size = 30000000 - (70000000 - root.size)
     assert root.size >= required_size, "not enough disk space available"
 
@@ -91,15 +93,26 @@ def part_b(data) -> int:
     return _dive_in(root, root.size)
 
 
+def part_a(data) -> int:
+    return sum_of_small_folders(prepare(data))
+
+
+def part_b(data) -> int:
+    return size_to_delete(prepare(data))
+
+
+def solve(root: Folder) -> tuple:
+    return sum_of_small_folders(root), size_to_delete(root)
+
+
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=7)
-    with open("test.txt") as f:
-        txt = f.read()
+    data = puzzle_input(7)
+    txt = read_text(7, "test.txt")
 
     assert part_a(txt) == 95437, "calculating sum of sizes failed"
     print("Part A")
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
 
     assert part_b(txt) == 24933642, "finding size of directory to be deleted failed"
     print("Part B")
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
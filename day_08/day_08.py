@@ -2,17 +2,22 @@
 """AOC 2022 day 8"""
 
 
-import numpy as np
-from aocd.models import Puzzle
+from __future__ import annotations
+
+from aoc.grid import load_grid
+from aoc.inputs import puzzle_input
+from aoc.inputs import read_text
+from aoc.lazy import lazy_import
+
+np = lazy_import("numpy")
 
 
 def parse(data) -> np.ndarray:
-    grid = np.asarray([[int(i) for i in row] for row in data.split("\n") if row])
+    grid = load_grid(data).astype(int) - ord("0")
     return np.pad(array=grid, pad_width=1, mode='constant', constant_values=-1)
 
 
-def part_a(data) -> int:
-    grid = parse(data)
+def visible_trees(grid: np.ndarray) -> int:
     trees_quantity = (grid.shape[0]-2) * (grid.shape[1]-2)
 
     def _iterate(lst: list, start: int, move_dir: int) -> list:
@@ -51,8 +56,7 @@ def part_a(data) -> int:
     return trees_quantity - len(set.intersection(from_left, from_right, from_top, from_bottom))
 
 
-def part_b(data):
-    grid = parse(data)
+def best_scenic_score(grid: np.ndarray) -> int:
     max_score = 0
     for x in range(1, grid.shape[0]-1):
         for y in range(1, grid.shape[1]-1):
@@ -73,17 +77,32 @@ def part_b(data):
     return max_score
 
 
+def prepare(data) -> np.ndarray:
+    return parse(data)
+
+
+def part_a(data) -> int:
+    return visible_trees(prepare(data))
+
+
+def part_b(data) -> int:
+    return best_scenic_score(prepare(data))
+
+
+def solve(grid: np.ndarray) -> tuple:
+    return visible_trees(grid), best_scenic_score(grid)
+
+
 if __name__ == "__main__":
-    with open("test.txt") as f:
-        test = f.read()
-    puzzle = Puzzle(year=2022, day=8)
+    test = read_text(8, "test.txt")
+    data = puzzle_input(8)
 
     print("Part A")
     test_res = part_a(test)
     assert test_res == 21, f"{test_res} is the wrong result for test"
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
 
     print("Part B")
     test_res = part_b(test)
     assert test_res == 8, f"{test_res} is the wrong result for test"
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
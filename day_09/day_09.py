@@ -2,77 +2,98 @@
 """AOC 2022 day 9"""
 
 
-from aocd.models import Puzzle
+from __future__ import annotations
+
+from aoc.coordset import pack_array
+from aoc.inputs import puzzle_input
+from aoc.inputs import read_text
+from aoc.lazy import lazy_import
+from aoc.parsing import integers
+
+np = lazy_import("numpy")
+
+STEPS = {
+    "L": (-1, 0),
+    "R": (1, 0),
+    "U": (0, 1),
+    "D": (0, -1),
+}
 
 
 def parse(data):
-    return [[i.split()[0], int(i.split()[1])] for i in data.split("\n") if i]
-
-
-def move(coords: tuple, direction: str) -> tuple:
-    moves = {
-        "L": (-1, 0),
-        "R": (1, 0),
-        "U": (0, 1),
-        "D": (0, -1),
-    }
-    return coords[0]+moves[direction][0], coords[1]+moves[direction][1]
-
-
-def follow(pos1: tuple, pos2: tuple) -> tuple:
-    if abs(pos1[0]-pos2[0]) <= 1 and abs(pos1[1]-pos2[1]) <= 1:
-        return pos2
-    if pos1[0] == pos2[0]:
-        x = pos1[0]
-    elif abs(pos1[0] - pos2[0]) == 1:
-        x = pos1[0]
-    else:
-        x = (pos1[0] + pos2[0]) // 2
-    if pos1[1] == pos2[1]:
-        y = pos1[1]
-    elif abs(pos1[1]-pos2[1]) <= 1:
-        y = pos1[1]
-    else:
-        y = (pos1[1] + pos2[1]) // 2
-    return x, y
+    steps = integers(data, signed=False, separators=b"LRUD \n").tolist()
+    return [[d, s] for d, s in zip(data.split()[::2], steps, strict=True)]
+
+
+def head_trail(moves: list) -> np.ndarray:
+    """positions of the head after every single step, starting at the origin"""
+    steps = np.array([STEPS[d] for d, _ in moves], dtype=np.int64).reshape(-1, 2)
+    steps = np.repeat(steps, [s for _, s in moves], axis=0)
+    return np.cumsum(np.concatenate(([[0, 0]], steps)), axis=0)
+
+
+def follow_trail(xs: list, ys: list) -> tuple[list, list]:
+    """
+    x and y coordinates of a knot following another one along its trail, the knot steps towards the one ahead of it
+    once they are no longer adjacent, diagonally if they share neither row nor column
+    a knot only moves when the one ahead of it does, so only the positions it moved to are kept and every further knot
+    has fewer steps to follow
+    """
+    tx, ty = xs[0], ys[0]
+    fx, fy = [tx], [ty]
+    for hx, hy in zip(xs, ys):
+        dx = hx - tx
+        dy = hy - ty
+        if dx > 1 or dx < -1 or dy > 1 or dy < -1:
+            tx += (dx > 0) - (dx < 0)
+            ty += (dy > 0) - (dy < 0)
+            fx.append(tx)
+            fy.append(ty)
+    return fx, fy
+
+
+def visited_by_tail(moves: list, knots: int) -> int:
+    trail = head_trail(moves)
+    xs, ys = trail[:, 0].tolist(), trail[:, 1].tolist()
+    for _ in range(knots - 1):
+        xs, ys = follow_trail(xs, ys)
+    return len(np.unique(pack_array(np.column_stack((xs, ys)))))
+
+
+def tail_positions(moves: list) -> int:
+    return visited_by_tail(moves, 2)
+
+
+def rope_positions(moves: list) -> int:
+    return visited_by_tail(moves, 10)
+
+
+def prepare(data) -> list:
+    return parse(data)
 
 
 def part_a(data) -> int:
-    moves = parse(data)
-    head, tail = (0, 0), (0, 0)
-    visited = {tail}
-    for m in moves:
-        for _ in range(m[1]):
-            head = move(head, m[0])
-            tail = follow(head, tail)
-            visited.add(tail)
-    return len(visited)
+    return tail_positions(prepare(data))
 
 
 def part_b(data) -> int:
-    moves = parse(data)
-    rope = [(0, 0) for _ in range(10)]
-    visited = {rope[-1]}
-    for m in moves:
-        for _ in range(m[1]):
-            rope[0] = move(rope[0], m[0])
-            for i in range(1, 10):
-                rope[i] = follow(rope[i-1], rope[i])
-            visited.add(rope[-1])
-    return len(visited)
+    return rope_positions(prepare(data))
+
+
+def solve(moves: list) -> tuple:
+    return tail_positions(moves), rope_positions(moves)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=9)
-    with open("test.txt") as f:
-        test = f.read()
+    data = puzzle_input(9)
+    test = read_text(9, "test.txt")
 
     print("Part A")
     assert part_a(test) == 13
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
 
     print("Part B")
     assert part_b(test) == 1
     test_2 = """R 5\nU 8\nL 8\nD 3\nR 17\nD 10\nL 25\nU 20\n"""
     assert part_b(test_2) == 36
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
@@ -2,15 +2,23 @@
 """AOC 2022 day 10"""
 
 
-import pandas as pd
-from aocd.models import Puzzle
+from __future__ import annotations
+
+from aoc.inputs import puzzle_input
+from aoc.inputs import read_text
+from aoc.lazy import lazy_import
+from aoc.parsing import integers
+
+pd = lazy_import("pandas")
 
 
 def parse(data) -> list:
-    return [l.split() for l in data.split("\n") if l]
+    """instructions as ("noop",) or ("addx", value)"""
+    values = iter(integers(data, separators=b"addx noop\n").tolist())
+    return [("noop",) if l == "noop" else ("addx", next(values)) for l in data.split("\n") if l]
 
 
-def part_a(data):
+def signal_strength(instructions: list) -> int:
     register, cycle = 1, 0
     signal_sum = 0
 
@@ -19,7 +27,7 @@ def part_a(data):
             return cycle * register
         return 0
 
-    for instruction in parse(data):
+    for instruction in instructions:
         if cycle > 220:
             break
         if instruction[0] == "noop":
@@ -29,12 +37,12 @@ def part_a(data):
             for _ in range(2):
                 cycle += 1
                 signal_sum += _check_signal_strength(cycle, register)
-            register += int(instruction[1])
+            register += instruction[1]
 
     return signal_sum
 
 
-def part_b(data, rows: int = 6, columns: int = 40) -> None:
+def render(instructions: list, rows: int = 6, columns: int = 40) -> pd.DataFrame:
     image = pd.DataFrame(".", index=range(rows), columns=range(columns))
     register, cycle = 1, 0
 
@@ -43,7 +51,7 @@ def part_b(data, rows: int = 6, columns: int = 40) -> None:
         if register-1 <= c <= register+1:
             image[c][r] = "#"
 
-    for instruction in parse(data):
+    for instruction in instructions:
         if cycle > rows * columns:
             break
         if instruction[0] == "noop":
@@ -53,23 +61,38 @@ def part_b(data, rows: int = 6, columns: int = 40) -> None:
             for _ in range(2):
                 cycle += 1
                 _draw(cycle, register)
-            register += int(instruction[1])
+            register += instruction[1]
+
+    return image
+
+
+def prepare(data) -> list:
+    return parse(data)
+
+
+def part_a(data) -> int:
+    return signal_strength(prepare(data))
+
+
+def part_b(data, rows: int = 6, columns: int = 40) -> None:
+    print(render(prepare(data), rows, columns))
+
 
-    print(image)
+def solve(instructions: list, rows: int = 6, columns: int = 40) -> tuple:
+    return signal_strength(instructions), render(instructions, rows, columns)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=10)
-    with open("test.txt") as f:
-        test = f.read()
+    data = puzzle_input(10)
+    test = read_text(10, "test.txt")
 
     print("Part A")
     assert part_a(test) == 13140
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
 
     print("Part B")
     print("NOTE: take a step back to see the pattern more clearly")
     print("Image for test case:")
     part_b(test)
     print("Puzzle result:")
-    part_b(puzzle.input_data)
+    part_b(data)
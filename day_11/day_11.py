@@ -6,7 +6,8 @@ from __future__ import annotations
 
 import math
 
-from aocd.models import Puzzle
+from aoc.inputs import puzzle_input
+from aoc.inputs import read_text
 
 
 def parse(data) -> list:
@@ -83,8 +84,7 @@ class Monkey:
                 raise Exception("invalid operation_type for monkey test")
 
 
-def monkey_init(data) -> list:
-    monkey_data = parse(data)
+def monkey_init(monkey_data: list) -> list:
     monkeys = []
     for m in monkey_data:
         monkeys.append(Monkey(*list(m.values())[:-2]))
@@ -93,34 +93,40 @@ def monkey_init(data) -> list:
     return monkeys
 
 
-def part_a(data, rounds: int = 20):
-    monkeys = monkey_init(data)
+def monkey_business(monkey_data: list, rounds: int, relief: bool = True) -> int:
+    monkeys = monkey_init(monkey_data)
+    supermod = None if relief else math.prod(m.test_value for m in monkeys)
     for _ in range(rounds):
         for m in monkeys:
-            m.run()
+            m.run(supermod=supermod)
     inspections = sorted([m.inspection_count for m in monkeys], reverse=True)
     return inspections[0] * inspections[1]
 
 
+def prepare(data) -> list:
+    return parse(data)
+
+
+def part_a(data, rounds: int = 20):
+    return monkey_business(prepare(data), rounds)
+
+
 def part_b(data, rounds: int = 10000):
-    monkeys = monkey_init(data)
-    supermod = math.prod(m.test_value for m in monkeys)
-    for _ in range(rounds):
-        for m in monkeys:
-            m.run(supermod=supermod)
-    inspections = sorted([m.inspection_count for m in monkeys], reverse=True)
-    return inspections[0] * inspections[1]
+    return monkey_business(prepare(data), rounds, relief=False)
+
+
+def solve(monkey_data: list, rounds_a: int = 20, rounds_b: int = 10000) -> tuple:
+    return monkey_business(monkey_data, rounds_a), monkey_business(monkey_data, rounds_b, relief=False)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=11)
-    with open("test.txt") as f:
-        test = f.read()
+    data = puzzle_input(11)
+    test = read_text(11, "test.txt")
 
     print("Part A")
     assert part_a(test) == 10605
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
 
     print("Part B")
     assert part_b(test) == 2713310158
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
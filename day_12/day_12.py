@@ -2,137 +2,101 @@
 """AOC 2022 day 12"""
 
 
-import heapq
-import itertools
-import string
-from typing import Generator
+from __future__ import annotations
 
-import numpy as np
-from aocd.models import Puzzle
+from aoc.grid import load_grid
+from aoc.inputs import puzzle_input
+from aoc.lazy import lazy_import
+from aoc.search import Search
+from aoc.search import bfs
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Generator
+
+np = lazy_import("numpy")
 
 
 def parse(data) -> np.array:
-    raw_map = [[p for p in l] for l in data.split("\n") if l]
-    np_map = np.array(raw_map, dtype=np.dtype('U100'))
-    return np.pad(np_map, 1, 'constant', constant_values="0")
+    return load_grid(data, pad=1, fill=b"0")
 
 
 def find(my_map: np.array) -> tuple:
-    start = np.where(my_map == "S")
-    end = np.where(my_map == "E")
+    start = np.where(my_map == ord("S"))
+    end = np.where(my_map == ord("E"))
     return (start[0][0], start[1][0]), (end[0][0], end[1][0])
 
 
 def preprocess_map(my_map: np.array) -> np.array:
-    char_to_val = {char: c+1 for c, char in enumerate(string.ascii_lowercase)}
-    char_to_val["S"] = 1
-    char_to_val["E"] = 26
-    for cx, vx in enumerate(my_map):
-        for cy, vy in enumerate(vx):
-            if vy == "0":
-                continue
-            if vy in char_to_val:
-                my_map[cx][cy] = char_to_val[vy]
-    return my_map.astype(int)
-
-
-def move(pos: tuple, my_map: np.array) -> Generator:
-    x, y = pos
-    for m in ((0, 1), (0, -1), (1, 0), (-1, 0)):
-        new = x+m[0], y+m[1]
-        nxt_val = my_map[new[0]][new[1]]
-        if not nxt_val == 0 and nxt_val - my_map[x][y] <= 1:
-            yield new
-
-
-def reverse_move(pos: tuple, my_map: np.array) -> Generator:
-    x, y = pos
-    for m in ((0, 1), (0, -1), (1, 0), (-1, 0)):
-        new = x+m[0], y+m[1]
-        nxt_val = my_map[new[0]][new[1]]
-        if not nxt_val == 0 and my_map[x][y] <= nxt_val + 1:
-            yield new
-
-
-def dijkstra(padded_map: np.array, start: tuple, end: tuple, find_closest: int = None) -> int:
-    nodes = [(i, j) for i in range(1, padded_map.shape[0]-1) for j in range(1, padded_map.shape[1]-1)]
-    distances = {n: float("inf") for n in nodes}
-    priors = {n: None for n in nodes}
-    distances[start] = 0
-    node_heap = []
-    entry_finder = {}
-    counter = itertools.count()
-    for n in nodes:
-        add_node_to_heap(node_heap, n, counter, entry_finder, priority=distances[n])
-    while end in entry_finder:
-        closest = pop_node_from_heap(node_heap, entry_finder)
-        if find_closest is None:
-            neighbours = list(move(closest, padded_map))
-        else:
-            neighbours = list(reverse_move(closest, padded_map))
-        for nxt in neighbours:
-            if nxt in entry_finder:
-                update_distance(closest, nxt, distances, priors, node_heap, counter, entry_finder)
-        if find_closest is not None:
-            if padded_map[closest[0]][closest[1]] == find_closest:
-                return distances[closest]
-    return distances[end]
-
-
-def add_node_to_heap(my_heap: list, node: tuple, counter: itertools.count, entry_finder: dict, priority=0) -> None:
-    if node in entry_finder:
-        remove_node_from_heap(node, entry_finder)
-    count = next(counter)
-    entry = [priority, count, node]
-    entry_finder[node] = entry
-    heapq.heappush(my_heap, entry)
-
-
-def remove_node_from_heap(node: tuple, entry_finder: dict) -> None:
-    entry = entry_finder.pop(node)
-    entry[-1] = (None, None)
-
-
-def pop_node_from_heap(my_heap: list, entry_finder: dict) -> tuple:
-    while my_heap:
-        priority, count, node = heapq.heappop(my_heap)
-        if node != (None, None):
-            del entry_finder[node]
-            return node
-    raise KeyError("Cannot pop from empty priority queue")
-
-
-def update_distance(closest, nxt, distances, priors, node_heap, counter, entry_finder) -> None:
-    alternative = distances[closest] + 1
-    if alternative < distances[nxt]:
-        distances[nxt] = alternative
-        priors[nxt] = closest
-        remove_node_from_heap(nxt, entry_finder)
-        add_node_to_heap(node_heap, nxt, counter, entry_finder, alternative)
+    """elevations from 1 for a to 26 for z, the padding becomes 0"""
+    elevation = my_map.astype(int) - (ord("a") - 1)
+    elevation[my_map == ord("S")] = 1
+    elevation[my_map == ord("E")] = 26
+    elevation[my_map == ord("0")] = 0
+    return elevation
 
 
-def part_a(data) -> int:
+def climb(elevation: list, width: int) -> Callable[[int], Generator]:
+    """steps to neighbouring cells at most one higher, cells are numbered row by row on the padded map"""
+
+    def _neighbours(node: int) -> Generator:
+        limit = elevation[node] + 1
+        for nxt in node + 1, node - 1, node + width, node - width:
+            # the padding is 0 and cannot be stepped on
+            if 0 < elevation[nxt] <= limit:
+                yield nxt
+
+    return _neighbours
+
+
+def hike(processed_map: np.array, starts: list, end: tuple) -> Search:
+    """bfs from the nearest of the starts to the end"""
+    width = processed_map.shape[1]
+    target = int(end[0] * width + end[1])
+    sources = [int(r * width + c) for r, c in starts]
+    return bfs(climb(processed_map.ravel().tolist(), width), sources, processed_map.size, target.__eq__)
+
+
+def prepare(data) -> tuple:
     padded_map = parse(data)
     start, end = find(padded_map)
-    processed_map = preprocess_map(padded_map)
-    return dijkstra(processed_map, start, end)
+    return preprocess_map(padded_map), start, end
+
+
+def shortest_path(model: tuple) -> int | float:
+    processed_map, start, end = model
+    search = hike(processed_map, [start], end)
+    return float("inf") if search.found is None else search.distance
+
+
+def shortest_hike(model: tuple) -> int | float:
+    """multi-source bfs from all cells at elevation a"""
+    processed_map, start, end = model
+    search = hike(processed_map, [tuple(p) for p in np.argwhere(processed_map == 1).tolist()], end)
+    return float("inf") if search.found is None else search.distance
+
+
+def part_a(data) -> int:
+    return shortest_path(prepare(data))
 
 
 def part_b(data) -> int:
-    padded_map = parse(data)
-    end, start = find(padded_map)
-    processed_map = preprocess_map(padded_map)
-    return dijkstra(processed_map, start, end, find_closest=1)
+    return shortest_hike(prepare(data))
+
+
+def solve(model: tuple) -> tuple:
+    return shortest_path(model), shortest_hike(model)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=12)
+    data = puzzle_input(12)
     test = """Sabqponm\nabcryxxl\naccszExk\nacctuvwj\nabdefghi\n"""
 
     print("Part A")
     assert part_a(test) == 31
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
 
     print("Part B")
     assert part_b(test) == 29
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
@@ -5,7 +5,7 @@
 import json
 from functools import cmp_to_key
 
-from aocd.models import Puzzle
+from aoc.inputs import puzzle_input
 
 
 def parse(data) -> list:
@@ -28,21 +28,36 @@ def compare(left, right):
     return compare_lists(left if isinstance(left, list) else [left], right if isinstance(right, list) else [right])
 
 
-def part_a(data: str) -> int:
-    return sum(c for c, v in enumerate(parse(data), 1) if compare(*v) < 0)
+def ordered_pairs(pairs: list) -> int:
+    return sum(c for c, v in enumerate(pairs, 1) if compare(*v) < 0)
 
 
-def part_b(data: str) -> int:
-    packets = parse(data)
+def decoder_key(pairs: list) -> int:
     dividers = [[[2]], [[6]]]
-    packets.append(dividers)
+    packets = pairs + [dividers]
     flat = [elem for pair in packets for elem in pair]
     srtd = sorted(flat, key=cmp_to_key(compare))
     return (srtd.index(dividers[0]) + 1) * (srtd.index(dividers[1]) + 1)
 
 
+def prepare(data: str) -> list:
+    return parse(data)
+
+
+def part_a(data: str) -> int:
+    return ordered_pairs(prepare(data))
+
+
+def part_b(data: str) -> int:
+    return decoder_key(prepare(data))
+
+
+def solve(pairs: list) -> tuple:
+    return ordered_pairs(pairs), decoder_key(pairs)
+
+
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=13)
+    data = puzzle_input(13)
     test = (
         """[1,1,3,1,1]\n[1,1,5,1,1]\n\n[[1],[2,3,4]]\n[[1],4]\n\n"""
         """[9]\n[[8,7,6]]\n\n[[4,4],4,4]\n[[4,4],4,4,4]\n\n"""
@@ -52,8 +67,8 @@ if __name__ == "__main__":
 
     print("Part A")
     assert part_a(test) == 13
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
 
     print("Part B")
     assert part_b(test) == 140
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
@@ -2,13 +2,15 @@
 """AOC 2022 day 15"""
 
 
-from aocd.models import Puzzle
+from __future__ import annotations
+
+from aoc.inputs import puzzle_input
+from aoc.parsing import records
 
 
 def parse(data) -> list:
-    raw = [[e.split(", ") for e in l.split(": ")] for l in data.strip().split("\n")]
-    coords = [[(int(e[0].split("x=")[1]), int(e[1].split("y=")[1])) for e in r] for r in raw]
-    return coords
+    found = records(data, 4, separators=b"Sensor at x=, y: closest beacon is\n").tolist()
+    return [((sx, sy), (bx, by)) for sx, sy, bx, by in found]
 
 
 class Area:
@@ -19,17 +21,6 @@ class Area:
         self.dist = abs(sensor[0] - beacon[0]) + abs(sensor[1] - beacon[1])
         self.row_of_interest = row_of_interest
 
-    def rule_out(self) -> set:
-        """find positions a beacon cannot be in"""
-        covered = set()
-        sx, sy = self.sensor
-        for y in range(sy - self.dist, sy + self.dist + 1):
-            if y == self.row_of_interest:
-                for x in range(sx - self.dist, sx + self.dist + 1):
-                    if abs(x-sx) + abs(y-sy) <= self.dist:
-                        covered.add((x, y))
-        return covered
-
     def rule_out_range(self) -> list | None:
         """check overlap of area scanned by sensor and row of interest"""
         vdist = (self.dist - abs(self.row_of_interest - self.sensor[1]))
@@ -51,20 +42,33 @@ def combine_ranges(ranges: list) -> list | int:
     return merge
 
 
-def part_a(data, row_of_interest: int) -> int:
-    coords = parse(data)
-    ruled_out_positions, ignore = set(), set()
+def merge_ranges(ranges: list) -> list:
+    """disjoint ranges covering the same positions, sorted by their start"""
+    merged = []
+    for lo, hi in sorted(ranges):
+        if merged and lo <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], hi)
+        else:
+            merged.append([lo, hi])
+    return merged
+
+
+def beacon_free_positions(coords: list, row_of_interest: int) -> int:
+    """covered positions of the row counted from the lengths of its ranges, sensors and beacons on it are no option"""
+    ranges, ignore = [], set()
     for sensor, beacon in coords:
         area = Area(sensor, beacon, row_of_interest)
-        ruled_out_positions.update(area.rule_out())
+        if (rng := area.rule_out_range()) is not None:
+            ranges.append(rng)
         for p in area.sensor, area.beacon:
             if p[1] == row_of_interest:
-                ignore.add(p)
-    return len(ruled_out_positions - ignore)
+                ignore.add(p[0])
+    merged = merge_ranges(ranges)
+    covered = sum(hi - lo + 1 for lo, hi in merged)
+    return covered - sum(any(lo <= x <= hi for lo, hi in merged) for x in ignore)
 
 
-def part_b(data, square: int):
-    coords = parse(data)
+def tuning_frequency(coords: list, square: int) -> int:
     for roi in range(square+1):
         ruled_out_ranges = []
         for sensor, beacon in coords:
@@ -80,8 +84,24 @@ def part_b(data, square: int):
             return square * 4000000 + roi
 
 
+def prepare(data) -> list:
+    return parse(data)
+
+
+def part_a(data, row_of_interest: int) -> int:
+    return beacon_free_positions(prepare(data), row_of_interest)
+
+
+def part_b(data, square: int):
+    return tuning_frequency(prepare(data), square)
+
+
+def solve(coords: list, row_of_interest: int = 2000000, square: int = 4000000) -> tuple:
+    return beacon_free_positions(coords, row_of_interest), tuning_frequency(coords, square)
+
+
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=15)
+    data = puzzle_input(15)
     test = (
         """Sensor at x=2, y=18: closest beacon is at x=-2, y=15\n"""
         """Sensor at x=9, y=16: closest beacon is at x=10, y=16\n"""
@@ -101,8 +121,8 @@ if __name__ == "__main__":
 
     print("Part A")
     assert part_a(test, 10) == 26
-    print(part_a(puzzle.input_data, 2000000))
+    print(part_a(data, 2000000))
 
     print("Part B")
     assert part_b(test, 20) == 56000011
-    print(part_b(puzzle.input_data, 4000000))
+    print(part_b(data, 4000000))
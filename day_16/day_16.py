@@ -2,9 +2,12 @@
 """AOC 2022 day 16"""
 
 
-from typing import Tuple
-
-from aocd.models import Puzzle
+from aoc.anytime import Budget
+from aoc.anytime import Result
+from aoc.anytime import anytime
+from aoc.inputs import puzzle_input
+from aoc.search import UNREACHED
+from aoc.search import bfs
 
 
 class Valve:
@@ -16,7 +19,7 @@ class Valve:
         self.connections = []
 
 
-def parse(data) -> Tuple[list, list, Valve]:
+def parse(data) -> tuple[list, list, Valve]:
     valve_data = [l.split("; ") for l in data.strip().split("\n")]
     valves, relevant_valves, start_valve = list(), list(), None
     for c, vd in enumerate(valve_data):
@@ -44,29 +47,46 @@ class DistanceFinder:
         self.dists = [[float("inf")] * self.ln for _ in range(self.ln)]
 
     def build(self) -> None:
-        """use floyd-warshall algorithm"""
+        """bfs from every valve, the tunnels all take one minute"""
+        tunnels = [[e.vid for e in v.connections] for v in self.valves]
         for v in self.valves:
-            for e in v.connections:
-                self.dists[v.vid][e.vid] = 1
-        for i in range(self.ln):
-            self.dists[i][i] = 0
-        for k in range(self.ln):
-            for i in range(self.ln):
-                for j in range(self.ln):
-                    if self.dists[i][j] > self.dists[i][k] + self.dists[k][j]:
-                        self.dists[i][j] = self.dists[i][k] + self.dists[k][j]
+            distances = bfs(tunnels.__getitem__, [v.vid], self.ln).distances
+            self.dists[v.vid] = [float("inf") if d == UNREACHED else d for d in distances]
 
 
 class Solver:
 
-    def __init__(self, relevant_valves: list, distances: list) -> None:
+    def __init__(self, relevant_valves: list, distances: list, budget: Budget = None,
+                 start_valve: Valve = None) -> None:
         self.relevant_valves = relevant_valves
+        self.start_valve = start_valve
         self.dists = distances
         self.solutions = []
+        self.budget = budget
+
+    def potential(self, current: Valve, time: int, visited: list, deadline: int) -> int:
+        """upper bound for the pressure still to be released, assuming every valve is opened as early as possible"""
+        return sum(v.rate * max(0, deadline - time - self.dists[current.vid][v.vid] - 1)
+                   for v in self.relevant_valves if v is not current and v.vid not in visited)
+
+    def pair_potential(self, current: Valve, time: int, visited: list, deadline: int) -> int:
+        """upper bound for the pressure still to be released by both, the elephant starts later from the start valve"""
+        return sum(v.rate * max(0, deadline - time - self.dists[current.vid][v.vid] - 1,
+                                deadline - self.dists[self.start_valve.vid][v.vid] - 1)
+                   for v in self.relevant_valves if v is not current and v.vid not in visited)
 
     def release_pressure(self, current: Valve, score: int, time: int, visited: list, deadline: int, remember: bool) -> int:
         if remember:
             self.solutions.append([score, visited])
+        # with a budget, branches that cannot beat the best score found so far are pruned, while remembering paths
+        # for the elephant a branch is only dropped if no pair built from it can beat the best score either
+        if self.budget is not None:
+            self.budget.expand()
+            self.budget.improve(score)
+            bound = self.pair_potential if remember else self.potential
+            if score + bound(current, time, visited, deadline) <= self.budget.best:
+                self.budget.prune()
+                return score
         vals = []
         for v in self.relevant_valves:
             new_time = time + self.dists[current.vid][v.vid] + 1
@@ -78,22 +98,27 @@ class Solver:
         return max(vals)
 
 
-def part_a(data) -> int:
+def prepare(data) -> tuple[list, Valve, list]:
     valves, relevant_valves, start_valve = parse(data)
     df = DistanceFinder(valves)
     df.build()
-    solver_a = Solver(relevant_valves, df.dists)
+    return relevant_valves, start_valve, df.dists
+
+
+def most_pressure(model: tuple, budget: Budget = None) -> int:
+    relevant_valves, start_valve, distances = model
+    solver_a = Solver(relevant_valves, distances, budget)
     return solver_a.release_pressure(start_valve, 0, 0, [], 30, False)
 
 
-def part_b(data) -> int:
-    valves, relevant_valves, start_valve = parse(data)
-    df = DistanceFinder(valves)
-    df.build()
-    solver_b = Solver(relevant_valves, df.dists)
+def most_pressure_with_elephant(model: tuple, budget: Budget = None) -> int:
+    relevant_valves, start_valve, distances = model
+    solver_b = Solver(relevant_valves, distances, budget, start_valve)
     single_sol = solver_b.release_pressure(start_valve, 0, 0, [], 26, True)
     best_sol = single_sol
     for s in solver_b.solutions:
+        if budget is not None:
+            budget.check()
         if best_sol - s[0] >= single_sol:
             continue
         elephant_score = solver_b.release_pressure(start_valve, s[0], 0, s[1], 26, False)
@@ -101,8 +126,29 @@ def part_b(data) -> int:
     return best_sol
 
 
+def part_a(data) -> int:
+    return most_pressure(prepare(data))
+
+
+def part_b(data) -> int:
+    return most_pressure_with_elephant(prepare(data))
+
+
+def solve(model: tuple) -> tuple:
+    return most_pressure(model), most_pressure_with_elephant(model)
+
+
+def part_a_anytime(data, seconds: float = None) -> Result:
+    """best pressure found within the deadline, flagged as proven if the search finished"""
+    return anytime(most_pressure, prepare(data), seconds=seconds)
+
+
+def part_b_anytime(data, seconds: float = None) -> Result:
+    return anytime(most_pressure_with_elephant, prepare(data), seconds=seconds)
+
+
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=16)
+    data = puzzle_input(16)
     test = (
         """Valve AA has flow rate=0; tunnels lead to valves DD, II, BB\n"""
         """Valve BB has flow rate=13; tunnels lead to valves CC, AA\n"""
@@ -118,8 +164,8 @@ if __name__ == "__main__":
 
     print("Part A")
     assert part_a(test) == 1651
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
 
     print("Part B")
     assert part_b(test) == 1707
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
@@ -5,11 +5,13 @@
 from __future__ import annotations
 
 import copy
-from typing import List
 
-import numpy as np
-import pandas as pd
-from aocd.models import Puzzle
+from aoc.coordset import DenseSet
+from aoc.inputs import puzzle_input
+from aoc.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
 
 
 def parse(data):
@@ -17,13 +19,13 @@ def parse(data):
 
 
 class Game:
-    def __init__(self, data, rep_mem: int = 64, width: int = 7):
+    def __init__(self, movements: list, rep_mem: int = 64, width: int = 7):
         self.width: int = width
         self.rock_count: int = 0
         self.horizontal_moves = 0
         self.highest: int = 0
-        self.occupied: list = [[x, 0] for x in range(7)]
-        self.movements: list = parse(data)
+        self.occupied: DenseSet = DenseSet(width, [[x, 0] for x in range(width)])
+        self.movements: list = movements
         self.rock_types: list = [HorizontalFour, Plus, Edge, VerticalFour, Square]
         self.memory: list = []
         self.rep_mem: int = rep_mem
@@ -44,7 +46,8 @@ class Game:
                 break
             nr.move_down()
         self.highest = max(self.highest, max(o[1] for o in nr.occupied))
-        self.occupied.extend(nr.occupied)
+        for o in nr.occupied:
+            self.occupied.add(o)
         self.rock_count += 1
         self.horizontal_moves %= len(self.movements)
         if memorize:
@@ -77,7 +80,7 @@ class Game:
 
 class Rock:
     def __init__(self) -> None:
-        self.occupied: List[List[int, int]] = []
+        self.occupied: list[list[int]] = []
 
     def move_down(self) -> None:
         for o in self.occupied:
@@ -129,17 +132,15 @@ class Edge(Rock):
         self.occupied = [[left, lowest], [left+1, lowest], [left+2, lowest], [left+2, lowest+1], [left+2, lowest+2]]
 
 
-def part_a(data):
-    game = Game(data)
-    for _ in range(2022):
+def tower(movements: list, rocks: int = 2022) -> Game:
+    game = Game(movements)
+    for _ in range(rocks):
         game.new_rock()
-    game.print_state()
-    return game.highest
+    return game
 
 
-def part_b(data):
-    game = Game(data)
-    reps = 1000000000000
+def tower_height(movements: list, reps: int = 1000000000000) -> int:
+    game = Game(movements)
     height_shortcut = 0
     while game.rock_count <= reps:
         game.new_rock(memorize=True)
@@ -154,14 +155,32 @@ def part_b(data):
     return game.highest + height_shortcut
 
 
+def prepare(data) -> list:
+    return parse(data)
+
+
+def part_a(data):
+    return tower(prepare(data)).highest
+
+
+def part_b(data):
+    return tower_height(prepare(data))
+
+
+def solve(movements: list) -> tuple:
+    return tower(movements).highest, tower_height(movements)
+
+
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=17)
+    data = puzzle_input(17)
     test = """>>><<><>><<<>><>>><<<>>><<<><<<>><>><<>>\n"""
 
     print("Part A")
     assert part_a(test) == 3068
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
+    # the tower of part a is only written to ./tower.txt when run as a script
+    tower(prepare(data)).print_state()
 
     print("Part B")
     assert part_b(test) == 1514285714288
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
@@ -2,22 +2,27 @@
 """AOC 2022 day 18"""
 
 
-import numpy as np
-from aocd.models import Puzzle
+from __future__ import annotations
 
+import copy
 
-def parse(data):
-    return [[int(i) for i in d.split(",")] for d in data.strip().split("\n")]
+from aoc.inputs import puzzle_input
+from aoc.lazy import lazy_import
+from aoc.parsing import records
+
+np = lazy_import("numpy")
+
+
+def parse(data) -> np.ndarray:
+    return records(data, 3, separators=b",\n")
 
 
 class Droplet:
     def __init__(self, cube_data) -> None:
-        self.lnx = max(c[0] for c in cube_data) + 1
-        self.lny = max(c[1] for c in cube_data) + 1
-        self.lnz = max(c[2] for c in cube_data) + 1
+        cubes = np.asarray(cube_data)
+        self.lnx, self.lny, self.lnz = cubes.max(axis=0) + 1
         self.mtrx: np.array = np.zeros((self.lnx, self.lny, self.lnz))
-        for cube in cube_data:
-            self.mtrx[cube[0]][cube[1]][cube[2]] = 1
+        self.mtrx[cubes[:, 0], cubes[:, 1], cubes[:, 2]] = 1
         self.padded = np.pad(self.mtrx, pad_width=1, constant_values=np.nan)
 
     def count_neighbours(self, point: tuple) -> int:
@@ -59,25 +64,37 @@ class Droplet:
         return surface
 
 
-def part_a(data):
-    droplet = Droplet(parse(data))
+def exterior_surface(droplet: Droplet) -> int:
+    droplet = copy.copy(droplet)
+    droplet.padded = droplet.padded.copy()
+    droplet.remove_enclaves()
     return droplet.calc_surface()
 
 
+def prepare(data) -> Droplet:
+    return Droplet(parse(data))
+
+
+def part_a(data):
+    return prepare(data).calc_surface()
+
+
 def part_b(data):
-    droplet = Droplet(parse(data))
-    droplet.remove_enclaves()
-    return droplet.calc_surface()
+    return exterior_surface(prepare(data))
+
+
+def solve(droplet: Droplet) -> tuple:
+    return droplet.calc_surface(), exterior_surface(droplet)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=18)
+    data = puzzle_input(18)
     test = """2,2,2\n1,2,2\n3,2,2\n2,1,2\n2,3,2\n2,2,1\n2,2,3\n2,2,4\n2,2,6\n1,2,5\n3,2,5\n2,1,5\n2,3,5\n"""
 
     print("Part A")
     assert part_a(test) == 64
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
 
     print("Part B")
     assert part_b(test) == 58
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
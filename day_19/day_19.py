@@ -3,9 +3,21 @@
 
 
 import copy
-import multiprocessing
+import math
+import os
+import time
 
-from aocd.models import Puzzle
+from aoc.anytime import Budget
+from aoc.anytime import Expired
+from aoc.anytime import Result
+from aoc.anytime import combine
+from aoc.anytime import hard_timeout
+from aoc.inputs import puzzle_input
+from aoc.lazy import lazy_import
+
+# only the process pools need them, importing both takes longer than all of the rest of the module
+futures = lazy_import("concurrent.futures")
+pebble = lazy_import("pebble")
 
 
 def parse(data) -> list:
@@ -48,6 +60,7 @@ class RobotArmy:
                     required.append(self.blueprint[bp][r])
             self.max_required[r] = max(required)
         self.max_geodes = 0
+        self.budget = None
 
     @staticmethod
     def mine(robots: dict, resources: dict) -> dict:
@@ -77,8 +90,12 @@ class RobotArmy:
         if cache_elem in cache:
             return cache
         cache.add(cache_elem)
+        if self.budget is not None:
+            self.budget.expand()
         # break if max geodes not achievable anymore
         if resources["geode"] + robots["geode"] * reps + (reps + 1) * reps // 2 <= self.max_geodes:
+            if self.budget is not None:
+                self.budget.prune()
             return cache
         for nxt in (None, "geode", "obsidian", "clay", "ore"):
             robots_cp, resources_cp = copy.copy(robots), copy.copy(resources)
@@ -111,6 +128,15 @@ class RobotArmy:
         self.optimize(reps, self.robots, self.resources, set())
         return self.max_geodes
 
+    def maximize_geodes_until(self, reps: int, seconds: float = None) -> Result:
+        """most geodes found before the deadline"""
+        self.budget = Budget(seconds)
+        try:
+            self.optimize(reps, copy.copy(self.robots), copy.copy(self.resources), set())
+        except Expired:
+            pass
+        return self.budget.result(self.max_geodes)
+
 
 def quality_level(task: tuple) -> int:
     robot_army, reps = task
@@ -122,28 +148,89 @@ def maximize_geodes(task: tuple) -> int:
     return robot_army.maximize_geodes(reps)
 
 
-def part_a(data, reps: int = 24) -> int:
-    blueprints = parse(data)
+def maximize_geodes_until(task: tuple) -> Result:
+    """
+    :param task: robot army, reps and the wall clock time at which all blueprints have to be done
+    """
+    robot_army, reps, deadline = task
+    return robot_army.maximize_geodes_until(reps, None if deadline is None else max(0.0, deadline - time.time()))
+
+
+def workers(tasks: list) -> int:
+    return min(len(tasks), os.cpu_count()) or 1
+
+
+def run_pool(func, tasks: list, timeout: float = None) -> list:
+    """run one task per blueprint, tasks exceeding the timeout raise a TimeoutError when their result is read"""
+    with pebble.ProcessPool(max_workers=workers(tasks)) as pool:
+        return [pool.schedule(func, args=(t,), timeout=timeout) for t in tasks]
+
+
+def sum_of_quality_levels(blueprints: list, reps: int = 24) -> int:
     robot_armies = list(map(RobotArmy, blueprints))
-    with multiprocessing.Pool() as pool:
-        res = 0
-        for result in pool.map(quality_level, zip(robot_armies, [reps]*len(robot_armies))):
-            res += result
+    res = 0
+    for future in run_pool(quality_level, list(zip(robot_armies, [reps]*len(robot_armies)))):
+        res += future.result()
     return res
 
 
-def part_b(data, reps: int = 32) -> int:
-    blueprints = parse(data)[:3]
-    robot_armies = list(map(RobotArmy, blueprints))
-    with multiprocessing.Pool() as pool:
-        res = 1
-        for result in pool.map(maximize_geodes, zip(robot_armies, [reps]*len(robot_armies))):
-            res *= result
+def product_of_geodes(blueprints: list, reps: int = 32) -> int:
+    robot_armies = list(map(RobotArmy, blueprints[:3]))
+    res = 1
+    for future in run_pool(maximize_geodes, list(zip(robot_armies, [reps]*len(robot_armies)))):
+        res *= future.result()
     return res
 
 
+def geodes_until(robot_armies: list, reps: int, seconds: float = None) -> list[Result]:
+    """best geodes per blueprint within the deadline, workers missing it by more than the grace period are killed"""
+    results = []
+    with pebble.ProcessPool(max_workers=workers(robot_armies)) as pool:
+        # the workers are started before the clock, so their startup is not charged to the search
+        futures.wait([pool.schedule(os.getpid) for _ in range(workers(robot_armies))])
+        # one deadline for all blueprints, tasks waiting for a free worker spend their share of it in the queue
+        deadline = None if seconds is None else time.time() + seconds
+        scheduled = [pool.schedule(maximize_geodes_until, args=((r, reps, deadline),), timeout=hard_timeout(seconds))
+                     for r in robot_armies]
+    for future in scheduled:
+        try:
+            results.append(future.result())
+        # concurrent.futures.TimeoutError is the builtin since python 3.11
+        except TimeoutError:
+            # no geodes is the only value known to be reachable
+            results.append(Result(0, False, 0, 0, hard_timeout(seconds)))
+    return results
+
+
+def prepare(data) -> list:
+    return parse(data)
+
+
+def part_a(data, reps: int = 24) -> int:
+    return sum_of_quality_levels(prepare(data), reps)
+
+
+def part_b(data, reps: int = 32) -> int:
+    return product_of_geodes(prepare(data), reps)
+
+
+def solve(blueprints: list, reps_a: int = 24, reps_b: int = 32) -> tuple:
+    return sum_of_quality_levels(blueprints, reps_a), product_of_geodes(blueprints, reps_b)
+
+
+def part_a_anytime(data, reps: int = 24, seconds: float = None) -> Result:
+    robot_armies = list(map(RobotArmy, prepare(data)))
+    results = geodes_until(robot_armies, reps, seconds)
+    return combine(results, sum(r.raid * res.value for r, res in zip(robot_armies, results)))
+
+
+def part_b_anytime(data, reps: int = 32, seconds: float = None) -> Result:
+    results = geodes_until(list(map(RobotArmy, prepare(data)[:3])), reps, seconds)
+    return combine(results, math.prod(res.value for res in results))
+
+
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=19)
+    data = puzzle_input(19)
     test = (
         """Blueprint 1: Each ore robot costs 4 ore. Each clay robot costs 2 ore. """
         """Each obsidian robot costs 3 ore and 14 clay. Each geode robot costs 2 ore and 7 obsidian.\n"""
@@ -153,8 +240,8 @@ if __name__ == "__main__":
 
     print("Part A")
     print(part_a(test))
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
 
     print("Part B")
     print(part_b(test))
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
@@ -2,11 +2,12 @@
 """AOC 2022 day 20"""
 
 
-from aocd.models import Puzzle
+from aoc.inputs import puzzle_input
+from aoc.parsing import integers
 
 
 def parse(data) -> list:
-    return [int(v) for v in data.strip().split("\n")]
+    return integers(data, separators=b"\n").tolist()
 
 
 class File:
@@ -40,27 +41,43 @@ class File:
         return res
 
 
-def part_a(data) -> int:
-    f = File(parse(data))
+def grove_sum(values: list) -> int:
+    f = File(values.copy())
     f.mix()
     return f.grove_coordinates()
 
 
-def part_b(data) -> int:
-    f = File(parse(data))
+def decrypted_grove_sum(values: list) -> int:
+    f = File(values.copy())
     f.apply_decryption_key(811589153)
     f.mix(10)
     return f.grove_coordinates()
 
 
+def prepare(data) -> list:
+    return parse(data)
+
+
+def part_a(data) -> int:
+    return grove_sum(prepare(data))
+
+
+def part_b(data) -> int:
+    return decrypted_grove_sum(prepare(data))
+
+
+def solve(values: list) -> tuple:
+    return grove_sum(values), decrypted_grove_sum(values)
+
+
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=20)
+    data = puzzle_input(20)
     test = """1\n2\n-3\n3\n-2\n0\n4\n"""
 
     print("Part A")
     assert part_a(test) == 3
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
 
     print("Part B")
     assert part_b(test) == 1623178306
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
@@ -5,7 +5,7 @@
 from abc import ABC
 from abc import abstractmethod
 
-from aocd.models import Puzzle
+from aoc.inputs import puzzle_input
 
 
 def parse(data) -> tuple[list, list]:
@@ -121,15 +121,11 @@ def dive_in(root: OperationMonkey, humn_path: list, exp_val: int) -> int:
                 return dive_in(root.second, humn_path, root.first.return_val() // exp_val)
 
 
-def part_a(data):
-    nums, ops = parse(data)
-    monkeys = init_monkeys(nums, ops)
+def root_number(monkeys: dict) -> int:
     return monkeys["root"].return_val()
 
 
-def part_b(data):
-    nums, ops = parse(data)
-    monkeys = init_monkeys(nums, ops)
+def humn_number(monkeys: dict) -> int:
     humn_path = find_humn_path(monkeys["root"])
     first, second = monkeys["root"].first, monkeys["root"].second
     if first not in humn_path:
@@ -141,8 +137,24 @@ def part_b(data):
     return dive_in(start, humn_path, exp)
 
 
+def prepare(data) -> dict:
+    return init_monkeys(*parse(data))
+
+
+def part_a(data):
+    return root_number(prepare(data))
+
+
+def part_b(data):
+    return humn_number(prepare(data))
+
+
+def solve(monkeys: dict) -> tuple:
+    return root_number(monkeys), humn_number(monkeys)
+
+
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=21)
+    data = puzzle_input(21)
     test = (
         """root: pppw + sjmn\n"""
         """dbpl: 5\n"""
@@ -163,8 +175,8 @@ if __name__ == "__main__":
 
     print("Part A")
     assert part_a(test) == 152
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
 
     print("Part B")
     assert part_b(test) == 301
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
@@ -8,14 +8,17 @@ it requires adding diagonals indicating how the cube's net is folded, cp the spr
 
 import re
 
-from aocd.models import Puzzle
+from aoc.grid import load_grid
+from aoc.grid import rows
+from aoc.inputs import puzzle_input
+
+WALL, OPEN, VOID, UP, DOWN = b"#. ud"
 
 
 def parse(data) -> tuple[list, list]:
     maze, instructions = data.split("\n\n")
-    rows = maze.split("\n")
-    max_x = max(len(r) for r in rows)
-    maze = [[f for f in '{message: <{width}}'.format(message=r, width=max_x)] for r in rows]
+    # rows are filled up with spaces to the longest one
+    maze = rows(load_grid(maze, fill=b" "), mutable=True)
     ins = re.split('(L|R)', instructions.strip())
     instructions = [int(i) if i.isnumeric() else i for i in ins]
     return maze, instructions
@@ -31,7 +34,7 @@ class Mover:
     def _set_init(self) -> list[int, int]:
         for ci, i in enumerate(self.maze):
             for cj, _ in enumerate(i):
-                if self.maze[ci][cj] == ".":
+                if self.maze[ci][cj] == OPEN:
                     return [ci, cj]
 
     def turn(self, direction: str) -> None:
@@ -58,23 +61,23 @@ class Mover:
         while steps > 0:
             steps -= 1
             if trace:
-                self.maze[x][y] = str(o)
+                self.maze[x][y] = ord(str(o))
             x = (x + dirs[o][0]) % self.maze_dimensions[0]
             y = (y + dirs[o][1]) % self.maze_dimensions[1]
-            if self.maze[x][y] == "#":
+            if self.maze[x][y] == WALL:
                 break
-            elif self.maze[x][y] == " ":
+            elif self.maze[x][y] == VOID:
                 steps += 1
-            elif self.maze[x][y] == ".":
+            elif self.maze[x][y] == OPEN:
                 self.position = [x, y]
                 self.orientation = o
-            elif self.maze[x][y] == "u":
+            elif self.maze[x][y] == UP:
                 steps += 1
                 if o in (0, 2):
                     o = (o + 1) % 4
                 elif o in (1, 3):
                     o = (o - 1) % 4
-            elif self.maze[x][y] == "d":
+            elif self.maze[x][y] == DOWN:
                 steps += 1
                 if o in (0, 2):
                     o = (o - 1) % 4
@@ -82,8 +85,8 @@ class Mover:
                     o = (o + 1) % 4
 
 
-def part_a(data):
-    maze, instructions = parse(data)
+def password(model: tuple) -> int:
+    maze, instructions = model
     mover = Mover(maze)
     for i in instructions:
         if isinstance(i, int):
@@ -110,25 +113,25 @@ def preprocess_b(maze: list, edge_len: int, starts_down: tuple, starts_up: tuple
     def _turning_diagonal_down(maze: list, top_left_corner: tuple, ln: int) -> None:
         sx, sy = top_left_corner
         for i in range(ln):
-            maze[sx + i][sy + i] = "d"
+            maze[sx + i][sy + i] = DOWN
 
     def _turning_diagonal_up(maze: list, top_left_corner: tuple, ln: int) -> None:
         sx, sy = top_left_corner
         for i in range(ln):
-            maze[sx + ln - 1 - i][sy + i] = "u"
+            maze[sx + ln - 1 - i][sy + i] = UP
 
     # add padding to sides
     for r in range(height*edge_len):
         for _ in range(left_padding*edge_len):
-            maze[r].insert(0, " ")
+            maze[r].insert(0, VOID)
         for _ in range(right_padding*edge_len):
-            maze[r].append(" ")
+            maze[r].append(VOID)
     # add padding to top
     for _ in range(top_padding*edge_len):
-        maze.insert(0, [" "] * full_width*edge_len)
+        maze.insert(0, bytearray(b" " * full_width*edge_len))
     # add padding to bottom
     for _ in range(bottom_padding*edge_len):
-        maze.append([" "] * full_width*edge_len)
+        maze.append(bytearray(b" " * full_width*edge_len))
     # add diagonals w turning indicators
     for sd in starts_down:
         _turning_diagonal_down(maze, sd, edge_len)
@@ -137,14 +140,16 @@ def preprocess_b(maze: list, edge_len: int, starts_down: tuple, starts_up: tuple
     return maze
 
 
-def part_b(data, testcase: bool, trace: bool = False):
+def cube_password(model: tuple, testcase: bool, trace: bool = False) -> int:
     """run part b for the testcase and my individual input
     NOTE: this requires bespoke preprocessing - add padding with turning points, cp spreadsheet
-    :param data: input data consisting of the maze and the moving instructions
+    :param model: the maze and the moving instructions created by the parse function
     :param testcase: indicator for custom preprocessing
     :param trace: trace orientation along path and print to file - this may interfere with the results though
     """
-    maze, instructions = parse(data)
+    maze, instructions = model
+    # the padding is added in place
+    maze = [r.copy() for r in maze]
     if testcase:
         cube_len = 4
         starts_down = ((0, 4), (4, 8), (8, 0), (12, 20), (16, 12), (20, 16))
@@ -172,12 +177,28 @@ def part_b(data, testcase: bool, trace: bool = False):
     column = column - left_padding * cube_len
     if trace:
         with open("out.txt", "w") as f:
-            f.write("\n".join("".join(i) for i in maze))
+            f.write(b"\n".join(maze).decode())
     return 1000 * (row + 1) + 4 * (column + 1) + facing
 
 
+def prepare(data) -> tuple[list, list]:
+    return parse(data)
+
+
+def part_a(data):
+    return password(prepare(data))
+
+
+def part_b(data, testcase: bool, trace: bool = False):
+    return cube_password(prepare(data), testcase, trace)
+
+
+def solve(model: tuple, testcase: bool = False) -> tuple:
+    return password(model), cube_password(model, testcase)
+
+
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=22)
+    data = puzzle_input(22)
     test = (
         """        ...#\n"""
         """        .#..\n"""
@@ -197,8 +218,8 @@ if __name__ == "__main__":
 
     print("Part A")
     assert part_a(test) == 6032
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
 
     print("Part B")
     assert part_b(test, testcase=True) == 5031
-    print(part_b(puzzle.input_data, testcase=False))
+    print(part_b(data, testcase=False))
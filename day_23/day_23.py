@@ -4,16 +4,25 @@ AOC 2022 day 23
 """
 
 
-from collections import Counter
+from __future__ import annotations
 
-from aocd.models import Puzzle
+from aoc.coordset import contains
+from aoc.coordset import delta
+from aoc.coordset import pack_array
+from aoc.coordset import unpack_array
+from aoc.grid import load_grid
+from aoc.inputs import puzzle_input
+from aoc.lazy import lazy_import
 
+np = lazy_import("numpy")
 
-def parse(data: str) -> list:
-    return [[i for i in l] for l in data.strip().split("\n")]
+
+def parse(data: str) -> np.ndarray:
+    return load_grid(data.strip())
 
 
 class Swarm:
+    """elves as a sorted array of packed coordinates, every round is a handful of bulk lookups of shifted keys"""
 
     collision_fields = {
         (-1, 0): ((-1, 0), (-1, -1), (-1, 1)),
@@ -21,59 +30,55 @@ class Swarm:
         (0, -1): ((0, -1), (-1, -1), (1, -1)),
         (0, 1): ((0, 1), (-1, 1), (1, 1)),
     }
+    adjacent = [(x, y) for x in (-1, 0, 1) for y in (-1, 0, 1) if x != 0 or y != 0]
 
-    def __init__(self, data: list, height: int, width: int) -> None:
+    def __init__(self, data: np.ndarray, height: int, width: int) -> None:
         self.dirs = [(-1, 0), (1, 0), (0, -1), (0, 1)]
         self.dimensions = (height, width)
-        self.elves = set()
-        self.suggestions = dict()
-        for x, vx in enumerate(data):
-            for y, vy in enumerate(vx):
-                if vy == "#":
-                    self.elves.add((x, y))
+        self.elves = np.sort(pack_array(np.argwhere(data == ord("#"))))
+        self.suggestions = np.zeros(len(self.elves), dtype=bool)
+        self.targets = self.elves
 
     def check(self) -> None:
-        self.suggestions = dict()
-        for elf in self.elves:
-            adjacent = [(elf[0]+x, elf[1]+y) for x in (-1, 0, 1) for y in (-1, 0, 1) if x != 0 or y != 0]
-            if not any(d in self.elves for d in adjacent):
-                continue
-            for i in range(4):
-                d = self.dirs[i]
-                cf = [(elf[0] + t[0], elf[1] + t[1]) for t in self.collision_fields[d]]
-                if not any(p in self.elves for p in cf):
-                    self.suggestions[elf] = (elf[0] + d[0], elf[1] + d[1])
-                    break
+        occupied = {a: contains(self.elves, self.elves + delta(*a)) for a in self.adjacent}
+        undecided = np.logical_or.reduce(list(occupied.values()))
+        self.suggestions = undecided.copy()
+        self.targets = self.elves.copy()
+        for d in self.dirs:
+            free = undecided & ~np.logical_or.reduce([occupied[t] for t in self.collision_fields[d]])
+            self.targets[free] += delta(*d)
+            undecided &= ~free
+        # elves that are surrounded in all directions stay where they are
+        self.suggestions &= ~undecided
         self.dirs.append(self.dirs.pop(0))
 
     def check_equilibrium(self) -> bool:
-        return not self.suggestions
+        return not self.suggestions.any()
 
     def move(self) -> None:
-        counter = Counter(self.suggestions.values())
-        for elf in self.suggestions:
-            if counter[self.suggestions[elf]] == 1:
-                self.elves.remove(elf)
-                self.elves.add(self.suggestions[elf])
+        _, inverse, counts = np.unique(self.targets[self.suggestions], return_inverse=True, return_counts=True)
+        moving = np.flatnonzero(self.suggestions)[counts[inverse] == 1]
+        self.elves = self.elves.copy()
+        self.elves[moving] = self.targets[moving]
+        self.elves.sort()
 
     def layout(self, padding: int) -> None:
         """print the entire swarm of elves
         :param padding: number of moves - indicates maximum movement to the outside
         """
         field = [["."] * (self.dimensions[1] + 2*padding) for _ in range(self.dimensions[0] + 2*padding)]
-        for e in self.elves:
+        for e in unpack_array(self.elves).tolist():
             field[e[0] + padding][e[1] + padding] = "#"
         print(*["".join(r) for r in field], sep="\n")
 
     def calc_empty_ground(self) -> int:
-        height = max(e[0] for e in self.elves) - min(e[0] for e in self.elves)
-        width = max(e[1] for e in self.elves) - min(e[1] for e in self.elves)
-        return (height + 1) * (width + 1) - len(self.elves)
+        elves = unpack_array(self.elves)
+        height, width = elves.max(axis=0) - elves.min(axis=0)
+        return int((height + 1) * (width + 1)) - len(self.elves)
 
 
-def part_a(data: str, rounds: int = 10) -> int:
-    swarm_data = parse(data)
-    swarm = Swarm(swarm_data, height=len(swarm_data), width=len(swarm_data[0]))
+def empty_ground(swarm_data: np.ndarray, rounds: int = 10) -> int:
+    swarm = Swarm(swarm_data, *swarm_data.shape)
     for _ in range(rounds):
         swarm.check()
         swarm.move()
@@ -81,9 +86,8 @@ def part_a(data: str, rounds: int = 10) -> int:
     return swarm.calc_empty_ground()
 
 
-def part_b(data: str) -> int:
-    swarm_data = parse(data)
-    swarm = Swarm(swarm_data, height=len(swarm_data), width=len(swarm_data[0]))
+def first_still_round(swarm_data: np.ndarray) -> int:
+    swarm = Swarm(swarm_data, *swarm_data.shape)
     cnt = 0
     while True:
         cnt += 1
@@ -93,8 +97,24 @@ def part_b(data: str) -> int:
         swarm.move()
 
 
+def prepare(data: str) -> np.ndarray:
+    return parse(data)
+
+
+def part_a(data: str, rounds: int = 10) -> int:
+    return empty_ground(prepare(data), rounds)
+
+
+def part_b(data: str) -> int:
+    return first_still_round(prepare(data))
+
+
+def solve(swarm_data: np.ndarray, rounds: int = 10) -> tuple:
+    return empty_ground(swarm_data, rounds), first_still_round(swarm_data)
+
+
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=23)
+    data = puzzle_input(23)
     test = (
         """....#..\n"""
         """..###.#\n"""
@@ -107,8 +127,8 @@ if __name__ == "__main__":
 
     print("Part A")
     assert part_a(test) == 110
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
 
     print("Part B")
     assert part_b(test) == 20
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
@@ -4,90 +4,104 @@ AOC 2022 day 24
 """
 
 
-from aocd.models import Puzzle
+from __future__ import annotations
 
+from aoc.grid import load_grid
+from aoc.grid import rows
+from aoc.inputs import puzzle_input
+from aoc.lazy import lazy_import
+from aoc.search import timed_bfs
 
-def parse(data: str) -> list:
-    return [[f for f in l] for l in data.strip().split("\n")]
+np = lazy_import("numpy")
 
+WALL, RIGHT, LEFT, UP, DOWN = b"#><^v"
+
+
+def parse(data: str) -> np.ndarray:
+    return load_grid(data.strip())
 
-class ValleySim:
 
-    blizzard_directions = {
-        ">": (0, 1),
-        "<": (0, -1),
-        "^": (-1, 0),
-        "v": (1, 0),
-    }
-    moves = ((-1, 0), (1, 0), (0, -1), (0, 1), (0, 0))
-
-    def __init__(self, data: list) -> None:
-        self.field = data
-        self.dimensions = (len(data), len(data[0]))
-        self.blizzards = {}
-        for ci, vi in enumerate(self.field):
-            for cj, vj in enumerate(vi):
-                if vj not in (".", "#"):
-                    self.blizzards[(ci, cj)] = self.blizzard_directions[vj]
-                    self.field[ci][cj] = "."
-        self.start = (0, self.field[0].index("."))
-        self.end = (self.dimensions[0] - 1, self.field[-1].index("."))
+class ValleySim:
+    """
+    cells are numbered row by row, the reachable cells of every minute are a set of cell ids, the blizzards are placed
+    from their starting cells for the minute in question rather than moved step by step
+    """
+
+    def __init__(self, data: np.ndarray) -> None:
+        self.dimensions = data.shape
+        self.field = rows(data)
+        self.start = (0, self.field[0].index(b"."))
+        self.end = (self.dimensions[0] - 1, self.field[-1].index(b"."))
         self.steps = 0
-        self.positions = {self.start}
-
-    def move(self, pos: tuple) -> tuple:
-        x, y = pos
-        for m in self.moves:
-            if 0 <= x + m[0] < self.dimensions[0]:
-                if self.field[x + m[0]][y + m[1]] != "#":
-                    yield x + m[0], y + m[1]
-
-    def move_bliz(self, pos: tuple) -> tuple:
-        x, y = pos
-        dx, dy = self.blizzards[pos]
-        xx = (x + self.steps * dx - 1) % (self.dimensions[0] - 2) + 1
-        yy = (y + self.steps * dy - 1) % (self.dimensions[1] - 2) + 1
-        return xx, yy
+        self.position = self.start
+        columns = self.dimensions[1]
+        # the border is walled apart from start and end, so no move off the grid or across its edge reaches a free cell
+        self.free = set(np.flatnonzero(data.ravel() != WALL).tolist())
+        self.offsets = (-columns, columns, -1, 1, 0)
+        self.bx, self.by = np.nonzero(np.isin(data, np.frombuffer(bytes((RIGHT, LEFT, UP, DOWN)), dtype=np.uint8)))
+        kind = data[self.bx, self.by]
+        self.dx = np.where(kind == DOWN, 1, np.where(kind == UP, -1, 0))
+        self.dy = np.where(kind == RIGHT, 1, np.where(kind == LEFT, -1, 0))
+
+    def blocked(self, time: int) -> set:
+        """cells with a blizzard at the given time"""
+        height, columns = self.dimensions
+        x = (self.bx - 1 + time * self.dx) % (height - 2) + 1
+        y = (self.by - 1 + time * self.dy) % (columns - 2) + 1
+        return set((x * columns + y).tolist())
+
+    def advance(self, cells: set, time: int) -> set:
+        """cells free of walls and blizzards after moving or waiting"""
+        reached = {c + o for c in cells for o in self.offsets}
+        reached &= self.free
+        reached -= self.blocked(time)
+        return reached
 
     def run(self, goal: tuple) -> int:
-        self.steps += 1
-        nxt = set()
-        for p in self.positions:
-            nxt.update(set(self.move(p)))
-        blizzards = set()
-        for b in self.blizzards:
-            bliz = self.move_bliz(b)
-            blizzards.add(bliz)
-        nxt -= blizzards
-        if not nxt:
+        columns = self.dimensions[1]
+        source = self.position[0] * columns + self.position[1]
+        target = goal[0] * columns + goal[1]
+        search = timed_bfs(self.advance, [source], [target], self.steps)
+        if search.found is None:
             raise Exception("Reaching the goal is impossible")
-        if goal in nxt:
-            return self.steps
-        self.positions = nxt
-        return self.run(goal)
+        self.steps = search.distance
+        self.position = goal
+        return self.steps
 
     def get_snacks(self) -> int:
         self.run(self.end)
-        self.positions = {self.end}
+        return self.return_for_snacks()
+
+    def return_for_snacks(self) -> int:
+        """go back to the start and to the end again once the end has been reached"""
+        self.position = self.end
         self.run(self.start)
-        self.positions = {self.start}
         return self.run(self.end)
 
 
+def prepare(data: str) -> np.ndarray:
+    return parse(data)
+
+
 def part_a(data: str) -> int:
-    valley_data = parse(data)
-    valley_sim = ValleySim(valley_data)
+    valley_sim = ValleySim(prepare(data))
     return valley_sim.run(valley_sim.end)
 
 
 def part_b(data: str) -> int:
-    valley_data = parse(data)
-    valley_sim = ValleySim(valley_data)
+    valley_sim = ValleySim(prepare(data))
     return valley_sim.get_snacks()
 
 
+def solve(valley_data: np.ndarray) -> tuple:
+    # the first trip of part b is part a
+    valley_sim = ValleySim(valley_data)
+    there = valley_sim.run(valley_sim.end)
+    return there, valley_sim.return_for_snacks()
+
+
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=24)
+    data = puzzle_input(24)
     test = (
         """#.######\n"""
         """#>>.<^<#\n"""
@@ -99,8 +113,8 @@ if __name__ == "__main__":
 
     print("Part A")
     assert part_a(test) == 18
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
 
     print("Part B")
     assert part_b(test) == 54
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
@@ -4,40 +4,54 @@ AOC 2022 day 25
 """
 
 
-from aocd.models import Puzzle
-
-
-def parse(data: str) -> list:
-    return [[i for i in l] for l in data.strip().split("\n")]
-
-
-def solve(data: str) -> str:
-    snafu_to_vals = {
-        "2": 2,
-        "1": 1,
-        "0": 0,
-        "-": -1,
-        "=": -2,
-    }
-    vals_to_snafus = {v: k for k, v in snafu_to_vals.items()}
-    snafus = parse(data)
-    max_len = max(len(s) for s in snafus)
-    readable = [[snafu_to_vals[e] for e in s] for s in snafus]
-    snafu_sum = [0] * max_len
-    for r in readable:
-        for c, v in enumerate(r):
-            snafu_sum[c + max_len - len(r)] += v
-    res, over, over_mod = [], 0, 0
-    for i in range(max_len-1, -1, -1):
-        val = snafu_sum[i] + over
+from aoc.inputs import puzzle_input
+from aoc.lazy import lazy_import
+from aoc.parsing import NEWLINE
+from aoc.parsing import as_buffer
+
+np = lazy_import("numpy")
+
+# snafu digit per value from -2 to 2
+SNAFU_DIGITS = "=-012"
+
+
+def parse(data: str) -> list[int]:
+    """sums of the digit values per place over all snafu numbers, least significant place first"""
+    buf = as_buffer(data.strip())
+    values = np.zeros(256, dtype=np.int64)
+    values[list(SNAFU_DIGITS.encode())] = range(-2, 3)
+    newlines = np.flatnonzero(buf == NEWLINE)
+    positions = np.arange(len(buf))
+    # the place of a digit is its distance to the end of its line
+    places = np.append(newlines, len(buf))[np.searchsorted(newlines, positions)] - 1 - positions
+    digits = buf != NEWLINE
+    return np.bincount(places[digits], weights=values[buf[digits]]).astype(int).tolist()
+
+
+def snafu_total(place_sums: list) -> str:
+    res, over = [], 0
+    for place_sum in place_sums:
+        val = place_sum + over
         over = (val + 2) // 5
-        over_mod = (val + 2) % 5 - 2
-        res.insert(0, over_mod)
-    return "".join([vals_to_snafus[e] for e in res])
+        res.insert(0, (val + 2) % 5 - 2)
+    return "".join([SNAFU_DIGITS[e + 2] for e in res])
+
+
+def prepare(data: str) -> list:
+    return parse(data)
+
+
+def part_a(data: str) -> str:
+    return snafu_total(prepare(data))
+
+
+def solve(place_sums: list) -> tuple:
+    """day 25 has no second puzzle"""
+    return snafu_total(place_sums), None
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=25)
+    data = puzzle_input(25)
     test = (
         """1=-0-2\n"""
         """12111\n"""
@@ -55,5 +69,5 @@ if __name__ == "__main__":
     )
 
     print("Part A")
-    assert solve(test) == "2=-1=0"
-    print(solve(puzzle.input_data))
+    assert part_a(test) == "2=-1=0"
+    print(part_a(data))
@@ -2,7 +2,11 @@
 """AOC 2022 day X"""
 
 
-from aocd.models import Puzzle
+from aoc.inputs import puzzle_input
+
+
+def prepare(data):
+    raise NotImplementedError
 
 
 def part_a(data):
@@ -13,9 +17,13 @@ def part_b(data):
     raise NotImplementedError
 
 
+def solve(model) -> tuple:
+    raise NotImplementedError
+
+
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2022, day=0)
+    data = puzzle_input(0)
     print("Part A")
-    print(part_a(puzzle.input_data))
+    print(part_a(data))
     print("Part B")
-    print(part_b(puzzle.input_data))
+    print(part_b(data))
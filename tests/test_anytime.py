@@ -0,0 +1,118 @@
+import time
+
+import pytest
+
+from aoc.anytime import GRACE
+from aoc.anytime import Budget
+from aoc.anytime import Expired
+from aoc.anytime import Result
+from aoc.anytime import anytime
+from aoc.anytime import combine
+from aoc.anytime import hard_timeout
+from day_16 import day_16
+from day_19 import day_19
+
+VALVES = (
+    "Valve AA has flow rate=0; tunnels lead to valves DD, II, BB\n"
+    "Valve BB has flow rate=13; tunnels lead to valves CC, AA\n"
+    "Valve CC has flow rate=2; tunnels lead to valves DD, BB\n"
+    "Valve DD has flow rate=20; tunnels lead to valves CC, AA, EE\n"
+    "Valve EE has flow rate=3; tunnels lead to valves FF, DD\n"
+    "Valve FF has flow rate=0; tunnels lead to valves EE, GG\n"
+    "Valve GG has flow rate=0; tunnels lead to valves FF, HH\n"
+    "Valve HH has flow rate=22; tunnel leads to valve GG\n"
+    "Valve II has flow rate=0; tunnels lead to valves AA, JJ\n"
+    "Valve JJ has flow rate=21; tunnel leads to valve II\n"
+)
+BLUEPRINTS = (
+    "Blueprint 1: Each ore robot costs 4 ore. Each clay robot costs 2 ore. "
+    "Each obsidian robot costs 3 ore and 14 clay. Each geode robot costs 2 ore and 7 obsidian.\n"
+    "Blueprint 2: Each ore robot costs 2 ore. Each clay robot costs 3 ore. "
+    "Each obsidian robot costs 3 ore and 8 clay. Each geode robot costs 3 ore and 12 obsidian.\n"
+)
+# searching the example blueprints takes half a minute each, these crack geodes within 14 minutes already
+CHEAP_BLUEPRINTS = (
+    "Blueprint 1: Each ore robot costs 2 ore. Each clay robot costs 2 ore. "
+    "Each obsidian robot costs 2 ore and 3 clay. Each geode robot costs 2 ore and 3 obsidian.\n"
+    "Blueprint 2: Each ore robot costs 3 ore. Each clay robot costs 2 ore. "
+    "Each obsidian robot costs 2 ore and 4 clay. Each geode robot costs 2 ore and 2 obsidian.\n"
+)
+
+
+def count_down(n: int, budget: Budget) -> int:
+    for i in range(n):
+        budget.expand()
+        budget.improve(i)
+    return n
+
+
+def test_budget_without_deadline_never_expires():
+    budget = Budget(check_every=1)
+    assert count_down(1000, budget) == 1000
+    assert budget.result()[:4] == (999, True, 1000, 0)
+
+
+def test_budget_reads_the_clock_every_check_every_nodes():
+    budget = Budget(0, check_every=3)
+    budget.expand()
+    budget.expand()
+    with pytest.raises(Expired):
+        budget.expand()
+    assert budget.expired and budget.expanded == 3
+    budget.prune()
+    assert budget.result(7)[:4] == (7, False, 3, 1)
+
+
+def test_anytime_falls_back_to_the_best_value():
+    assert anytime(count_down, 10).value == 10
+    result = anytime(count_down, 10 ** 6, seconds=0)
+    # the clock is read at the 256th node, which expires before it is scored
+    assert not result.proven and (result.value, result.expanded) == (254, 256)
+
+
+def test_combine_and_hard_timeout():
+    results = [Result(3, True, 10, 2, 0.5), Result(4, False, 20, 5, 1.5)]
+    assert combine(results, 12) == (12, False, 30, 7, 1.5)
+    assert combine(results[:1], 3).proven
+    assert combine([], 1) == (1, True, 0, 0, 0.0)
+    assert hard_timeout(None) is None
+    assert hard_timeout(2) == 2 * (1 + GRACE) + 1
+
+
+def test_day_16_without_deadline():
+    for anytime_part, part in (day_16.part_a_anytime, day_16.part_a), (day_16.part_b_anytime, day_16.part_b):
+        result = anytime_part(VALVES)
+        assert result.value == part(VALVES) and result.proven
+        assert result.expanded > 0 and result.pruned > 0
+
+
+def test_day_16_expired_deadline():
+    result = day_16.part_b_anytime(VALVES, seconds=0)
+    assert not result.proven
+    assert 0 < result.value < 1707
+    assert result.expanded > 0 and result.pruned > 0
+
+
+def test_day_19_without_deadline():
+    a, b = day_19.part_a_anytime(CHEAP_BLUEPRINTS, 14), day_19.part_b_anytime(CHEAP_BLUEPRINTS, 14)
+    assert (a.value, b.value) == (day_19.part_a(CHEAP_BLUEPRINTS, 14), day_19.part_b(CHEAP_BLUEPRINTS, 14)) == (18, 36)
+    assert a.proven and b.proven
+
+
+def test_day_19_expired_deadline():
+    start = time.perf_counter()
+    result = day_19.part_a_anytime(BLUEPRINTS, seconds=0.05)
+    # far less than the half minute per blueprint a full search takes
+    assert time.perf_counter() - start < 5
+    assert not result.proven
+    assert 0 <= result.value <= 33
+    assert result.expanded > 0 and result.pruned > 0
+
+
+def test_run_pool_cancels_tasks_past_their_timeout():
+    start = time.perf_counter()
+    scheduled = day_19.run_pool(time.sleep, [0, 60], timeout=0.5)
+    assert time.perf_counter() - start < 10
+    assert scheduled[0].result() is None
+    with pytest.raises(TimeoutError):
+        scheduled[1].result()
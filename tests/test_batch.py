@@ -0,0 +1,34 @@
+import json
+
+from aoc.batch import read_inputs
+from aoc.batch import solve_batch
+
+
+def test_unreadable_entries_fail_on_their_own(tmp_path):
+    archive = tmp_path / "inputs.jsonl"
+    lines = [
+        json.dumps({"id": "ok", "input": "1000\n2000\n\n3000"}),
+        '{"id": "cut", "inp',
+        json.dumps({"id": "no input", "data": "1"}),
+        json.dumps([1, 2]),
+        json.dumps("4000\n\n5000"),
+    ]
+    archive.write_text("\n".join(lines) + "\n")
+    reports = list(solve_batch(1, read_inputs(str(archive)), workers=1, chunksize=2))
+    by_id = {}
+    for r in reports:
+        by_id.setdefault(r["id"], []).append(r)
+    assert list(by_id) == ["ok", "1", "no input", "3", "4"]
+    assert [r["result"] for r in by_id["ok"]] == [3000, 6000]
+    assert [r["result"] for r in by_id["4"]] == [5000, 9000]
+    assert by_id["1"][0]["error"].startswith("ValueError: invalid json")
+    for name in "no input", "3":
+        assert all(r["result"] is None and "input" in r["error"] for r in by_id[name])
+
+
+def test_undecodable_file(tmp_path):
+    (tmp_path / "a.txt").write_text("1\n\n2\n")
+    (tmp_path / "b.bin").write_bytes(b"\xff\xfe\x00")
+    inputs = list(read_inputs(str(tmp_path)))
+    assert inputs[0] == ("a.txt", "1\n\n2")
+    assert isinstance(inputs[1][1], UnicodeDecodeError)
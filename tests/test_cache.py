@@ -0,0 +1,53 @@
+import importlib.util
+import sys
+
+from aoc import cache
+from aoc import days
+from aoc.cache import MISSING
+from aoc.cache import AnswerCache
+from aoc.cache import source_hash
+
+
+def test_source_hash_covers_modules_used_indirectly(tmp_path, monkeypatch):
+    sources = {
+        "aoc.probe_leaf": "def helper():\n    return 1\n",
+        "aoc.probe_mid": "from aoc.probe_leaf import helper\n\n\ndef run():\n    return helper()\n",
+        "probe_day": "from aoc.probe_mid import run\n",
+    }
+    modules = {}
+    for name, source in sources.items():
+        path = tmp_path / f"{name.replace('.', '_')}.py"
+        path.write_text(source)
+        spec = importlib.util.spec_from_file_location(name, path)
+        modules[name] = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, name, modules[name])
+        spec.loader.exec_module(modules[name])
+    before = source_hash(modules["probe_day"])
+    assert source_hash(modules["probe_day"]) == before
+    # the day module only sees aoc.probe_mid, the edit is one level further down
+    (tmp_path / "aoc_probe_leaf.py").write_text("def helper():\n    return 2\n")
+    assert source_hash(modules["probe_day"]) != before
+
+
+def test_key_hashes_the_source_once_per_day(monkeypatch):
+    hashed = []
+    monkeypatch.setattr(cache, "source_hash", lambda module: hashed.append(module.__name__) or module.__name__)
+    cache.day_source_hash.cache_clear()
+    task = days.tasks(1)[0]
+    try:
+        keys = {AnswerCache.key(task, data) for data in ("1\n\n2", "1\n\n2", b"3")}
+    finally:
+        cache.day_source_hash.cache_clear()
+    assert len(keys) == 2
+    assert hashed == [days.module_name(1)]
+
+
+def test_answers_above_the_size_limit_are_not_stored(tmp_path):
+    store = AnswerCache(str(tmp_path / "answers.sqlite"), max_entries=2, max_result_bytes=100)
+    task = days.tasks(1)[0]
+    store.put("small", task, 1)
+    store.put("large", task, "x" * 200)
+    assert store.get("small") == 1 and store.get("large") is MISSING
+    for key in "a", "b":
+        store.put(key, task, key)
+    assert len(store) == 2 and store.get("small") is MISSING
@@ -0,0 +1,59 @@
+import random
+
+import numpy as np
+import pytest
+
+from aoc.coordset import CoordSet
+from aoc.coordset import DenseSet
+from aoc.coordset import contains
+from aoc.coordset import delta
+from aoc.coordset import pack
+from aoc.coordset import pack_array
+from aoc.coordset import unpack
+from aoc.coordset import unpack_array
+
+
+@pytest.mark.parametrize("dims", (2, 3))
+def test_pack_round_trip_and_shift(dims):
+    rng = random.Random(dims)
+    limit = 2 ** ({2: 31, 3: 21}[dims] - 1)
+    points = [tuple(rng.randrange(-limit // 2, limit // 2) for _ in range(dims)) for _ in range(200)]
+    points += [(-limit,) * dims, (limit - 1,) * dims, (0,) * dims]
+    keys = [pack(*p) for p in points]
+    assert [unpack(k, dims) for k in keys] == points
+    assert pack_array(np.array(points)).tolist() == keys
+    assert [tuple(p) for p in unpack_array(np.array(keys), dims).tolist()] == points
+    shift = tuple(rng.randint(-1000, 1000) for _ in range(dims))
+    for p in points[:200]:
+        assert pack(*p) + delta(*shift) == pack(*(a + b for a, b in zip(p, shift)))
+
+
+def test_contains():
+    keys = np.sort(pack_array(np.array([[0, 0], [5, -3], [-7, 2]])))
+    queries = pack_array(np.array([[5, -3], [1, 1], [-7, 2], [10 ** 6, 0]]))
+    assert contains(keys, queries).tolist() == [True, False, True, False]
+    assert contains(np.zeros(0, dtype=np.int64), queries).tolist() == [False] * 4
+
+
+def test_coordset():
+    points = CoordSet([(1, 2), (-3, 4)])
+    points.add((0, 0))
+    points.discard((1, 2))
+    points.update(np.array([[7, 7], [0, 0]]))
+    assert sorted(points) == [(-3, 4), (0, 0), (7, 7)]
+    assert (0, 0) in points and (1, 2) not in points and len(points) == 3
+    assert sorted(points.shifted(1, -1)) == [(-2, 3), (1, -1), (8, 6)]
+    assert points.contains(np.array([[7, 7], [7, 8]])).tolist() == [True, False]
+    cubes = CoordSet([(1, 2, 3)], dims=3)
+    assert list(cubes.shifted(0, 0, -4)) == [(1, 2, -1)]
+
+
+def test_denseset():
+    tower = DenseSet(7, [(3, 0)])
+    assert tower.array().tolist() == [[0, 0, 0, 1, 0, 0, 0]]
+    for p in (3, 0), (0, 5), (6, 2):
+        tower.add(p)
+    assert len(tower) == 3
+    assert sorted(tower) == [(0, 5), (3, 0), (6, 2)]
+    assert (6, 2) in tower and (7, 2) not in tower and (0, -1) not in tower and (0, 100) not in tower
+    assert tower.array().shape[1] == 7 and tower.array()[5].tolist() == [1, 0, 0, 0, 0, 0, 0]
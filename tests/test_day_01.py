@@ -0,0 +1,66 @@
+import io
+
+import pytest
+
+from day_01 import day_01
+from day_01.day_01 import TopCalories
+from day_01.day_01 import calories_numpy
+from day_01.day_01 import stream_calories
+
+EXAMPLE = "1000\n2000\n3000\n\n4000\n\n5000\n6000\n\n7000\n8000\n9000\n\n10000"
+
+
+def engines(data: str, num_elves: int) -> dict:
+    return {
+        "solve": day_01.solve(day_01.prepare(data), num_elves),
+        "numpy": calories_numpy(data, num_elves),
+        "stream": stream_calories(io.BytesIO(data.encode()), num_elves),
+    }
+
+
+def test_example():
+    assert set(engines(EXAMPLE, 3).values()) == {(24000, 45000)}
+    assert set(engines(EXAMPLE, 10).values()) == {(24000, 55000)}
+
+
+@pytest.mark.parametrize("chunk_size", range(1, len(EXAMPLE) + 2))
+def test_stream_carries_elves_across_any_chunk_boundary(chunk_size):
+    # a chunk may end inside a number, between the items of an elf or right on the blank line
+    for data in EXAMPLE, EXAMPLE + "\n", EXAMPLE + "\n\n":
+        assert stream_calories(io.BytesIO(data.encode()), 3, chunk_size) == (24000, 45000)
+
+
+def test_stream_reads_a_path(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text(EXAMPLE + "\n")
+    assert stream_calories(str(path), 2, chunk_size=5) == (24000, 35000)
+
+
+def test_top_calories_keeps_only_the_largest():
+    top = TopCalories(2)
+    top.push([5, 1, 9, 3, 9])
+    assert sorted(top.heap) == [9, 9]
+    assert top.result() == (9, 18)
+
+
+def test_empty_inventory():
+    for data in "", "\n", "\n\n":
+        assert set(engines(data, 3).values()) == {(0, 0)}
+    assert TopCalories(3).result() == (0, 0)
+
+
+def test_no_elves_to_sum():
+    with pytest.raises(ValueError, match="num_elves"):
+        calories_numpy(EXAMPLE, 0)
+    with pytest.raises(ValueError, match="num_elves"):
+        stream_calories(io.BytesIO(EXAMPLE.encode()), 0)
+    with pytest.raises(ValueError, match="num_elves"):
+        day_01.part_b(EXAMPLE, 0)
+
+
+def test_malformed_inventory():
+    for data in "1000\nabc\n", "1000\n-5\n":
+        with pytest.raises(ValueError, match="unexpected"):
+            calories_numpy(data)
+        with pytest.raises(ValueError, match="unexpected"):
+            stream_calories(io.BytesIO(data.encode()))
@@ -0,0 +1,29 @@
+import numpy as np
+
+from day_03 import day_03
+
+EXAMPLE = """vJrwpWtwJgWrhcsFMMfFFhFp
+jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL
+PmmdzqPrVvPwwTWBwg
+wMqvLMZHhHMvwLHjbvcjnnSBnvTQFn
+ttgJtRGJQctTZtZT
+CrZsJsPPZsGzwwsLwLmpwMDw
+"""
+
+
+def test_example():
+    assert day_03.solve(day_03.prepare(EXAMPLE)) == (157, 70)
+
+
+def test_priorities_are_exact_bit_indices():
+    masks = np.array([1 << k for k in range(52)], dtype=np.int64)
+    assert day_03.priorities(masks).tolist() == list(range(1, 53))
+    # no common item counts nothing, several count the lowest
+    assert day_03.priorities(np.array([0, 0b1100], dtype=np.int64)).tolist() == [0, 3]
+
+
+def test_masks_of_every_item():
+    first, second = day_03.item_masks("aZ\nZa")
+    assert (first & second).tolist() == [0, 0]
+    assert (first | second).tolist() == [1 | 1 << 51] * 2
+    assert day_03.solve(day_03.prepare("")) == (0, 0)
@@ -0,0 +1,56 @@
+import io
+import itertools
+
+import numpy as np
+import pytest
+
+from day_04.day_04 import overlap_indices
+from day_04.day_04 import overlapping
+from day_04.day_04 import prepare
+from day_04.day_04 import solve
+from day_04.day_04 import stream_counts
+from day_04.day_04 import subsumed
+
+EXAMPLE = "2-4,6-8\n2-3,4-5\n5-7,7-9\n2-8,3-7\n6-6,4-6\n2-6,4-8"
+
+
+def test_example():
+    assert solve(prepare(EXAMPLE)) == (2, 4)
+    assert overlap_indices(prepare(EXAMPLE)).tolist() == [2, 3, 4, 5]
+    assert overlap_indices(prepare(EXAMPLE), contained=True).tolist() == [3, 4]
+
+
+def test_all_pairs_of_small_ranges():
+    ranges = [(lo, hi) for lo in range(1, 6) for hi in range(lo, 6)]
+    pairs = np.array([a + b for a, b in itertools.product(ranges, repeat=2)])
+    sections = [(set(range(l1, u1 + 1)), set(range(l2, u2 + 1))) for l1, u1, l2, u2 in pairs.tolist()]
+    assert subsumed(pairs).tolist() == [a <= b or b <= a for a, b in sections]
+    assert overlapping(pairs).tolist() == [bool(a & b) for a, b in sections]
+
+
+def test_multi_digit_sections():
+    # the dash is a separator, so 10-99 is no negative number
+    assert prepare("10-99,99-100").tolist() == [[10, 99, 99, 100]]
+    assert solve(prepare("10-99,99-100")) == (0, 1)
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 12))
+def test_stream_counts_across_chunk_boundaries(chunk_size):
+    for data in EXAMPLE, EXAMPLE + "\n":
+        assert stream_counts(io.BytesIO(data.encode()), chunk_size) == (2, 4)
+
+
+def test_empty_input():
+    assert solve(prepare("")) == (0, 0)
+    assert stream_counts(io.BytesIO(b"")) == (0, 0)
+
+
+def test_malformed_input():
+    for data in "garbage", "2-4;6-8", "2-4 6-8":
+        with pytest.raises(ValueError, match="unexpected"):
+            prepare(data)
+    for data in "2-4,6-8\n2-3,4", "2-4,6-":
+        with pytest.raises(ValueError, match="records of 4 fields"):
+            prepare(data)
+    with pytest.raises(ValueError):
+        stream_counts(io.BytesIO(b"2-4,6-8\ngarbage\n"), chunk_size=4)
@@ -0,0 +1,73 @@
+import io
+import os
+
+from day_06.day_06 import MarkerScanner
+from day_06.day_06 import markers
+from day_06.day_06 import scan
+
+
+def first_marker(data: bytes, ln: int) -> int | None:
+    return next((i for i in range(ln, len(data) + 1) if len(set(data[i - ln:i])) == ln), None)
+
+
+def test_examples():
+    examples = {
+        "mjqjpqmgbljsrphdztnvjfqwrcgsmlb": (7, 19),
+        "bvwbjplbgvbhsrlpgdmjqwftvncz": (5, 23),
+        "nppdvjthqldpwncqszvftbrmjlhg": (6, 23),
+        "nznrnfrfntjfmvfwmzdfjlvtqnbhcprsg": (10, 29),
+        "zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw": (11, 26),
+    }
+    for data, (a, b) in examples.items():
+        assert markers(data) == {4: a, 14: b}
+
+
+def test_marker_in_the_last_window():
+    assert markers("aabcd", (4,)) == {4: 5}
+    assert markers("abcdefghijklmn", (14,)) == {14: 14}
+
+
+def test_no_marker():
+    assert markers("", (4, 14)) == {4: None, 14: None}
+    assert markers("abc", (4,)) == {4: None}
+    assert markers("aaaa", (1, 2)) == {1: 1, 2: None}
+
+
+def test_every_split_of_the_stream():
+    data = b"abacabadabacabaeabacabadabacabafghijklmnopq"
+    expected = {ln: first_marker(data, ln) for ln in (2, 4, 6, 14)}
+    assert expected[14] is not None
+    for cut in range(len(data) + 1):
+        scanner = MarkerScanner((2, 4, 6, 14))
+        scanner.feed(data[:cut])
+        scanner.feed(data[cut:])
+        assert scanner.found == expected
+
+
+def test_lengths_in_any_order_and_repeated():
+    data = "abcabcdabcdefg"
+    expected = {ln: first_marker(data.encode(), ln) for ln in (7, 3, 4)}
+    assert markers(data, (7, 3, 3, 4)) == expected == {7: 14, 3: 3, 4: 7}
+
+
+def test_scanner_keeps_state_across_chunks():
+    scanner = MarkerScanner((3, 5))
+    assert not scanner.feed(b"aab")
+    assert not scanner.feed(b"c")
+    assert scanner.found == {3: 4, 5: None}
+    assert scanner.feed(b"de")
+    assert scanner.found == {3: 4, 5: 6}
+    # further chunks are ignored once every marker is known
+    assert scanner.feed(b"aaaa") and scanner.found == {3: 4, 5: 6}
+
+
+def test_scan_stops_reading_once_all_markers_are_found(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"abcd" + b"x" * 100)
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        assert scan(fd, (2, 4), chunk_size=3) == {2: 2, 4: 4}
+        assert os.lseek(fd, 0, os.SEEK_CUR) == 6
+    finally:
+        os.close(fd)
+    assert scan(io.BytesIO(b""), (4,)) == {4: None}
@@ -0,0 +1,20 @@
+from aoc.inputs import read_text
+from day_09 import day_09
+
+
+def test_examples():
+    moves = day_09.prepare(read_text(9, "test.txt"))
+    assert day_09.solve(moves) == (13, 1)
+    assert day_09.rope_positions(day_09.prepare("R 5\nU 8\nL 8\nD 3\nR 17\nD 10\nL 25\nU 20\n")) == 36
+
+
+def test_follow_trail_keeps_only_moves():
+    # the knot stays put until the head is two steps away, then trails it by one
+    assert day_09.follow_trail([0, 1, 2, 3], [0, 0, 0, 0]) == ([0, 1, 2], [0, 0, 0])
+    # diagonal catch-up when the head leaves both row and column
+    assert day_09.follow_trail([0, 1, 1], [0, 0, 1]) == ([0], [0])
+    assert day_09.follow_trail([0, 1, 2], [0, 1, 1]) == ([0, 1], [0, 1])
+
+
+def test_no_moves():
+    assert day_09.solve(day_09.prepare("")) == (1, 1)
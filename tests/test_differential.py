@@ -0,0 +1,18 @@
+from aoc import differential
+
+
+def test_engines_match_the_frozen_reference():
+    rows = differential.compare(5, factors=(1,), seeds=2)
+    assert [r["engine"] for r in rows] == ["parts", "joint", "trace"]
+    assert all(r["error"] is None and not r["mismatches"] for r in rows)
+
+
+def test_failing_generator_gives_an_error_row(monkeypatch):
+    def _broken(day: int, size: int, seed: int) -> str:
+        raise ZeroDivisionError("integer division or modulo by zero")
+
+    monkeypatch.setattr(differential, "generate", _broken)
+    rows = differential.compare(2, factors=(1, 2), seeds=1)
+    assert [(r["engine"], r["size"]) for r in rows] == [("reference", 10000), ("reference", 20000)]
+    assert rows[0]["error"].startswith("ZeroDivisionError")
+    assert "ZeroDivisionError" in differential.format_row(rows[0])
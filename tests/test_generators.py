@@ -0,0 +1,45 @@
+import operator
+
+import pytest
+
+from aoc import days
+from aoc.generators import generate
+from aoc.scaling import BASE_SIZES
+
+OPERATIONS = {"+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.floordiv}
+
+
+def evaluate(jobs: dict, humn: int) -> tuple[int, str, int]:
+    """operands and operation of root with humn shouting the given number"""
+
+    def _value(name: str) -> int:
+        if name == "humn":
+            return humn
+        job = jobs[name].split()
+        return int(job[0]) if len(job) == 1 else OPERATIONS[job[1]](_value(job[0]), _value(job[2]))
+
+    first, symbol, second = jobs["root"].split()
+    return _value(first), symbol, _value(second)
+
+
+@pytest.mark.parametrize("size", (10, 400, 800))
+def test_math_monkeys_are_solvable(size):
+    for seed in range(12):
+        data = generate(21, size, seed)
+        jobs = dict(line.split(": ") for line in data.splitlines())
+        root, shouted = days.solve(21, data)
+        first, symbol, second = evaluate(jobs, int(jobs["humn"]))
+        assert root == OPERATIONS[symbol](first, second)
+        first, _, second = evaluate(jobs, shouted)
+        assert first == second
+
+
+def test_mixing_changes_the_grove_coordinates():
+    for factor in 1, 2, 4, 8:
+        data = generate(20, BASE_SIZES[20] * factor)
+        values = [int(v) for v in data.split()]
+        start = values.index(0)
+        unmixed = sum(values[(start + i) % len(values)] for i in (1000, 2000, 3000))
+        answers = days.solve(20, data)
+        assert 0 not in answers
+        assert answers[0] != unmixed
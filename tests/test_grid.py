@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from aoc.grid import find
+from aoc.grid import load_grid
+from aoc.grid import rows
+from aoc.grid import to_text
+
+
+def expected(lines: list[str], pad: int = 0, fill: str = " ") -> np.ndarray:
+    width = max(len(line) for line in lines) + 2 * pad
+    lines = [fill * width] * pad + [fill * pad + line.ljust(width - 2 * pad, fill) + fill * pad for line in lines]
+    return np.array([[ord(c) for c in line] for line in lines + [fill * width] * pad], dtype=np.uint8)
+
+
+def test_rectangular_grid_is_a_view_on_the_input():
+    data = b"abc\ndef\nghi\n"
+    grid = load_grid(data)
+    assert grid.tolist() == expected(["abc", "def", "ghi"]).tolist()
+    # the row stride steps over the newlines instead of copying the rows
+    assert grid.strides == (4, 1)
+    assert not grid.flags.owndata and not grid.flags.writeable
+
+
+@pytest.mark.parametrize("lines", (["ab", "cdef", "g"], ["abcd", "", "ef"], ["a", "bc", "def", "ghij"],
+                                   ["abc", "d", "efg"], ["ab", "c", "de", "f"]))
+def test_ragged_lines_are_filled(lines):
+    data = "\n".join(lines)
+    assert load_grid(data, fill=b".").tolist() == expected(lines, fill=".").tolist()
+    assert load_grid(data, pad=2, fill=b" ").tolist() == expected(lines, pad=2).tolist()
+
+
+def test_padding_and_single_line():
+    assert load_grid("\nabc\n", pad=1, fill=b"#").tolist() == expected(["abc"], pad=1, fill="#").tolist()
+    assert load_grid("abc").shape == (1, 3)
+
+
+def test_empty_input_has_no_rows():
+    for data in "", "\n\n", b"":
+        grid = load_grid(data)
+        assert grid.shape == (0, 0)
+        assert rows(grid) == [] and to_text(grid) == "" and find(grid, "#") == []
+    assert load_grid("", pad=1, fill=b"#").tolist() == [[ord("#")] * 2] * 2
+
+
+def test_find_rows_and_text():
+    grid = load_grid("S.#\n.#E\n")
+    assert find(grid, "#") == [(0, 2), (1, 1)]
+    assert rows(grid) == [b"S.#", b".#E"]
+    mutable = rows(grid, mutable=True)
+    mutable[0][0] = ord("a")
+    assert to_text(grid) == "S.#\n.#E"
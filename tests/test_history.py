@@ -0,0 +1,24 @@
+from aoc.history import compare
+
+
+def timing(median: float, stdev: float = 0.0) -> dict:
+    return {"median": median, "min": median, "stdev": stdev, "repeats": 5}
+
+
+def test_slowdowns_beyond_threshold_and_noise():
+    baseline = {"1a": timing(1.0), "1b": timing(1.0), "2a": timing(1.0, 0.1)}
+    current = {"1a": timing(1.05), "1b": timing(1.2), "2a": timing(1.2, 0.1)}
+    rows = {r["part"]: r for r in compare(baseline, current, threshold=10)}
+    assert [rows[p]["regression"] for p in ("1a", "1b", "2a")] == [False, True, False]
+    assert rows["1b"]["status"] == "slower"
+
+
+def test_failing_and_missing_parts_are_regressions():
+    baseline = {"1a": timing(1.0), "1b": timing(1.0), "2a": {"error": "ValueError: bad"}}
+    current = {"1a": {"error": "IndexError: list index out of range"}, "2a": timing(1.0), "3a": timing(1.0)}
+    rows = {r["part"]: r for r in compare(baseline, current)}
+    # a part that failed in the baseline or is new has nothing to be compared with
+    assert set(rows) == {"1a", "1b"}
+    assert rows["1a"]["regression"] and rows["1a"]["status"] == "now failing"
+    assert rows["1a"]["error"].startswith("IndexError")
+    assert rows["1b"]["regression"] and rows["1b"]["status"] == "no longer measured"
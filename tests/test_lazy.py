@@ -0,0 +1,21 @@
+import subprocess
+import sys
+
+from aoc import days
+from aoc.inputs import ROOT
+from aoc.lazy import dependencies
+
+
+def test_dependencies_follow_the_shared_modules():
+    names = {m.__name__ for m in dependencies(days.load(9))}
+    # numpy is only reached via aoc.parsing and aoc.coordset, which in turn use aoc.lazy
+    assert {"day_09.day_09", "aoc.parsing", "aoc.coordset", "aoc.lazy"} <= names
+    assert not any(n.startswith("numpy") for n in names)
+
+
+def test_preload_imports_indirect_heavy_dependencies():
+    # a fresh interpreter, numpy is imported by the other tests already
+    code = ("import sys; from aoc import days; from aoc.lazy import preload; m = days.load(9); "
+            "before = 'numpy' in sys.modules; preload(m); print(before, 'numpy' in sys.modules)")
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    assert out.split() == ["False", "True"]
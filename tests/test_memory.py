@@ -0,0 +1,21 @@
+import tracemalloc
+
+from aoc.memory import MemoryTracker
+
+
+def test_trivial_phase_reports_no_memory_with_sites():
+    tracker = MemoryTracker(sites=5)
+    tracemalloc.start()
+    try:
+        # traced objects that are alive during the phases make the snapshots large
+        live = [object() for _ in range(50000)]
+        with tracker.phase("outer"):
+            with tracker.phase("inner"):
+                kept = bytearray(1024)
+    finally:
+        tracemalloc.stop()
+    for path in "outer", "outer/inner":
+        assert tracker.phases[path]["peak"] < 64 * 2 ** 10
+        assert tracker.phases[path]["retained"] < 64 * 2 ** 10
+    assert tracker.phases["outer/inner"]["retained"] >= 1024
+    assert live and kept
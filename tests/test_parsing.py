@@ -0,0 +1,70 @@
+import io
+import re
+
+import pytest
+
+from aoc.parsing import blocks
+from aoc.parsing import chunks
+from aoc.parsing import integers
+from aoc.parsing import records
+from aoc.parsing import stream_integers
+from aoc.parsing import stream_records
+
+TEXT = "-3 at x=12, y=-4567\n0 -> 1234567890123\n7-9,88\n"
+
+
+def test_integers():
+    assert integers(TEXT).tolist() == [int(v) for v in re.findall(r"-?\d+", TEXT)]
+    assert integers(TEXT, signed=False).tolist() == [int(v) for v in re.findall(r"\d+", TEXT)]
+    assert integers(b"5").tolist() == [5]
+    assert integers("no numbers").tolist() == []
+    with pytest.raises(ValueError):
+        integers("1234567890123456789")
+
+
+def test_records():
+    assert records("Sensor at x=2, y=18: beacon at x=-2, y=15\n1,2,3,4", 4).tolist() == [[2, 18, -2, 15], [1, 2, 3, 4]]
+    with pytest.raises(ValueError):
+        records("1 2 3", 2)
+
+
+def test_blocks():
+    found, block = blocks("1000\n2000\n\n4000\n\n5000\n6000\n\n10000")
+    assert found.tolist() == [1000, 2000, 4000, 5000, 6000, 10000]
+    assert block.tolist() == [0, 0, 1, 2, 2, 3]
+
+
+@pytest.mark.parametrize("chunk_size", (1, 3, 7, 64))
+def test_chunks_end_at_line_boundaries(chunk_size):
+    data = b"2-4,6-8\n2-3,4-5\n\n5-7,7-9\n12-88,13-99"
+    pieces = list(chunks(io.BytesIO(data), chunk_size))
+    assert b"".join(pieces) == data
+    assert all(p.endswith(b"\n") for p in pieces[:-1])
+
+
+@pytest.mark.parametrize("chunk_size", (1, 5, 11, 1024))
+def test_streams_match_the_whole_input(chunk_size, tmp_path):
+    data = b"".join(b"%d,%d -> %d,%d\n" % (i, -i * 37, i * 1001, 7) for i in range(50))
+    path = tmp_path / "input.txt"
+    path.write_bytes(data)
+    streamed = [r.tolist() for c in stream_records(str(path), 4, chunk_size=chunk_size) for r in c]
+    assert streamed == records(data, 4).tolist()
+    streamed = [v for c in stream_integers(io.BytesIO(data), chunk_size=chunk_size) for v in c.tolist()]
+    assert streamed == integers(data).tolist()
+
+
+def test_separators_reject_other_bytes():
+    assert records("2-4,6-8\n", 4, signed=False, separators=b"-,\n").tolist() == [[2, 4, 6, 8]]
+    with pytest.raises(ValueError, match="b'g' at offset 0"):
+        records("garbage", 4, signed=False, separators=b"-,\n")
+    with pytest.raises(ValueError, match="b'-' at offset 5"):
+        blocks("1000\n-2000", signed=False, separators=b"\n")
+    assert integers("x=-5", separators=b"x=").tolist() == [-5]
+    # no separators accept every byte as before
+    assert integers("garbage").tolist() == []
+
+
+def test_chunks_of_lines_longer_than_the_chunk_size():
+    line = b"7," * 5000 + b"7\n"
+    pieces = list(chunks(io.BytesIO(line * 3 + b"1,2"), chunk_size=16))
+    assert pieces == [line] * 3 + [b"1,2"]
@@ -0,0 +1,18 @@
+import time
+
+from aoc.profiling import Profiler
+
+
+def test_self_wall_of_nested_phases():
+    profiler = Profiler()
+    with profiler.phase("part_a"):
+        time.sleep(0.02)
+        with profiler.phase("parse"):
+            time.sleep(0.02)
+            with profiler.phase("split"):
+                time.sleep(0.02)
+    phases = profiler.phases
+    for path in "part_a", "part_a/parse", "part_a/parse/split":
+        assert 0.015 < phases[path]["self_wall"] < 0.05
+    total = sum(p["self_wall"] for p in phases.values())
+    assert abs(total - phases["part_a"]["wall"]) < 1e-6
@@ -0,0 +1,74 @@
+import random
+
+from aoc.search import UNREACHED
+from aoc.search import astar
+from aoc.search import bfs
+from aoc.search import dijkstra
+from aoc.search import timed_bfs
+
+
+def line(size: int):
+    return lambda node: [n for n in (node - 1, node + 1) if 0 <= n < size]
+
+
+def bellman_ford(edges: dict, sources: list, size: int) -> list:
+    distances = [None] * size
+    for s in sources:
+        distances[s] = 0
+    for _ in range(size):
+        for node, out in edges.items():
+            for nxt, cost in out:
+                if distances[node] is not None and (distances[nxt] is None or distances[node] + cost < distances[nxt]):
+                    distances[nxt] = distances[node] + cost
+    return [UNREACHED if d is None else d for d in distances]
+
+
+def test_bfs_from_several_sources():
+    search = bfs(line(10), [0, 9], 10)
+    assert search.distances == [0, 1, 2, 3, 4, 4, 3, 2, 1, 0]
+    assert search.found is None and search.stats.expanded == 10
+    search = bfs(line(10), [2], 10, (7).__eq__)
+    assert (search.found, search.distance) == (7, 5)
+    assert bfs(line(10), [2], 12, (11).__eq__).found is None
+
+
+def test_timed_bfs_waits_for_a_gate():
+    # node 3 can only be entered at depths divisible by 4, waiting in place is allowed
+    def _advance(layer: set, depth: int) -> set:
+        return {n for node in layer for n in (node, node + 1) if n < 6 and (n != 3 or depth % 4 == 0)}
+
+    search = timed_bfs(_advance, [0], [5])
+    assert (search.found, search.distance) == (5, 6)
+    assert timed_bfs(_advance, [0], [5], depth=1).distance == 6
+    # waiting keeps every node of the layer, so the layers never hold more than the six nodes
+    assert search.stats.peak_frontier <= 6
+    assert timed_bfs(lambda layer, depth: set(), [0], [5]).found is None
+
+
+def test_dijkstra_matches_bellman_ford():
+    for seed in range(20):
+        rng = random.Random(seed)
+        size = rng.randint(2, 30)
+        edges = {n: [(rng.randrange(size), rng.randint(0, 9)) for _ in range(rng.randint(0, 4))] for n in range(size)}
+        search = dijkstra(edges.__getitem__, [0], size)
+        assert search.distances == bellman_ford(edges, [0], size)
+        goal = rng.randrange(size)
+        search = dijkstra(edges.__getitem__, [0], size, goal.__eq__)
+        assert search.distance == (None if search.found is None else bellman_ford(edges, [0], size)[goal])
+
+
+def test_astar_finds_the_shortest_path_with_fewer_expansions():
+    rng = random.Random(3)
+    width = 20
+    costs = [rng.randint(1, 5) for _ in range(width * width)]
+
+    def _neighbours(node: int) -> list:
+        r, c = divmod(node, width)
+        steps = ((r + dr, c + dc) for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0)))
+        return [(y * width + x, costs[y * width + x]) for y, x in steps if 0 <= y < width and 0 <= x < width]
+
+    goal = width * width - 1
+    plain = dijkstra(_neighbours, [0], width * width, goal.__eq__)
+    guided = astar(_neighbours, [0], width * width, goal.__eq__, lambda n: 2 * (width - 1) - sum(divmod(n, width)))
+    assert guided.distance == plain.distance
+    assert guided.stats.expanded <= plain.stats.expanded